@@ -0,0 +1,83 @@
+"""Compare writing descriptions inline with the deduplicated description store.
+
+Generates ``--listings`` rows whose descriptions are drawn from ``--distinct``
+texts (recruiters repost the same text across cities and listings) and writes
+them to ``--format`` twice: with ``job_description`` inline, and with the text
+in a ``DescriptionStore`` and only ``description_hash`` in the rows. Reports
+write time and bytes on disk of each variant. Run from the repository root::
+
+    python -m benchmarks.bench_description_store --listings 50000 --distinct 5000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from glassdoorcrawler.descriptions import DescriptionStore, replace_description
+from glassdoorcrawler.sinks import open_sink
+
+from .bench_record_memory import make_rows
+
+
+def make_listings(listings: int, distinct: int, description_bytes: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    templates = make_rows(distinct, description_bytes, seed=seed)
+    return [{**rng.choice(templates), "job_title": f"Vaga {index}"} for index in range(listings)]
+
+
+def _size(*paths: str) -> int:
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+
+def write_inline(rows: List[Dict[str, Any]], path: str, batch_size: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    with open_sink(path, batch_size=batch_size) as sink:
+        for row in rows:
+            sink.write(row)
+    return {"seconds": time.perf_counter() - started, "bytes": _size(path)}
+
+
+def write_with_store(
+    rows: List[Dict[str, Any]], path: str, store_path: str, batch_size: int, codec: str
+) -> Dict[str, float]:
+    started = time.perf_counter()
+    store = DescriptionStore(store_path, codec=codec)
+    with open_sink(path, batch_size=batch_size) as sink:
+        for index, row in enumerate(rows):
+            sink.write(replace_description(row, store.put(str(index), row["job_description"])))
+    store.close()
+    return {"seconds": time.perf_counter() - started, "bytes": _size(path, store_path, store_path + "-wal")}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listings", type=int, default=50_000, help="Rows written")
+    parser.add_argument("--distinct", type=int, default=5_000, help="Distinct description texts among them")
+    parser.add_argument("--description-bytes", type=int, default=3000, help="Approximate description length")
+    parser.add_argument("--format", choices=("jsonl", "csv", "parquet"), default="jsonl", help="Output format")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per sink flush")
+    parser.add_argument("--codec", choices=("zlib", "zstd"), default="zlib", help="Description store codec")
+    args = parser.parse_args()
+
+    rows = make_listings(args.listings, args.distinct, args.description_bytes)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        inline = write_inline(rows, os.path.join(tmp_dir, f"inline.{args.format}"), args.batch_size)
+        stored = write_with_store(
+            rows,
+            os.path.join(tmp_dir, f"hashed.{args.format}"),
+            os.path.join(tmp_dir, "descriptions.sqlite"),
+            args.batch_size,
+            args.codec,
+        )
+
+    print(f"{'variant':24} {'seconds':>9} {'MiB':>9}")
+    print(f"{'inline':24} {inline['seconds']:9.2f} {inline['bytes'] / 1048576:9.1f}")
+    print(f"{'store (' + args.codec + ')':24} {stored['seconds']:9.2f} {stored['bytes'] / 1048576:9.1f}")
+    print(f"size: {inline['bytes'] / stored['bytes']:.1f}x smaller, time: {inline['seconds'] / stored['seconds']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
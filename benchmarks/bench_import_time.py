@@ -0,0 +1,75 @@
+"""Measure the startup cost of the package entry points.
+
+Each target is imported ``--repeat`` times in a fresh interpreter with ``-X
+importtime``; the median cumulative import time of the target module is
+reported together with the heavy optional modules the import pulled in. Run from
+the repository root::
+
+    python -m benchmarks.bench_import_time --repeat 7
+
+Exits with status 1 when an entry point loads one of ``HEAVY_MODULES`` or takes
+longer than ``--max-ms``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+# Modules that must only load on the code paths that use them.
+HEAVY_MODULES = ("numpy", "pandas", "bs4", "progressbar", "curl_cffi", "pyarrow", "openpyxl", "multiprocessing")
+
+# Entry point -> heavy modules it is allowed to load.
+TARGETS: Dict[str, Tuple[str, ...]] = {
+    "glassdoorcrawler": (),
+    "glassdoorcrawler.cli": (),
+    "glassdoorcrawler.scraper": (),
+    "glassdoorcrawler.sinks": (),
+}
+
+
+def loaded_heavy_modules(module: str) -> Set[str]:
+    """Heavy top-level modules present in ``sys.modules`` after importing ``module``."""
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(sorted({{name.partition('.')[0] for name in sys.modules}} & set({HEAVY_MODULES!r}))))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+def import_time_us(module: str) -> int:
+    """Cumulative ``-X importtime`` microseconds of ``module`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+            return int(line.split("|")[1])
+    return 0  # already imported by the interpreter itself
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target; the median is reported")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail when a target takes longer than this")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'module':28} {'median':>9}  heavy modules loaded")
+    for module, allowed in TARGETS.items():
+        median_ms = statistics.median(import_time_us(module) for _ in range(args.repeat)) / 1000
+        unexpected = loaded_heavy_modules(module) - set(allowed)
+        too_slow = args.max_ms is not None and median_ms > args.max_ms
+        failed = failed or bool(unexpected) or too_slow
+        flag = "  SLOW" if too_slow else ""
+        print(f"{module:28} {median_ms:7.1f}ms  {', '.join(sorted(unexpected)) or '-'}{flag}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Compare the full-tree and fast-path job page parsers on the synthetic fixture pages.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_job_page_parse --repeat 50
+"""
+
+import argparse
+import os
+import time
+from typing import Callable, Dict, List
+
+from glassdoorcrawler import scraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+JOB_PAGE_FIXTURES = ("job_page_initial_state.html", "job_page_jsonld.html")
+
+
+def load_job_pages() -> Dict[str, str]:
+    pages: Dict[str, str] = {}
+    for name in JOB_PAGE_FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as handle:
+            pages[name] = handle.read()
+    return pages
+
+
+def _best_of(parse: Callable[[str], Dict], html: str, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(html)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per page; the best time is reported")
+    args = parser.parse_args()
+
+    print(f"{'page':32} {'full tree':>12} {'fast path':>12} {'speedup':>9}")
+    for name, html in load_job_pages().items():
+        if scraper._parse_job_page(html) != scraper._parse_job_page_fast(html):
+            raise SystemExit(f"{name}: fast path record differs from the reference parser")
+        reference = _best_of(scraper._parse_job_page, html, args.repeat)
+        fast = _best_of(scraper._parse_job_page_fast, html, args.repeat)
+        print(f"{name:32} {reference * 1000:10.2f}ms {fast * 1000:10.2f}ms {reference / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
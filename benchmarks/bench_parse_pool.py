@@ -0,0 +1,67 @@
+"""Measure job page parsing throughput in threads versus a process pool.
+
+Simulates the crawl's split between download threads and parser processes: the
+stored fixture pages are handed out by ``--threads`` threads, which parse them
+inline (GIL-bound) or through ``--parse-workers`` processes. Run from the
+repository root::
+
+    python -m benchmarks.bench_parse_pool --pages 400 --threads 8 --parse-workers 4
+"""
+
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from glassdoorcrawler import scraper
+
+from .bench_job_page_parse import load_job_pages
+
+PARSERS: Dict[str, Callable[[str], Dict]] = {
+    "fast": scraper._parse_job_page_fast,
+    "full": scraper._parse_job_page,
+}
+
+
+def _run(pages: List[str], parse: Callable[[str], Dict], threads: int, pool: Optional[ProcessPoolExecutor]) -> float:
+    def _handle(html: str) -> Dict:
+        if pool is None:
+            return parse(html)
+        return pool.submit(parse, html).result()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(_handle, pages))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="Pages parsed per mode")
+    parser.add_argument("--threads", type=int, default=8, help="Download threads handing out pages")
+    parser.add_argument("--parse-workers", type=int, default=multiprocessing.cpu_count(), help="Parser processes")
+    parser.add_argument("--parser", choices=sorted(PARSERS), default="full", help="Job page parser to run")
+    args = parser.parse_args()
+
+    fixtures = list(load_job_pages().values())
+    pages = [fixtures[index % len(fixtures)] for index in range(args.pages)]
+    parse = PARSERS[args.parser]
+
+    inline = _run(pages, parse, args.threads, None)
+    with ProcessPoolExecutor(
+        max_workers=args.parse_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        _run(pages[: args.parse_workers], parse, args.parse_workers, pool)  # warm up the workers
+        pooled = _run(pages, parse, args.threads, pool)
+
+    print(f"{'mode':28} {'seconds':>9} {'pages/s':>9}")
+    print(f"{f'{args.threads} threads inline':28} {inline:9.2f} {args.pages / inline:9.1f}")
+    label = f"{args.threads} threads + {args.parse_workers} procs"
+    print(f"{label:28} {pooled:9.2f} {args.pages / pooled:9.1f}")
+    print(f"speedup: {inline / pooled:.2f}x on {multiprocessing.cpu_count()} cores")
+
+
+if __name__ == "__main__":
+    main()
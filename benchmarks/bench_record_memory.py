@@ -0,0 +1,120 @@
+"""Measure the memory held by in-flight job rows: dicts versus ``JobRecord``.
+
+Builds ``--records`` rows the way a long crawl accumulates them: every row comes
+from its own page, so company and location arrive as fresh string objects drawn
+from a realistic number of distinct values, and each description is HTML text of
+about ``--description-bytes`` built from the words of the fixture pages. The
+traced memory of the full list is reported per representation. Run from the
+repository root::
+
+    python -m benchmarks.bench_record_memory --records 100000
+"""
+
+import argparse
+import gc
+import random
+import re
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.records import JobRecord
+
+from .bench_job_page_parse import load_job_pages
+
+Row = Dict[str, Any]
+
+
+def _vocabulary() -> List[str]:
+    words = set()
+    for html in load_job_pages().values():
+        description = scraper._parse_job_page_fast(html)["job_description"] or ""
+        words.update(re.findall(r"[^\W\d_]{3,}", description))
+    # The fixtures are short; pad with common words so descriptions are not repetitive.
+    words.update("desenvolvimento experiencia conhecimento equipe projetos requisitos beneficios".split())
+    return sorted(words)
+
+
+def _fresh(text: str) -> str:
+    # A new string object with the same value, as each parsed page produces.
+    return "".join(list(text))
+
+
+def make_rows(count: int, description_bytes: int, seed: int = 0) -> List[Row]:
+    rng = random.Random(seed)
+    words = _vocabulary()
+    companies = [f"Empresa {index} Ltda" for index in range(max(1, count // 40))]
+    locations = [f"Cidade {index}, MG" for index in range(200)]
+    rows = []
+    for index in range(count):
+        paragraphs = []
+        size = 0
+        while size < description_bytes:
+            sentence = " ".join(rng.choice(words) for _ in range(12)).capitalize() + "."
+            paragraphs.append(f"<p>{sentence}</p>")
+            size += len(sentence) + 7
+        rows.append(
+            {
+                "job_title": f"Desenvolvedor {rng.choice(words)} {index}",
+                "company_name": _fresh(rng.choice(companies)),
+                "location": _fresh(rng.choice(locations)),
+                "salary_estimated": f"R$ {rng.randrange(2, 20)}.{rng.randrange(0, 999):03d} /mes",
+                "salary_min": None,
+                "salary_max": None,
+                "job_description": "".join(paragraphs),
+            }
+        )
+    return rows
+
+
+REPRESENTATIONS: Dict[str, Callable[[Row], Any]] = {
+    "dict": dict,
+    "JobRecord": lambda row: JobRecord(**row),
+    "JobRecord, compressed": lambda row: JobRecord(**row).compress_description(),
+}
+
+
+def measure(rows: List[Row], build: Callable[[Row], Any]) -> Dict[str, float]:
+    """Traced bytes left held by ``[build(row) for row in rows]`` and the build time.
+
+    Each row is first copied with fresh strings, as a page parse would produce it,
+    and that copy is dropped once built, so only what the representation keeps
+    alive is counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    sources = [{key: _fresh(value) if isinstance(value, str) else value for key, value in row.items()} for row in rows]
+    started = time.perf_counter()
+    built = []
+    while sources:
+        built.append(build(sources.pop()))
+    seconds = time.perf_counter() - started
+    del sources
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del built
+    return {"bytes": held, "seconds": seconds}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000, help="Rows held in memory")
+    parser.add_argument("--description-bytes", type=int, default=3000, help="Approximate description length")
+    args = parser.parse_args()
+
+    rows = make_rows(args.records, args.description_bytes)
+    results = {name: measure(rows, build) for name, build in REPRESENTATIONS.items()}
+    reference = results["dict"]["bytes"]
+    print(f"{'representation':24} {'MiB':>9} {'B/row':>8} {'vs dict':>8} {'build s':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:24} {result['bytes'] / 1048576:9.1f} {result['bytes'] / args.records:8.0f} "
+            f"{result['bytes'] / reference:8.2f} {result['seconds']:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
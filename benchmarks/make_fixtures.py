@@ -0,0 +1,364 @@
+"""Generate the synthetic fixture corpus in ``benchmarks/fixtures/``.
+
+The corpus is synthetic, not recorded pages: it reproduces the structure the
+parsers depend on (search page with the Next.js ``self.__next_f`` payload, BFF
+``jobSearchResultsQuery`` JSON, job pages with ``initialState`` and with JSON-LD)
+and pads it with seeded random text, meta tags, styles and scripts so the pages
+are about as large as real ones. The output is deterministic, so the benchmark
+numbers can be reproduced and the corpus refreshed when the page structure
+changes. Run from the repository root::
+
+    python -m benchmarks.make_fixtures
+    python -m benchmarks.make_fixtures --check
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .bench_job_page_parse import FIXTURES_DIR
+
+SYNTHETIC_NOTE = "Fixture corpus is synthetic (benchmarks/make_fixtures.py), not recorded pages."
+
+_JOB_PAGE_WORDS = (
+    "desenvolvimento python apis dados cloud equipe projeto clientes requisitos "
+    "experiencia conhecimento sistemas arquitetura testes integracao banco performance "
+    "microservicos agil entregas qualidade backend frontend infraestrutura"
+).split()
+_SEARCH_WORDS = (
+    "python dados backend cloud equipe requisitos entregas performance apis sistemas agil "
+    "arquitetura qualidade testes integracao clientes"
+).split()
+_COMPANIES = ["Acme", "Loja Mineira", "Banco Horizonte", "Tech BH", "Dados Gerais", "Savassi Labs"]
+_TITLES = ["Desenvolvedor Python", "Engenheiro de Dados", "Desenvolvedor Backend", "Analista de Sistemas", "Cientista de Dados"]
+SEARCH_URL = "https://www.glassdoor.com.br/Vaga/belo-horizonte-desenvolvedor-vagas-SRCH_IL.0,14_IC2514646_KO15,28.htm"
+
+
+def _sentence_maker(rng: random.Random, words: List[str]) -> Callable[[int], str]:
+    def sentence(count: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(count)).capitalize() + "."
+
+    return sentence
+
+
+def job_pages(seed: int = 7) -> Dict[str, str]:
+    """The two job page variants, ``initialState`` and JSON-LD."""
+    para = _sentence_maker(random.Random(seed), _JOB_PAGE_WORDS)
+
+    def description() -> str:
+        parts = ["<div><p><b>Sobre a vaga</b></p>"]
+        for _ in range(6):
+            parts.append("<p>" + para(40) + "</p><ul>" + "".join(f"<li>{para(12)}</li>" for _ in range(5)) + "</ul>")
+        parts.append("</div>")
+        return "".join(parts)
+
+    def head(title: str) -> str:
+        css = "".join(f".c{i}{{margin:{i}px;padding:{i % 7}px;color:#{i:06x}}}" for i in range(900))
+        metas = "".join(f'<meta name="m{i}" content="{para(6)}">' for i in range(20))
+        links = "".join(f'<link rel="preload" href="/static/chunk-{i}.js" as="script">' for i in range(30))
+        return (
+            f'<!DOCTYPE html><html lang="pt-BR"><head><meta charset="utf-8"><title>{title}</title>{metas}{links}'
+            f"<style>{css}</style><script>window.dataLayer=window.dataLayer||[];"
+            "function gtag(){dataLayer.push(arguments)}</script></head>"
+        )
+
+    def chrome() -> Tuple[str, str, str]:
+        nav = (
+            '<nav class="topnav">'
+            + "".join(f'<a class="nav-item" href="/Vaga/item-{i}.htm">{para(2)}</a>' for i in range(60))
+            + "</nav>"
+        )
+        similar = (
+            '<section class="similar">'
+            + "".join(
+                f'<div class="card"><a href="/job-listing/similar-{i}-JV_IC2514646_KO0,10_KE11,20.htm?jl=10090{i:05d}">'
+                f'{para(3)}</a><span class="employer">{para(2)}</span><span class="loc">Belo Horizonte, MG</span></div>'
+                for i in range(40)
+            )
+            + "</section>"
+        )
+        footer = (
+            "<footer>"
+            + "".join(
+                f'<div class="col"><h4>{para(2)}</h4>'
+                + "".join(f'<a href="/f/{i}-{j}">{para(2)}</a>' for j in range(12))
+                + "</div>"
+                for i in range(6)
+            )
+            + "</footer>"
+        )
+        return nav, similar, footer
+
+    def noise_scripts() -> str:
+        # Script chunks, flight payload pushes and a commented-out state script.
+        return (
+            "".join(f'<script src="/static/chunk-{i}.js" async></script>' for i in range(15))
+            + "".join(f"<script>self.__next_f.push([1,{json.dumps('x:' + para(80))}])</script>" for _ in range(12))
+            + '<!-- <script>window.appCache={"initialState":{}}</script> -->'
+        )
+
+    def page_initial_state(index: int) -> str:
+        desc = description()
+        state = {
+            "initialState": {
+                "jlData": {
+                    "header": {
+                        "jobTitleText": f"Desenvolvedor Python Pleno {index}",
+                        "employer": {"name": "ACME Tecnologia", "id": 1234},
+                        "locationName": "Belo Horizonte, MG",
+                        "payPeriod": "MONTHLY",
+                    },
+                    "job": {"description": desc, "listingId": 1009000000 + index},
+                    "overview": {"size": "201 a 500", "industry": para(3)},
+                },
+                "reviews": [{"text": para(30)} for _ in range(15)],
+            }
+        }
+        nav, similar, footer = chrome()
+        return (
+            head(f"Desenvolvedor Python Pleno {index}")
+            + '<body class="main">'
+            + nav
+            + f'<div id="JobView"><h1>Desenvolvedor Python Pleno {index}</h1><div class="salary">'
+            '<h2 class="salEst">R$ 7.500 /mes</h2>'
+            '<div class="minor cell alignLt">R$ 5.000</div><div class="minor cell alignRt">R$ 10.000</div></div>'
+            f'<div class="jobDescriptionContent">{desc}</div></div>'
+            + similar
+            + noise_scripts()
+            + "<script>window.appCache="
+            + json.dumps(state)
+            + ";</script>"
+            + footer
+            + "</body></html>"
+        )
+
+    def page_jsonld(index: int) -> str:
+        desc = description()
+        posting = {
+            "@context": "https://schema.org",
+            "@type": "JobPosting",
+            "title": f"Engenheiro de Dados {index}",
+            "hiringOrganization": {"@type": "Organization", "name": "Dados & Cia", "sameAs": "https://dados.example"},
+            "jobLocation": [
+                {
+                    "@type": "Place",
+                    "address": {
+                        "@type": "PostalAddress",
+                        "addressLocality": "Belo Horizonte",
+                        "addressRegion": "MG",
+                        "addressCountry": "BR",
+                    },
+                }
+            ],
+            "salaryCurrency": "BRL",
+            "baseSalary": {
+                "@type": "MonetaryAmount",
+                "currency": "BRL",
+                "value": {
+                    "@type": "QuantitativeValue",
+                    "minValue": 6000,
+                    "maxValue": 11000,
+                    "value": 8500,
+                    "unitText": "MONTH",
+                },
+            },
+            "datePosted": "2026-10-01",
+            "employmentType": "FULL_TIME",
+            "description": desc,
+        }
+        breadcrumb = {
+            "@context": "https://schema.org",
+            "@type": "BreadcrumbList",
+            "itemListElement": [{"@type": "ListItem", "position": p, "name": para(2)} for p in range(1, 5)],
+        }
+        nav, similar, footer = chrome()
+        return (
+            head(f"Engenheiro de Dados {index}")
+            + '<script type="application/ld+json">'
+            + json.dumps(breadcrumb)
+            + "</script><body>"
+            + nav
+            + f'<div id="JobView"><h1>Engenheiro de Dados {index}</h1>'
+            f'<div class="jobDescriptionContent">{desc}</div></div>'
+            + similar
+            + noise_scripts()
+            + "<script type='application/ld+json'>"
+            + json.dumps(posting)
+            + "</script>"
+            + footer
+            + "</body></html>"
+        )
+
+    # Generated in this order: both pages draw from the same seeded sequence.
+    initial_state = page_initial_state(1)
+    return {"job_page_initial_state.html": initial_state, "job_page_jsonld.html": page_jsonld(2)}
+
+
+def search_pages(seed: int = 15) -> Dict[str, str]:
+    """The first search page (SSR with the flight payload) and a BFF results page."""
+    rng = random.Random(seed)
+    sentence = _sentence_maker(rng, _SEARCH_WORDS)
+
+    cards = []
+    listing_ids = []
+    for i in range(30):
+        jl = 1009000000 + i * 7919
+        listing_ids.append(jl)
+        title = rng.choice(_TITLES)
+        company = rng.choice(_COMPANIES)
+        slug = f"{title}-{company}".lower().replace(" ", "-")
+        href = (
+            f"/job-listing/{slug}-JV_IC2514646_KO0,{len(title)}_KE{len(title) + 1},{len(slug)}.htm"
+            f"?jl={jl}&pos={100 + i}&ao=1136043&s=58&guid=0000018f{i:04x}&src=GD_JOB_AD&t=SR"
+        )
+        cards.append(
+            f'<li class="JobsList_jobListItem__wjTHv" data-test="jobListing" data-jobid="{jl}">'
+            f'<div class="JobCard_jobCardContainer__arQlW"><div class="JobCard_employerLogo">'
+            f'<img src="https://media.glassdoor.com/sql/{i}/logo.png" alt="{company}"></div>'
+            f'<a href="{href}" class="JobCard_jobTitle__GLyJ1" data-test="job-title">{title}</a>'
+            f'<a href="{href}" class="JobCard_trackingLink__HMyun" aria-hidden="true" tabindex="-1"></a>'
+            f'<span class="EmployerProfile_compactEmployerName">{company}</span>'
+            f'<div class="JobCard_location__Ds1fM" data-test="emp-location">Belo Horizonte, MG</div>'
+            f'<div class="JobCard_salaryEstimate__QpbTW" data-test="detailSalary">R$ {rng.randint(4, 12)} mil - '
+            f"R$ {rng.randint(13, 20)} mil (Estimativa do empregador)</div>"
+            f'<div class="JobCard_jobDescriptionSnippet__l1tnl">{sentence(14)} {sentence(12)}</div>'
+            f'<div class="JobCard_listingAge__jJsuc" data-test="job-age">{rng.randint(1, 30)} d</div></div></li>'
+        )
+    cursors = [{"cursor": f"AB4AAYEAHgAAAAAAAAAAAAAAAj{page:03d}xN2QAOAECAQcA", "pageNumber": page} for page in range(1, 31)]
+    context = {
+        "searchContext": {"absoluteUrl": SEARCH_URL},
+        "queryString": "sc.keyword=desenvolvedor&locT=C&locId=2514646",
+        "filterParams": [{"filterKey": "sortBy", "values": "date_desc"}, {"filterKey": "fromAge", "values": "7"}],
+        "searchUrlParams": {"locationId": 2514646, "keyword": "desenvolvedor"},
+        "isLoggedIn": False,
+        "jobListingIdFromUrl": 0,
+        "occupationParam": "desenvolvedor",
+        "locationId": "2514646",
+        "locationType": "C",
+        "parameterUrlInput": "IL.0,14_IC2514646_KO15,28",
+        "seoFriendlyUrlInput": "belo-horizonte-desenvolvedor-vagas",
+        "seoUrl": True,
+        "jobListings": [
+            {"jobListingId": jl, "jobTitleText": rng.choice(_TITLES), "descriptionFragmentsText": [sentence(20)]}
+            for jl in listing_ids
+        ],
+        "paginationCursors": cursors,
+        "totalJobsCount": 900,
+    }
+    decoded = "7:" + json.dumps(["$", "$L8", None, context], separators=(",", ":"))
+    filler = "".join(
+        "<script>self.__next_f.push([1,"
+        + json.dumps("%x:" % (k + 20) + json.dumps({"chunk": k, "text": sentence(30)}))
+        + "])</script>"
+        for k in range(40)
+    )
+    metas = "".join(f'<meta name="m{k}" content="{sentence(6)}">' for k in range(40))
+    styles = "".join(f'<link rel="stylesheet" href="/_next/static/css/{k:04x}.css">' for k in range(20))
+    search_html = (
+        '<!DOCTYPE html><html lang="pt-BR"><head><meta charset="utf-8">'
+        "<title>Vagas de Desenvolvedor em Belo Horizonte</title>"
+        + metas
+        + styles
+        + '</head><body><div id="__next"><header class="Header_header"><nav>'
+        + "".join(f'<a href="/Vaga/{word}-vagas.htm">{word}</a>' for word in _SEARCH_WORDS)
+        + '</nav></header><main><ul class="JobsList_jobsList__lqjTr" aria-label="Jobs List">'
+        + "".join(cards)
+        + '</ul><div class="PaginationFooter"><button data-test="load-more">Mostrar mais vagas</button></div></main>'
+        "<footer>"
+        + "".join(f"<p>{sentence(20)}</p>" for _ in range(20))
+        + "</footer></div>"
+        "<script>(self.__next_f=self.__next_f||[]).push([0])</script>"
+        + filler
+        + f"<script>self.__next_f.push([1,{json.dumps(decoded)}])</script>"
+        "</body></html>"
+    )
+
+    items = []
+    for i in range(30):
+        jl = 1009500000 + i * 104729
+        title = rng.choice(_TITLES)
+        company = rng.choice(_COMPANIES)
+        slug = f"{title}-{company}".lower().replace(" ", "-")
+        items.append(
+            {
+                "jobview": {
+                    "header": {
+                        "adOrderId": 1136043,
+                        "ageInDays": rng.randint(0, 30),
+                        "easyApply": rng.random() < 0.5,
+                        "employer": {"id": 1000 + i, "name": company, "shortName": company},
+                        "employerNameFromSearch": company,
+                        "jobTitleText": title,
+                        "locationName": "Belo Horizonte, MG",
+                        "payCurrency": "BRL",
+                        "payPeriod": "MONTHLY",
+                        "payPeriodAdjustedPay": {
+                            "p10": rng.randint(4000, 7000),
+                            "p50": 9000,
+                            "p90": rng.randint(12000, 20000),
+                        },
+                        "salarySource": "EMPLOYER_PROVIDED",
+                        "seoJobLink": (
+                            f"https://www.glassdoor.com.br/job-listing/{slug}-JV_IC2514646_KO0,{len(title)}"
+                            f"_KE{len(title) + 1},{len(slug)}.htm?jl={jl}"
+                        ),
+                    },
+                    "job": {
+                        "descriptionFragmentsText": [sentence(25), sentence(25)],
+                        "jobTitleText": title,
+                        "listingId": jl,
+                    },
+                    "overview": {
+                        "shortName": company,
+                        "squareLogoUrl": f"https://media.glassdoor.com/sqll/{1000 + i}/logo.png",
+                    },
+                }
+            }
+        )
+    bff = {"data": {"jobListings": {"jobListings": items, "paginationCursors": cursors, "totalJobsCount": 900}}}
+    return {"search_page.html": search_html, "bff_page.json": json.dumps(bff, ensure_ascii=False)}
+
+
+def build_corpus() -> Dict[str, str]:
+    return {**job_pages(), **search_pages()}
+
+
+def stale_fixtures(directory: str = FIXTURES_DIR) -> List[str]:
+    """Names of the fixture files that differ from what ``build_corpus`` generates."""
+    stale = []
+    for name, content in build_corpus().items():
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as handle:
+                current: Optional[str] = handle.read()
+        except OSError:
+            current = None
+        if current != content:
+            stale.append(name)
+    return stale
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output-dir", default=FIXTURES_DIR, help="Directory to write the fixtures to")
+    parser.add_argument("--check", action="store_true", help="Only report fixtures that differ; exit 1 if any")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_fixtures(args.output_dir)
+        for name in stale:
+            print(f"{name} differs from the generated corpus")
+        return 1 if stale else 0
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for name, content in build_corpus().items():
+        with open(os.path.join(args.output_dir, name), "w", encoding="utf-8") as handle:
+            handle.write(content)
+        print(f"wrote {name} ({len(content.encode('utf-8'))} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
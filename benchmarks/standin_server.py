@@ -0,0 +1,293 @@
+"""Local stand-in for the Glassdoor endpoints the crawler talks to.
+
+Serves search pages with a ``self.__next_f.push`` pagination payload, the
+``jobSearchResultsQuery`` BFF endpoint and job pages (the stored fixtures) for a
+synthetic set of ``--listings`` postings, with optional latency, HTTP 429s,
+Cloudflare-style 403 security pages and slow bodies. Point the crawler at it with
+``--origin``::
+
+    python -m benchmarks.standin_server --port 8765 --listings 10000 --latency 0.05 --p429 0.01
+    python main.py --origin http://127.0.0.1:8765 --pages 334 --concurrency 16 --rps 200 --output /tmp/vagas.jsonl
+
+``GET /__stats`` returns the request counters as JSON.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .bench_job_page_parse import load_job_pages
+
+SEARCH_URL = "https://www.glassdoor.com.br/Vaga/belo-horizonte-desenvolvedor-vagas-SRCH_IL.0,14_IC2514646_KO15,28.htm"
+FIRST_LISTING_ID = 1_000_000
+_PAGE_SUFFIX_RE = re.compile(r"_I?P(\d+)\.htm$")
+
+CLOUDFLARE_PAGE = (
+    "<!DOCTYPE html><html><head><title>Security | Glassdoor</title></head>"
+    "<body><h1>Verifying you are human. This may take a few seconds.</h1></body></html>"
+)
+
+
+@dataclass
+class StandinConfig:
+    listings: int = 1000
+    page_size: int = 30
+    latency: float = 0.0
+    jitter: float = 0.0
+    p429: float = 0.0
+    p403: float = 0.0
+    p_slow: float = 0.0
+    slow_seconds: float = 1.0
+    retry_after: int = 1
+    seed: int = 0
+
+    @property
+    def pages(self) -> int:
+        return max(1, math.ceil(self.listings / self.page_size))
+
+
+def _listing_ids(config: StandinConfig, page: int) -> List[int]:
+    start = (page - 1) * config.page_size
+    stop = min(page * config.page_size, config.listings)
+    return [FIRST_LISTING_ID + index for index in range(start, stop)]
+
+
+def _job_link(listing_id: int) -> str:
+    return f"https://www.glassdoor.com.br/job-listing/desenvolvedor-acme-JV_IC2514646_KO0,13_KE14,18.htm?jl={listing_id}"
+
+
+def search_page_html(config: StandinConfig, page: int) -> str:
+    cards = "".join(
+        f'<li data-test="jobListing" data-jobid="{listing_id}">'
+        f'<a href="{urlparse(_job_link(listing_id)).path}?jl={listing_id}&pos={index + 1}" '
+        f'data-test="job-title">Desenvolvedor {listing_id}</a></li>'
+        for index, listing_id in enumerate(_listing_ids(config, page))
+    )
+    context = {
+        "searchContext": {"absoluteUrl": SEARCH_URL},
+        "queryString": "sc.keyword=desenvolvedor&locT=C&locId=2514646",
+        "filterParams": [{"filterKey": "sortBy", "values": "date_desc"}],
+        "searchUrlParams": {"locationId": 2514646, "keyword": "desenvolvedor"},
+        "isLoggedIn": False,
+        "occupationParam": "desenvolvedor",
+        "locationId": "2514646",
+        "locationType": "C",
+        "parameterUrlInput": "IL.0,14_IC2514646_KO15,28",
+        "seoFriendlyUrlInput": "belo-horizonte-desenvolvedor-vagas",
+        "seoUrl": True,
+        "paginationCursors": [
+            {"cursor": f"standin-cursor-{number}", "pageNumber": number} for number in range(1, config.pages + 1)
+        ],
+    }
+    decoded = "7:" + json.dumps(["$", "$L8", None, context], separators=(",", ":"))
+    return (
+        '<!DOCTYPE html><html lang="pt-BR"><head><meta charset="utf-8">'
+        "<title>Vagas de Desenvolvedor em Belo Horizonte</title></head><body>"
+        f'<ul aria-label="Jobs List">{cards}</ul>'
+        f"<script>self.__next_f.push([1,{json.dumps(decoded)}])</script></body></html>"
+    )
+
+
+def bff_page_json(config: StandinConfig, page: int) -> str:
+    items = [
+        {"jobview": {"header": {"seoJobLink": _job_link(listing_id), "jobTitleText": f"Desenvolvedor {listing_id}"}}}
+        for listing_id in _listing_ids(config, page)
+    ]
+    return json.dumps({"data": {"jobListings": {"jobListings": items}}})
+
+
+def _search_page_number(url: str) -> int:
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    for key in ("page", "p"):
+        if query.get(key, [""])[0].isdigit():
+            return int(query[key][0])
+    match = _PAGE_SUFFIX_RE.search(parsed.path)
+    return int(match.group(1)) if match else 1
+
+
+class StandinServer:
+    """Threaded HTTP server answering like Glassdoor, with injectable faults."""
+
+    def __init__(self, config: Optional[StandinConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandinConfig()
+        self.stats: Counter = Counter()
+        self._job_pages = list(load_job_pages().values())
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def origin(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _fault(self) -> Tuple[Optional[str], bool]:
+        """Draw the fault for one request: ("429"|"403"|None, slow body)."""
+        config = self.config
+        with self._lock:
+            draw = self._random.random()
+            slow = self._random.random() < config.p_slow
+            delay = config.latency + self._random.uniform(0, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if draw < config.p429:
+            return "429", slow
+        if draw < config.p429 + config.p403:
+            return "403", slow
+        return None, slow
+
+    def route(self, method: str, path: str, body: bytes) -> Tuple[int, str, str]:
+        """Return ``(status, content type, body)`` for a fault-free request."""
+        parsed = urlparse(path)
+        if method == "POST" and parsed.path.endswith("/jobSearchResultsQuery"):
+            payload = json.loads(body or b"{}")
+            self._count("bff")
+            return 200, "application/json", bff_page_json(self.config, int(payload.get("pageNumber", 1)))
+        if method == "GET" and "/job-listing/" in parsed.path:
+            listing_ids = parse_qs(parsed.query).get("jl", [""])
+            listing_id = int(listing_ids[0]) if listing_ids[0].isdigit() else -1
+            if not FIRST_LISTING_ID <= listing_id < FIRST_LISTING_ID + self.config.listings:
+                self._count("not_found")
+                return 404, "text/plain", "not found"
+            self._count("job")
+            return 200, "text/html; charset=utf-8", self._job_pages[listing_id % len(self._job_pages)]
+        if method == "GET" and parsed.path.endswith(".htm"):
+            self._count("search")
+            return 200, "text/html; charset=utf-8", search_page_html(self.config, _search_page_number(path))
+        self._count("not_found")
+        return 404, "text/plain", "not found"
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _reply(self, status: int, content_type: str, text: str, headers: Dict[str, str], slow: bool) -> None:
+                data = text.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if not slow:
+                    self.wfile.write(data)
+                    return
+                chunks = [data[index : index + 4096] for index in range(0, len(data), 4096)] or [b""]
+                for chunk in chunks:
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+                    time.sleep(server.config.slow_seconds / len(chunks))
+
+            def _handle(self, method: str) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.path == "/__stats":
+                    self._reply(200, "application/json", json.dumps(server.stats), {}, False)
+                    return
+                server._count("requests")
+                fault, slow = server._fault()
+                if fault == "429":
+                    server._count("429")
+                    headers = {"Retry-After": str(server.config.retry_after)}
+                    self._reply(429, "text/plain", "Too Many Requests", headers, False)
+                    return
+                if fault == "403":
+                    server._count("403")
+                    self._reply(403, "text/html", CLOUDFLARE_PAGE, {"Server": "cloudflare"}, False)
+                    return
+                if slow:
+                    server._count("slow")
+                status, content_type, text = server.route(method, self.path, body)
+                self._reply(status, content_type, text, {}, slow)
+
+            def do_GET(self) -> None:
+                self._handle("GET")
+
+            def do_POST(self) -> None:
+                self._handle("POST")
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--listings", type=int, default=10000, help="Number of synthetic postings")
+    parser.add_argument("--page-size", type=int, default=30, help="Listings per search/BFF page")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--p429", type=float, default=0.0, help="Probability of a 429 with Retry-After")
+    parser.add_argument("--p403", type=float, default=0.0, help="Probability of a Cloudflare 403 security page")
+    parser.add_argument("--p-slow", type=float, default=0.0, help="Probability of a body trickled over --slow-seconds")
+    parser.add_argument("--slow-seconds", type=float, default=1.0)
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        listings=args.listings,
+        page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        p429=args.p429,
+        p403=args.p403,
+        p_slow=args.p_slow,
+        slow_seconds=args.slow_seconds,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = StandinServer(config, host=args.host, port=args.port)
+    print(f"Serving {config.listings} listings ({config.pages} pages) on {server.origin}; Ctrl-C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(server.stats, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Offline benchmark suite for the parse hot paths and an end-to-end crawl.
+
+Every case runs against the fixture corpus in ``benchmarks/fixtures/`` (search
+page with the Next.js flight payload, BFF JSON page, job pages in the
+``initialState`` and JSON-LD variants), so no network is involved. The corpus is
+synthetic, generated by ``benchmarks/make_fixtures.py``; rows/s measured on it
+track regressions, not throughput on real pages. Each case
+reports its best time, rows per second and peak traced memory. Run from the
+repository root::
+
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.15
+
+With ``--compare`` the run exits with status 1 when a case got slower (or its peak
+memory grew) by more than ``--threshold`` relative to the saved run.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.retry import RetryStats
+
+from .bench_job_page_parse import FIXTURES_DIR, load_job_pages
+from .make_fixtures import SYNTHETIC_NOTE
+
+SEARCH_URL = "https://www.glassdoor.com.br/Vaga/belo-horizonte-desenvolvedor-vagas-SRCH_IL.0,14_IC2514646_KO15,28.htm"
+CRAWL_PAGES = 5
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[], Any]
+    rows: int
+    repeat: int
+
+
+@dataclass
+class Result:
+    name: str
+    seconds: float
+    rows_per_second: float
+    peak_kib: float
+
+
+def _read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as handle:
+        return handle.read()
+
+
+class _FixtureResponse:
+    status_code = 200
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FixtureClient:
+    """Stands in for ``_HttpClient``: serves the fixture corpus by URL."""
+
+    rate_limiter = None
+    cache = None
+    parse_pool = None
+    rate_controller = None
+    metrics = None
+
+    def __init__(self) -> None:
+        self._search_page = _read_fixture("search_page.html")
+        self._bff_page = _read_fixture("bff_page.json")
+        self._job_pages = list(load_job_pages().values())
+        self._requests = 0
+        self.retry_stats = RetryStats()
+
+    def get(self, url: str, headers: Dict[str, str], timeout: int) -> _FixtureResponse:
+        self._requests += 1
+        if "/job-listing/" in url:
+            return _FixtureResponse(self._job_pages[self._requests % len(self._job_pages)])
+        return _FixtureResponse(self._search_page)
+
+    def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: int,
+        json_payload: Optional[Dict[str, Any]] = None,
+    ) -> _FixtureResponse:
+        # Give every BFF page its own listing IDs so pagination keeps going.
+        page = (json_payload or {}).get("pageNumber", 2)
+        return _FixtureResponse(re.sub(r"jl=(\d+)", lambda match: f"jl={match.group(1)}{page:02d}", self._bff_page))
+
+    def close(self) -> None:
+        pass
+
+
+def _crawl_once() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.object(
+        scraper, "_build_session", side_effect=lambda **kwargs: FixtureClient()
+    ), contextlib.redirect_stderr(io.StringIO()):
+        scraper.crawl_jobs(
+            SEARCH_URL,
+            num_pages=CRAWL_PAGES,
+            output_path=os.path.join(tmp_dir, "vagas.jsonl"),
+            delay_seconds=0,
+            return_dataframe=False,
+        )
+
+
+def build_cases(repeat: int, crawl_repeat: int) -> List[Case]:
+    search_html = _read_fixture("search_page.html")
+    search_soup = BeautifulSoup(search_html, "html.parser")
+    search_links = len(scraper._extract_job_links_from_search_soup(search_soup, SEARCH_URL))
+    client = FixtureClient()
+    bootstrap = scraper._extract_search_bootstrap_for_pagination(search_soup)
+    bff_links = len(scraper._get_links_from_bff_page(2, bootstrap, session=client))
+    cases = [
+        Case(
+            "search_page_soup",
+            lambda: BeautifulSoup(search_html, "html.parser"),
+            search_links,
+            repeat,
+        ),
+        Case(
+            "search_bootstrap",
+            lambda: scraper._extract_search_bootstrap_for_pagination(search_soup),
+            1,
+            repeat,
+        ),
+        Case(
+            "search_links",
+            lambda: scraper._extract_job_links_from_search_soup(search_soup, SEARCH_URL),
+            search_links,
+            repeat,
+        ),
+        Case(
+            "bff_links",
+            lambda: scraper._get_links_from_bff_page(2, bootstrap, session=client),
+            bff_links,
+            repeat,
+        ),
+    ]
+    for name, html in load_job_pages().items():
+        variant = os.path.splitext(name)[0].replace("job_page_", "")
+        cases.append(Case(f"job_page_{variant}", lambda html=html: scraper._parse_job_page_fast(html), 1, repeat))
+    # Page 1 comes from the search page fixture, the following pages from the BFF one.
+    crawl_rows = search_links + (CRAWL_PAGES - 1) * bff_links
+    cases.append(Case(f"crawl_jobs_{CRAWL_PAGES}_pages", _crawl_once, crawl_rows, crawl_repeat))
+    return cases
+
+
+def measure(case: Case) -> Result:
+    timings: List[float] = []
+    for _ in range(case.repeat):
+        started = time.perf_counter()
+        case.run()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+
+    # Traced separately: tracemalloc slows allocation-heavy code down.
+    tracemalloc.start()
+    try:
+        case.run()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(case.name, best, case.rows / best if best else float("inf"), peak / 1024)
+
+
+def compare(results: List[Result], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Print the change against ``baseline``; return the names of regressed cases."""
+    regressions: List[str] = []
+    print(f"\n{'case':28} {'time':>9} {'peak mem':>9}")
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            print(f"{result.name:28} {'new':>9} {'new':>9}")
+            continue
+        time_change = result.seconds / previous["seconds"] - 1
+        memory_change = result.peak_kib / previous["peak_kib"] - 1 if previous["peak_kib"] else 0.0
+        regressed = time_change > threshold or memory_change > threshold
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{result.name:28} {time_change:+8.1%} {memory_change:+8.1%}{flag}")
+        if regressed:
+            regressions.append(result.name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per parse case; the best time is reported")
+    parser.add_argument("--crawl-repeat", type=int, default=3, help="Runs of the end-to-end crawl case")
+    parser.add_argument("--only", default=None, help="Regular expression selecting the cases to run")
+    parser.add_argument("--save", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--compare", default=None, help="JSON file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown/growth before failing")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.repeat, args.crawl_repeat)
+    if args.only:
+        cases = [case for case in cases if re.search(args.only, case.name)]
+
+    results: List[Result] = []
+    print(SYNTHETIC_NOTE)
+    print(f"{'case':28} {'best':>10} {'rows/s':>10} {'peak mem':>11}")
+    for case in cases:
+        result = measure(case)
+        results.append(result)
+        print(
+            f"{result.name:28} {result.seconds * 1000:8.2f}ms {result.rows_per_second:10.1f} "
+            f"{result.peak_kib:9.0f}KiB"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump({result.name: asdict(result) for result in results}, handle, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
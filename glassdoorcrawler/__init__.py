@@ -1,5 +1,15 @@
 """Glassdoor crawler package."""
 
-from .scraper import crawl_jobs, get_all_links, get_position_links, scrap_job_page
+from typing import Any
 
-__all__ = ["crawl_jobs", "get_all_links", "get_position_links", "scrap_job_page"]
+__all__ = ["crawl_jobs", "crawl_searches", "get_all_links", "get_position_links", "iter_page_links", "scrap_job_page"]
+
+
+def __getattr__(name: str) -> Any:
+    # The public API lives in ``scraper``, which is only imported on first use so
+    # that ``import glassdoorcrawler.<submodule>`` stays cheap.
+    if name in __all__:
+        from . import scraper
+
+        return getattr(scraper, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
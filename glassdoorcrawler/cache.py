@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+URL_KIND_SEARCH = "search"
+URL_KIND_BFF = "bff"
+URL_KIND_JOB = "job"
+
+# Search results move quickly; a posting rarely changes once published.
+DEFAULT_CACHE_TTLS = {
+    URL_KIND_SEARCH: 3600.0,
+    URL_KIND_BFF: 3600.0,
+    URL_KIND_JOB: 86400.0,
+}
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def classify_url(url: str) -> str:
+    """Return the TTL class of a Glassdoor URL: ``search``, ``bff`` or ``job``."""
+    path = urlparse(url).path.lower()
+    if "/job-listing/" in path:
+        return URL_KIND_JOB
+    if path.endswith("/jobsearchresultsquery"):
+        return URL_KIND_BFF
+    return URL_KIND_SEARCH
+
+
+class CachedResponse:
+    """Minimal response object rebuilt from a cache entry (2xx only)."""
+
+    from_cache = True
+
+    def __init__(self, entry: Dict[str, Any]):
+        self.url = entry["url"]
+        self.status_code = entry["status_code"]
+        self.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        self.text = entry["text"]
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class ResponseCache:
+    """Content-addressed on-disk cache of successful responses.
+
+    Entries are keyed by method, URL and JSON payload (the BFF POST body) and live
+    in ``<directory>/<key[:2]>/<key>.json``. Fresh entries are served without a
+    request; stale ones are revalidated with ``If-None-Match``/``If-Modified-Since``
+    when the server sent validators.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = directory
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(method: str, url: str, json_payload: Optional[Dict[str, Any]] = None) -> str:
+        material = json.dumps([method.upper(), url, json_payload], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        ttl = self.ttls.get(classify_url(entry["url"]), 0.0)
+        return self._clock() - entry.get("stored_at", 0.0) < ttl
+
+    @staticmethod
+    def validators(entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = entry.get("headers") or {}
+        conditional: Dict[str, str] = {}
+        if headers.get("etag"):
+            conditional["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+    def store(self, key: str, method: str, url: str, response: Any) -> None:
+        response_headers = getattr(response, "headers", {}) or {}
+        entry = {
+            "method": method.upper(),
+            "url": url,
+            "status_code": response.status_code,
+            "headers": {
+                name: response_headers.get(name)
+                for name in _STORED_HEADERS
+                if response_headers.get(name)
+            },
+            "text": response.text,
+            "stored_at": self._clock(),
+        }
+        self._write(key, entry)
+
+    def refresh(self, key: str, entry: Dict[str, Any]) -> None:
+        self._write(key, {**entry, "stored_at": self._clock()})
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def summary(self) -> str:
+        return f"{self.hits} hits, {self.revalidated} revalidated (304), {self.misses} misses"
@@ -1,7 +1,8 @@
 import argparse
 import logging
+from typing import List, Tuple
 
-from .scraper import crawl_jobs
+from .profiling import PROFILE_MODES, CrawlProfiler, profile_prefix
 
 DEFAULT_URL = (
     "https://www.glassdoor.com.br/Vaga/"
@@ -16,16 +17,57 @@ def positive_int(value: str) -> int:
     return parsed
 
 
+def positive_count(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError("value must be greater than or equal to 1")
+    return parsed
+
+
+def non_negative_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 0:
+        raise argparse.ArgumentTypeError("value must be greater than or equal to 0")
+    return parsed
+
+
 def non_negative_float(value: str) -> float:
     parsed = float(value)
     if parsed < 0:
-        raise argparse.ArgumentTypeError("--delay must be greater than or equal to 0")
+        raise argparse.ArgumentTypeError("value must be greater than or equal to 0")
     return parsed
 
 
+def positive_float(value: str) -> float:
+    parsed = float(value)
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("value must be greater than 0")
+    return parsed
+
+
+def cache_ttl(value: str) -> Tuple[str, float]:
+    kind, separator, seconds = value.partition("=")
+    if not separator or kind not in ("search", "bff", "job"):
+        raise argparse.ArgumentTypeError("expected KIND=SECONDS with KIND in search, bff, job")
+    return kind, non_negative_float(seconds)
+
+
+def read_searches_file(path: str) -> List[str]:
+    """Read one search URL per line, skipping blank lines and ``#`` comments."""
+    with open(path, encoding="utf-8") as handle:
+        lines = [line.strip() for line in handle]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Glassdoor job crawler")
-    parser.add_argument("--base-url", default=DEFAULT_URL, help="Glassdoor search results URL")
+    searches = parser.add_mutually_exclusive_group()
+    searches.add_argument("--base-url", default=DEFAULT_URL, help="Glassdoor search results URL")
+    searches.add_argument(
+        "--searches-file",
+        default=None,
+        help="File with one search URL per line; all searches share one client and one deduplicated output",
+    )
     parser.add_argument(
         "--pages",
         type=positive_int,
@@ -35,13 +77,188 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--output",
         default="belohorizonte_vagas.xlsx",
-        help="Output Excel file path",
+        help="Output file path; format from the extension (.xlsx, .jsonl, .csv, .parquet, .arrow)",
     )
     parser.add_argument(
+        "--batch-size",
+        type=positive_count,
+        default=100,
+        help="Rows buffered before each flush to the output file (>= 1)",
+    )
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument(
         "--delay",
         type=non_negative_float,
         default=0.5,
-        help="Delay between requests in seconds (>= 0)",
+        help="Minimum interval between requests in seconds (>= 0); converted to --rps",
+    )
+    pacing.add_argument(
+        "--rps",
+        type=positive_float,
+        default=None,
+        help="Maximum requests per second per host (token bucket); overrides --delay",
+    )
+    parser.add_argument(
+        "--burst",
+        type=positive_count,
+        default=1,
+        help="Requests that may be sent back-to-back before --rps pacing applies (>= 1)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_count,
+        default=1,
+        help="Number of job pages fetched in parallel (>= 1); --rps/--delay still cap the request rate",
+    )
+    parser.add_argument(
+        "--page-concurrency",
+        type=positive_count,
+        default=1,
+        help="Result pages requested in parallel via BFF pagination cursors (>= 1)",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=non_negative_int,
+        default=0,
+        help="Processes parsing downloaded HTML (>= 0; 0 parses in the download threads); "
+        "pair with --concurrency so downloads keep the workers busy",
+    )
+    parser.add_argument(
+        "--search-concurrency",
+        type=positive_count,
+        default=2,
+        help="Searches from --searches-file paginated in parallel (>= 1)",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=non_negative_int,
+        default=3,
+        help="Retries per request on connection errors, 429, 5xx and Cloudflare blocks (>= 0; 0 disables)",
+    )
+    parser.add_argument(
+        "--backoff-base",
+        type=positive_float,
+        default=1.0,
+        help="Base of the jittered exponential backoff in seconds; Retry-After takes precedence (> 0)",
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=positive_count,
+        default=5,
+        help="Cloudflare blocks within a minute that pause all requests (>= 1)",
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=non_negative_float,
+        default=120.0,
+        help="Seconds all requests stay paused once the block circuit breaker opens (>= 0)",
+    )
+    parser.add_argument(
+        "--adaptive-rate",
+        action="store_true",
+        help="Tune the request rate with AIMD between --min-rps and --max-rps: raise it while responses "
+        "are fast, halve it on 429s, Cloudflare blocks, errors or latency spikes",
+    )
+    parser.add_argument(
+        "--min-rps",
+        type=positive_float,
+        default=0.2,
+        help="Lowest request rate --adaptive-rate may set (> 0)",
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=positive_float,
+        default=10.0,
+        help="Highest request rate --adaptive-rate may set (> 0)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the on-disk HTTP response cache (disabled when omitted)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=cache_ttl,
+        action="append",
+        default=[],
+        metavar="KIND=SECONDS",
+        help="Cache freshness per URL class (search, bff, job); may be repeated",
+    )
+    parser.add_argument(
+        "--state-dir",
+        default=None,
+        help="Directory for crawl checkpoints; re-running the same crawl resumes from it",
+    )
+    parser.add_argument(
+        "--pagination-cache",
+        default=None,
+        help="JSON file remembering the pagination URL scheme per search (default: <state-dir>/pagination.json)",
+    )
+    parser.add_argument(
+        "--transport-state",
+        default=None,
+        help="JSON file keeping the Cloudflare fallback profile and cookies between runs "
+        "(default: <state-dir>/transport.json)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip listings already scraped within --freshness-hours according to the listing index",
+    )
+    parser.add_argument(
+        "--listing-index",
+        default=None,
+        help="SQLite index of scraped listings (default with --incremental: listings.sqlite in "
+        "--state-dir or next to --output)",
+    )
+    parser.add_argument(
+        "--freshness-hours",
+        type=positive_float,
+        default=168.0,
+        help="How long a scraped listing is skipped by --incremental (> 0, default: 168)",
+    )
+    parser.add_argument(
+        "--origin",
+        default=None,
+        help="Send every request to this scheme://host[:port] instead of Glassdoor (e.g. a local stand-in server)",
+    )
+    parser.add_argument(
+        "--metrics-report",
+        default=None,
+        help="Write a JSON run report (phase timings, requests, bytes, latency, parse time, rows/s) to this file",
+    )
+    parser.add_argument(
+        "--prometheus-textfile",
+        default=None,
+        help="Write the run metrics in Prometheus text format to this file (for the node_exporter textfile collector)",
+    )
+    parser.add_argument(
+        "--description-store",
+        default=None,
+        help="SQLite file for job descriptions, stored once per distinct text and compressed; the output "
+        "then has a description_hash column instead of job_description",
+    )
+    parser.add_argument(
+        "--description-codec",
+        choices=("zlib", "zstd"),  # DESCRIPTION_CODECS; not imported so --help skips sqlite3
+        default="zlib",
+        help="Compression of the description store; zstd requires the zstandard package (default: zlib)",
+    )
+    parser.add_argument(
+        "--convert",
+        default=None,
+        metavar="SOURCE",
+        help="Instead of crawling, stream an existing .jsonl, .csv, .parquet or .arrow file into the .xlsx "
+        "given by --output",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sampling",
+        default=None,
+        choices=PROFILE_MODES,
+        help="Profile the crawl and write <output>.profile.collapsed (flamegraph stacks) and .txt (time by "
+        "category); 'deterministic' also writes cProfile stats to .pstats (default: sampling)",
     )
     parser.add_argument(
         "--log-level",
@@ -66,13 +283,70 @@ def main() -> None:
         format="%(levelname)s %(name)s: %(message)s",
     )
 
-    crawl_jobs(
-        base_url=args.base_url,
+    if args.adaptive_rate and args.min_rps > args.max_rps:
+        parser.error("--min-rps must not be greater than --max-rps")
+
+    if args.convert:
+        from .sinks import convert_to_excel, is_excel_path
+
+        if not is_excel_path(args.output):
+            parser.error("--convert writes Excel; --output must end in .xlsx or .xlsm")
+        rows = convert_to_excel(args.convert, args.output)
+        logging.getLogger(__name__).info("Wrote %s rows from %s to %s.", rows, args.convert, args.output)
+        return
+
+    # Imported once the arguments are valid: --help and usage errors stay instant.
+    from .scraper import crawl_jobs, crawl_searches
+
+    options = dict(
         num_pages=args.pages,
         output_path=args.output,
         delay_seconds=args.delay,
         use_env_proxies=not args.no_proxy,
+        concurrency=args.concurrency,
+        requests_per_second=args.rps,
+        burst=args.burst,
+        batch_size=args.batch_size,
+        return_dataframe=False,
+        cache_dir=args.cache_dir,
+        cache_ttls=dict(args.cache_ttl),
+        state_dir=args.state_dir,
+        page_concurrency=args.page_concurrency,
+        pagination_cache=args.pagination_cache,
+        transport_state=args.transport_state,
+        incremental=args.incremental,
+        listing_index=args.listing_index,
+        freshness_seconds=args.freshness_hours * 3600,
+        parse_workers=args.parse_workers,
+        origin=args.origin,
+        max_retries=args.max_retries,
+        backoff_base=args.backoff_base,
+        breaker_threshold=args.breaker_threshold,
+        breaker_cooldown=args.breaker_cooldown,
+        adaptive_rate=(args.min_rps, args.max_rps) if args.adaptive_rate else None,
+        metrics_path=args.metrics_report,
+        prometheus_path=args.prometheus_textfile,
+        description_store=args.description_store,
+        description_codec=args.description_codec,
     )
+    if args.searches_file:
+        searches = read_searches_file(args.searches_file)
+        if not searches:
+            parser.error(f"no search URLs found in {args.searches_file}")
+
+        def run() -> None:
+            crawl_searches(searches, search_concurrency=args.search_concurrency, **options)
+
+    else:
+
+        def run() -> None:
+            crawl_jobs(base_url=args.base_url, **options)
+
+    if args.profile:
+        with CrawlProfiler(profile_prefix(args.output), mode=args.profile):
+            run()
+    else:
+        run()
 
 
 if __name__ == "__main__":
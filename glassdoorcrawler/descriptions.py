@@ -0,0 +1,195 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
+
+from .records import JobRecord
+
+DESCRIPTION_CODECS = ("zlib", "zstd")
+DESCRIPTION_HASH_COLUMN = "description_hash"
+
+_ZLIB_LEVEL = 6
+_ZSTD_LEVEL = 9
+# Puts per SQLite transaction; ``close()`` commits the rest.
+_COMMIT_EVERY = 500
+
+
+def description_hash(text: str) -> str:
+    """Content hash of a description: 32 hex digits of BLAKE2b over its UTF-8 bytes."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _codec(name: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    if name == "zlib":
+        return (lambda data: zlib.compress(data, _ZLIB_LEVEL)), zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError("zstandard is not installed") from exc
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress, zstandard.ZstdDecompressor().decompress
+    raise ValueError(f"codec must be one of {', '.join(DESCRIPTION_CODECS)}")
+
+
+class DescriptionStore:
+    """SQLite side store of job descriptions, deduplicated by content.
+
+    Each distinct text is compressed once (``zlib``, or ``zstd`` with the
+    ``zstandard`` package) and kept under its ``description_hash``; a second table
+    maps every listing ID to the hash of its current description. Reposts of the
+    same text across listings and cities cost one row in the mapping. Every blob
+    records its codec, so a store written with either codec stays readable.
+    Writes are committed every few hundred puts, on ``commit()`` and on
+    ``close()``; a caller that writes hashes elsewhere commits first, so no
+    output refers to a description lost in a crash.
+    """
+
+    def __init__(self, path: str, codec: str = "zlib"):
+        self._compress, _decompress = _codec(codec)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.codec = codec
+        self.stored = 0
+        self.deduplicated = 0
+        self._decompressors: Dict[str, Callable[[bytes], bytes]] = {codec: _decompress}
+        self._known: Set[str] = set()  # hashes stored or seen by this process
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+        # Job pages are scraped by several threads; every access holds the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions ("
+            "hash TEXT PRIMARY KEY, "
+            "codec TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "data BLOB NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS listing_descriptions (listing_id TEXT PRIMARY KEY, hash TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def put(self, listing_id: str, text: Optional[str]) -> Optional[str]:
+        """Store the description of ``listing_id`` and return its hash (``None`` for no text)."""
+        if text is None:
+            return None
+        key = description_hash(text)
+        with self._lock:
+            known = key in self._known or self._connection.execute(
+                "SELECT 1 FROM descriptions WHERE hash = ?", (key,)
+            ).fetchone()
+            if known:
+                self.deduplicated += 1
+            else:
+                data = text.encode("utf-8")
+                self._connection.execute(
+                    "INSERT INTO descriptions (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+                    (key, self.codec, len(data), self._compress(data)),
+                )
+                self.stored += 1
+            self._known.add(key)
+            self._connection.execute(
+                "INSERT INTO listing_descriptions (listing_id, hash) VALUES (?, ?) "
+                "ON CONFLICT(listing_id) DO UPDATE SET hash = excluded.hash",
+                (listing_id, key),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= _COMMIT_EVERY:
+                self._commit()
+        return key
+
+    def commit(self) -> None:
+        """Make every put so far durable."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._uncommitted:
+            self._connection.commit()
+            self._uncommitted = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Description stored under ``key``, or ``None`` when unknown."""
+        with self._lock:
+            row = self._connection.execute("SELECT codec, data FROM descriptions WHERE hash = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        codec, data = row
+        if codec not in self._decompressors:
+            self._decompressors[codec] = _codec(codec)[1]
+        return self._decompressors[codec](data).decode("utf-8")
+
+    def hash_for_listing(self, listing_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT hash FROM listing_descriptions WHERE listing_id = ?", (listing_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_for_listing(self, listing_id: str) -> Optional[str]:
+        key = self.hash_for_listing(listing_id)
+        return self.get(key) if key is not None else None
+
+    def summary(self) -> str:
+        with self._lock:
+            blobs, raw, packed = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM descriptions"
+            ).fetchone()
+        ratio = f"{raw / packed:.1f}x" if packed else "n/a"
+        return (
+            f"{self.stored} new, {self.deduplicated} deduplicated this run; "
+            f"{blobs} distinct descriptions, {raw / 1048576:.1f} MiB as {packed / 1048576:.1f} MiB ({ratio})"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+
+class HashedJobRecord(JobRecord):
+    """A ``JobRecord`` whose description lives in a ``DescriptionStore``.
+
+    ``description_hash`` takes the place of ``job_description`` in the keys.
+    """
+
+    __slots__ = ()
+    _description_key = DESCRIPTION_HASH_COLUMN
+
+    def __init__(
+        self,
+        job_title: Any = None,
+        company_name: Any = None,
+        location: Any = None,
+        salary_estimated: Any = None,
+        salary_min: Any = None,
+        salary_max: Any = None,
+        description_hash: Optional[str] = None,
+        **extra: Any,
+    ):
+        super().__init__(
+            job_title, company_name, location, salary_estimated, salary_min, salary_max, description_hash, **extra
+        )
+
+    @property
+    def description_hash(self) -> Optional[str]:
+        return self._description
+
+    @property
+    def job_description(self) -> None:
+        return None
+
+    def compress_description(self) -> "HashedJobRecord":
+        return self
+
+
+def replace_description(row: Mapping[str, Any], key: Optional[str]) -> HashedJobRecord:
+    """``row`` with ``job_description`` swapped for ``description_hash`` in the same position."""
+    # ``row[name]`` rather than ``items()``: the description is never decompressed.
+    return HashedJobRecord(description_hash=key, **{name: row[name] for name in row if name != "job_description"})
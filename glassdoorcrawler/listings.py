@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+# Listings seen within this window are not scraped again by an incremental crawl.
+DEFAULT_FRESHNESS_SECONDS = 7 * 86400.0
+
+
+# Query parameters that carry the listing ID; everything else in a job link is
+# tracking (position, search id, ...) and does not identify the posting.
+LISTING_ID_PARAMS = ("jl", "jobListingId")
+
+
+def listing_id_from_url(url: str) -> str:
+    """Return the Glassdoor listing ID of a ``/job-listing/`` URL.
+
+    The ID comes from the ``jl`` (or ``jobListingId``) query parameter that search
+    results attach to every job link, so it is the same across hosts, slugs and
+    tracking parameters. Links without one fall back to their lowercased path.
+    """
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    for param in LISTING_ID_PARAMS:
+        listing_ids = query.get(param)
+        if listing_ids and listing_ids[0].isdigit():
+            return listing_ids[0]
+    return parsed.path.lower()
+
+
+class ListingIndex:
+    """SQLite index of known listings, keyed by listing ID.
+
+    Each row keeps the last URL of the listing, when it was first and last seen in
+    search results and when its job page was last scraped. An incremental crawl
+    skips listings scraped within ``freshness_seconds`` and only marks them as seen.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        freshness_seconds: float = DEFAULT_FRESHNESS_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.freshness_seconds = freshness_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Discovery and scraping run in different threads; every access holds the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            "listing_id TEXT PRIMARY KEY, "
+            "url TEXT NOT NULL, "
+            "first_seen REAL NOT NULL, "
+            "last_seen REAL NOT NULL, "
+            "last_scraped REAL)"
+        )
+        self._connection.commit()
+
+    def last_scraped(self, url: str) -> Optional[float]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_scraped FROM listings WHERE listing_id = ?",
+                (listing_id_from_url(url),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, url: str) -> bool:
+        last_scraped = self.last_scraped(url)
+        return last_scraped is not None and self._clock() - last_scraped < self.freshness_seconds
+
+    def mark_seen(self, url: str) -> None:
+        self._upsert(url, scraped=False)
+
+    def mark_scraped(self, url: str) -> None:
+        self._upsert(url, scraped=True)
+
+    def _upsert(self, url: str, scraped: bool) -> None:
+        now = self._clock()
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO listings (listing_id, url, first_seen, last_seen, last_scraped) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(listing_id) DO UPDATE SET "
+                "url = excluded.url, last_seen = excluded.last_seen, "
+                "last_scraped = COALESCE(excluded.last_scraped, listings.last_scraped)",
+                (listing_id_from_url(url), url, now, now, now if scraped else None),
+            )
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
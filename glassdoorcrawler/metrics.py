@@ -0,0 +1,255 @@
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .cache import classify_url
+
+# Upper bounds (seconds) of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+TRANSPORT_REQUESTS = "requests"
+TRANSPORT_CACHE = "cache"
+STATUS_ERROR = "error"
+
+_PROMETHEUS_PREFIX = "glassdoorcrawler"
+
+
+class Histogram:
+    """Cumulative histogram with Prometheus-style ``le`` buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        buckets = {_format_bound(bound): count for bound, count in zip(self.buckets, self.counts)}
+        buckets["+Inf"] = self.count
+        return {"count": self.count, "sum": round(self.sum, 6), "buckets": buckets}
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+class CrawlMetrics:
+    """Counters and timings of one crawl, shared by every thread of a client.
+
+    Requests are keyed by endpoint (``search``, ``bff``, ``job`` as classified by
+    ``glassdoorcrawler.cache.classify_url``), transport (``requests``,
+    ``curl_cffi:<profile>`` or ``cache``) and status code (``error`` for a request
+    that raised). Parse time is kept per extractor function and wall time per named
+    phase; ``report()`` turns it all into plain data.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, wall_clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._started_at = wall_clock()
+        self.requests: Counter = Counter()
+        self.bytes: Counter = Counter()
+        self.latency: Dict[str, Histogram] = {}
+        self.parse_calls: Counter = Counter()
+        self.parse_seconds: Dict[str, float] = {}
+        self.phases: Dict[str, float] = {}
+        self.rows = 0
+
+    def record_request(
+        self,
+        url: str,
+        transport: str,
+        status_code: Optional[int],
+        num_bytes: int = 0,
+        latency: Optional[float] = None,
+    ) -> None:
+        endpoint = classify_url(url)
+        status = STATUS_ERROR if status_code is None else str(status_code)
+        with self._lock:
+            self.requests[(endpoint, transport, status)] += 1
+            self.bytes[endpoint] += num_bytes
+            if latency is not None:
+                self.latency.setdefault(endpoint, Histogram()).observe(latency)
+
+    def record_parse(self, extractor: str, seconds: float) -> None:
+        with self._lock:
+            self.parse_calls[extractor] += 1
+            self.parse_seconds[extractor] = self.parse_seconds.get(extractor, 0.0) + seconds
+
+    def record_rows(self, count: int = 1) -> None:
+        with self._lock:
+            self.rows += count
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.add_phase(name, self._clock() - started)
+
+    def report(self) -> Dict[str, Any]:
+        """Plain-data run report, as written by ``write_json_report``."""
+        with self._lock:
+            duration = self._clock() - self._started
+            scrape_seconds = self.phases.get("scrape") or duration
+            by_endpoint: Counter = Counter()
+            by_transport: Counter = Counter()
+            by_status: Counter = Counter()
+            detail: List[Dict[str, Any]] = []
+            for (endpoint, transport, status), count in sorted(self.requests.items()):
+                by_endpoint[endpoint] += count
+                by_transport[transport] += count
+                by_status[status] += count
+                detail.append({"endpoint": endpoint, "transport": transport, "status": status, "count": count})
+            return {
+                "started_at": _isoformat(self._started_at),
+                "finished_at": _isoformat(self._started_at + duration),
+                "duration_seconds": round(duration, 6),
+                "rows": self.rows,
+                "rows_per_second": round(self.rows / scrape_seconds, 3) if scrape_seconds > 0 else 0.0,
+                "phases": {name: round(seconds, 6) for name, seconds in sorted(self.phases.items())},
+                "requests": {
+                    "total": sum(by_endpoint.values()),
+                    "by_endpoint": dict(sorted(by_endpoint.items())),
+                    "by_transport": dict(sorted(by_transport.items())),
+                    "by_status": dict(sorted(by_status.items())),
+                    "detail": detail,
+                },
+                "bytes": {"total": sum(self.bytes.values()), "by_endpoint": dict(sorted(self.bytes.items()))},
+                "latency_seconds": {
+                    endpoint: histogram.as_dict() for endpoint, histogram in sorted(self.latency.items())
+                },
+                "parse": {
+                    extractor: {"calls": calls, "seconds": round(self.parse_seconds[extractor], 6)}
+                    for extractor, calls in sorted(self.parse_calls.items())
+                },
+            }
+
+    def summary(self) -> str:
+        report = self.report()
+        return (
+            f"{report['requests']['total']} requests, {report['bytes']['total'] / 1048576:.1f} MiB, "
+            f"{report['rows']} rows at {report['rows_per_second']:.2f} rows/s"
+        )
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(timespec="seconds")
+
+
+def _write_atomically(path: str, text: str) -> None:
+    # Scrapers (and the node_exporter textfile collector) must never read a
+    # half-written file, so write next to it and rename over it.
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_json_report(report: Dict[str, Any], path: str) -> None:
+    _write_atomically(path, json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def render_prometheus(report: Dict[str, Any]) -> str:
+    """Render a run report in the Prometheus text exposition format.
+
+    Every value describes the last run only, so counts are exported as gauges.
+    """
+    lines: List[str] = []
+
+    def _metric(name: str, kind: str, help_text: str, samples: List[Tuple[str, Dict[str, Any], Any]]) -> None:
+        full_name = f"{_PROMETHEUS_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{full_name}{suffix}{_labels(labels)} {value}")
+
+    finished = datetime.fromisoformat(report["finished_at"]).timestamp()
+    _metric("last_run_timestamp_seconds", "gauge", "Unix time the last crawl finished.", [("", {}, finished)])
+    _metric("run_duration_seconds", "gauge", "Wall time of the last crawl.", [("", {}, report["duration_seconds"])])
+    _metric("rows", "gauge", "Rows scraped by the last crawl.", [("", {}, report["rows"])])
+    _metric(
+        "rows_per_second",
+        "gauge",
+        "Rows scraped per second of the scrape phase.",
+        [("", {}, report["rows_per_second"])],
+    )
+    _metric(
+        "phase_seconds",
+        "gauge",
+        "Wall time per crawl phase.",
+        [("", {"phase": name}, seconds) for name, seconds in report["phases"].items()],
+    )
+    _metric(
+        "requests",
+        "gauge",
+        "HTTP requests by endpoint, transport and status.",
+        [
+            ("", {"endpoint": item["endpoint"], "transport": item["transport"], "status": item["status"]}, item["count"])
+            for item in report["requests"]["detail"]
+        ],
+    )
+    _metric(
+        "response_bytes",
+        "gauge",
+        "Response body bytes downloaded by endpoint.",
+        [("", {"endpoint": endpoint}, count) for endpoint, count in report["bytes"]["by_endpoint"].items()],
+    )
+    latency_samples: List[Tuple[str, Dict[str, Any], Any]] = []
+    for endpoint, histogram in report["latency_seconds"].items():
+        for bound, count in histogram["buckets"].items():
+            latency_samples.append(("_bucket", {"endpoint": endpoint, "le": bound}, count))
+        latency_samples.append(("_sum", {"endpoint": endpoint}, histogram["sum"]))
+        latency_samples.append(("_count", {"endpoint": endpoint}, histogram["count"]))
+    _metric("request_latency_seconds", "histogram", "Network latency of HTTP requests by endpoint.", latency_samples)
+    _metric(
+        "parse_seconds",
+        "gauge",
+        "Time spent in each page extractor.",
+        [("", {"extractor": extractor}, item["seconds"]) for extractor, item in report["parse"].items()],
+    )
+    _metric(
+        "parse_calls",
+        "gauge",
+        "Pages handled by each extractor.",
+        [("", {"extractor": extractor}, item["calls"]) for extractor, item in report["parse"].items()],
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(report: Dict[str, Any], path: str) -> None:
+    """Write ``report`` for the node_exporter textfile collector (``*.prom``)."""
+    _write_atomically(path, render_prometheus(report))
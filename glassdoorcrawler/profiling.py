@@ -0,0 +1,258 @@
+"""Profiling mode for crawl runs (``--profile``).
+
+A sampling profiler snapshots the Python stack of every thread at a fixed
+interval and writes them in the collapsed format read by ``flamegraph.pl``,
+speedscope and similar tools, along with a breakdown of the samples by category
+(network, throttling waits, BeautifulSoup, Next.js payload scanning, output
+writing, imports). The deterministic mode additionally runs ``cProfile`` in every thread
+and writes merged ``pstats``. Parser worker processes (``--parse-workers``) are
+not profiled; their work shows up as waits in ``_parse``.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, List, Optional, Sequence, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sampling", "deterministic")
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+CATEGORY_NETWORK = "network"
+CATEGORY_WAIT = "rate limit / backoff wait"
+CATEGORY_SOUP = "BeautifulSoup parsing"
+CATEGORY_PAYLOAD = "Next.js payload scan"
+CATEGORY_EXTRACT = "page extraction (regex/JSON)"
+CATEGORY_OUTPUT = "output (pandas/openpyxl/sinks)"
+CATEGORY_IMPORT = "module imports"
+CATEGORY_OTHER = "other"
+CATEGORY_IDLE = "idle"
+CATEGORIES = (
+    CATEGORY_NETWORK,
+    CATEGORY_WAIT,
+    CATEGORY_SOUP,
+    CATEGORY_PAYLOAD,
+    CATEGORY_EXTRACT,
+    CATEGORY_OUTPUT,
+    CATEGORY_IMPORT,
+    CATEGORY_OTHER,
+    CATEGORY_IDLE,
+)
+
+_NETWORK_PATHS = ("socket.py", "ssl.py", "/http/client.py", "/urllib3/", "/requests/", "/curl_cffi/", "selectors.py")
+_SOUP_PATHS = ("/bs4/", "/html/parser.py", "_markupbase.py", "/soupsieve/", "/lxml/")
+_OUTPUT_PATHS = ("/pandas/", "/openpyxl/", "/pyarrow/", "/xlsxwriter/", "glassdoorcrawler/sinks.py")
+_IDLE_PATHS = ("threading.py", "queue.py", "/concurrent/futures/")
+_PAYLOAD_FUNCTIONS = frozenset({"_extract_next_flight_decoded_payload", "_extract_search_bootstrap_for_pagination"})
+_EXTRACT_FUNCTIONS = re.compile(r"^_(parse|extract)_")
+_WAIT_FUNCTIONS = frozenset({"_pace", "_send_with_retry"})
+
+Frame = Tuple[str, str]  # (filename, function name)
+
+
+def categorize(stack: Sequence[Frame]) -> str:
+    """Category of one sampled stack, given innermost frame first.
+
+    The innermost frame matching a rule decides, so a regex run by BeautifulSoup
+    counts as BeautifulSoup and a ``json.loads`` under the payload scanner as the
+    payload scan. Anything under the import machinery counts as imports, whatever
+    module is being imported. A stack matching nothing is idle when it is parked
+    in a lock, queue or future, and ``other`` otherwise.
+    """
+    if any(filename.startswith("<frozen importlib") for filename, _function in stack):
+        return CATEGORY_IMPORT
+    for filename, function in stack:
+        path = filename.replace(os.sep, "/")
+        if any(part in path for part in _NETWORK_PATHS):
+            return CATEGORY_NETWORK
+        if any(part in path for part in _SOUP_PATHS):
+            return CATEGORY_SOUP
+        if any(part in path for part in _OUTPUT_PATHS):
+            return CATEGORY_OUTPUT
+        if path.endswith(("glassdoorcrawler/ratelimit.py", "glassdoorcrawler/retry.py")):
+            return CATEGORY_WAIT
+        if path.endswith("glassdoorcrawler/scraper.py"):
+            # A sleeping thread has these as its innermost Python frame.
+            if function in _WAIT_FUNCTIONS:
+                return CATEGORY_WAIT
+            if function in _PAYLOAD_FUNCTIONS:
+                return CATEGORY_PAYLOAD
+            if _EXTRACT_FUNCTIONS.match(function):
+                return CATEGORY_EXTRACT
+    if stack and any(part in stack[0][0].replace(os.sep, "/") for part in _IDLE_PATHS):
+        return CATEGORY_IDLE
+    return CATEGORY_OTHER
+
+
+def _frame_label(filename: str, function: str) -> str:
+    return f"{os.path.basename(filename)}:{function}".replace(";", ":").replace(" ", "_")
+
+
+def _thread_group(name: str) -> str:
+    # Pool workers are numbered (glassdoor-job_3); fold them into one root.
+    return re.sub(r"_\d+$", "", name).replace(";", ":").replace(" ", "_")
+
+
+class StackSampler:
+    """Background thread sampling the stacks of every other thread."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()  # (thread group, frames outermost first) -> samples
+        self.categories: Counter = Counter()
+        self.threads: set = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="glassdoor-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def sample(self) -> None:
+        own_ident = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            stack: List[Frame] = []
+            while frame is not None:
+                stack.append((frame.f_code.co_filename, frame.f_code.co_name))
+                frame = frame.f_back
+            group = _thread_group(names.get(ident, str(ident)))
+            self.threads.add(ident)
+            self.categories[categorize(stack)] += 1
+            self.stacks[(group, tuple(reversed(stack)))] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def collapsed(self) -> str:
+        lines = [
+            ";".join([group, *(_frame_label(*frame) for frame in frames)]) + f" {count}"
+            for (group, frames), count in sorted(self.stacks.items())
+        ]
+        return "\n".join(lines) + "\n"
+
+    def breakdown(self) -> str:
+        total = sum(self.categories.values())
+        busy = total - self.categories[CATEGORY_IDLE]
+        lines = [
+            f"{total} samples every {self.interval * 1000:g} ms across {len(self.threads)} threads "
+            f"({busy} busy, {total - busy} idle).",
+            "",
+            f"{'category':32} {'samples':>8} {'of busy':>8}",
+        ]
+        for category in CATEGORIES:
+            count = self.categories[category]
+            share = "" if category == CATEGORY_IDLE else f"{count / busy:8.1%}" if busy else f"{0:8.1%}"
+            lines.append(f"{category:32} {count:8} {share:>8}")
+        return "\n".join(lines) + "\n"
+
+
+class _DeterministicProfiler:
+    """cProfile over every thread, merged into one ``pstats`` file."""
+
+    def __init__(self) -> None:
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        # Since 3.12 cProfile hooks sys.monitoring, which already sees every
+        # thread; older versions profile one thread per Profile object.
+        self._per_thread = sys.version_info < (3, 12)
+
+    def _new_profile(self) -> cProfile.Profile:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+        return profile
+
+    def _start_thread(self, frame: Any, event: str, arg: Any) -> None:
+        sys.setprofile(None)
+        self._new_profile()
+
+    def start(self) -> None:
+        if self._per_thread:
+            threading.setprofile(self._start_thread)
+        self._new_profile()
+
+    def stop(self) -> None:
+        if self._per_thread:
+            threading.setprofile(None)
+        for profile in self._profiles:
+            profile.disable()
+
+    def dump(self, path: str) -> None:
+        stats = pstats.Stats(self._profiles[0])
+        for profile in self._profiles[1:]:
+            try:
+                stats.add(profile)
+            except TypeError:  # a thread that never recorded a call
+                continue
+        stats.dump_stats(path)
+
+
+class CrawlProfiler:
+    """Context manager profiling the enclosed crawl into ``<prefix>.*`` files.
+
+    Writes ``<prefix>.collapsed`` (flamegraph input) and ``<prefix>.txt`` (the
+    category breakdown); the ``deterministic`` mode adds ``<prefix>.pstats``.
+    """
+
+    def __init__(self, prefix: str, mode: str = "sampling", interval: float = DEFAULT_SAMPLE_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(PROFILE_MODES)}")
+        self.prefix = prefix
+        self.mode = mode
+        self.sampler = StackSampler(interval)
+        self._deterministic = _DeterministicProfiler() if mode == "deterministic" else None
+        self._started = 0.0
+
+    @property
+    def paths(self) -> List[str]:
+        suffixes = [".collapsed", ".txt"] + ([".pstats"] if self._deterministic is not None else [])
+        return [self.prefix + suffix for suffix in suffixes]
+
+    def __enter__(self) -> "CrawlProfiler":
+        self._started = time.perf_counter()
+        # The sampler starts first so that cProfile leaves its thread alone.
+        self.sampler.start()
+        if self._deterministic is not None:
+            self._deterministic.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.sampler.stop()
+        if self._deterministic is not None:
+            self._deterministic.stop()
+        elapsed = time.perf_counter() - self._started
+
+        directory = os.path.dirname(self.prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.prefix + ".collapsed", "w", encoding="utf-8") as handle:
+            handle.write(self.sampler.collapsed())
+        breakdown = f"Profiled {elapsed:.2f}s ({self.mode}).\n" + self.sampler.breakdown()
+        with open(self.prefix + ".txt", "w", encoding="utf-8") as handle:
+            handle.write(breakdown)
+        if self._deterministic is not None:
+            self._deterministic.dump(self.prefix + ".pstats")
+        LOGGER.info("Profile written to %s.\n%s", ", ".join(self.paths), breakdown)
+
+
+def profile_prefix(output_path: str) -> str:
+    """``vagas.xlsx`` -> ``vagas.profile``: profiles land next to the results."""
+    return os.path.splitext(output_path)[0] + ".profile"
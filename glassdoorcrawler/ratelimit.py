@@ -0,0 +1,199 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``burst`` banked.
+
+    Callers that find the bucket empty reserve a future token (the balance goes
+    negative) and sleep outside the lock, so concurrent waiters are served in
+    arrival order and the long-run rate never exceeds ``rate``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be greater than or equal to 1")
+        self._rate = float(rate)
+        self._burst = float(burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate; tokens earned so far are credited at the old rate."""
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        with self._lock:
+            self._refill(self._clock())
+            self._rate = float(rate)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed. Returns the time waited in seconds."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One token bucket per host, created lazily with the same rate and burst."""
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        """Apply ``rate`` to every existing bucket and to the ones created later."""
+        with self._lock:
+            self._rate = rate
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            bucket.set_rate(rate)
+
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        if not self._rate:
+            return None
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self._rate, self._burst, clock=self._clock, sleep=self._sleep)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        bucket = self.bucket_for(url)
+        return bucket.acquire() if bucket is not None else 0.0
+
+
+class AimdRateController:
+    """Additive-increase / multiplicative-decrease control of a ``HostRateLimiter``.
+
+    Every ``increase_every`` healthy responses raise the rate by ``increase``
+    requests per second. A throttling signal (429, Cloudflare security page,
+    transport error) or a latency spike (above ``spike_factor`` times the moving
+    baseline) multiplies it by ``decrease``, at most once per ``decrease_interval``
+    seconds so a burst of in-flight failures counts as one. The rate stays within
+    ``[min_rate, max_rate]``.
+    """
+
+    def __init__(
+        self,
+        limiter: HostRateLimiter,
+        min_rate: float,
+        max_rate: float,
+        increase: float = 0.25,
+        increase_every: int = 10,
+        decrease: float = 0.5,
+        spike_factor: float = 3.0,
+        decrease_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < min_rate <= max_rate:
+            raise ValueError("expected 0 < min_rate <= max_rate")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.limiter = limiter
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.increase_every = increase_every
+        self.decrease = decrease
+        self.spike_factor = spike_factor
+        self.decrease_interval = decrease_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._healthy = 0
+        self._baseline: Optional[float] = None
+        self._samples = 0
+        self._last_decrease: Optional[float] = None
+        self.rate = min(max(limiter.rate or min_rate, min_rate), max_rate)
+        self.lowest = self.highest = self.rate
+        self.increases = 0
+        self.decreases = 0
+        limiter.set_rate(self.rate)
+
+    def observe(self, latency: Optional[float], throttled: bool = False) -> Optional[str]:
+        """Feed one response; returns the reason when the rate was cut.
+
+        ``latency`` is ``None`` for a request that failed before a response arrived.
+        """
+        with self._lock:
+            spike = (
+                latency is not None
+                and self._baseline is not None
+                and self._samples >= self.increase_every
+                and latency > self.spike_factor * self._baseline
+            )
+            if throttled or latency is None or spike:
+                reason = "throttled" if throttled else ("error" if latency is None else "latency spike")
+                return reason if self._cut() else None
+
+            self._baseline = latency if self._baseline is None else 0.9 * self._baseline + 0.1 * latency
+            self._samples += 1
+            self._healthy += 1
+            if self._healthy >= self.increase_every and self.rate < self.max_rate:
+                self._healthy = 0
+                self._set(min(self.max_rate, self.rate + self.increase))
+                self.increases += 1
+            return None
+
+    def _cut(self) -> bool:
+        now = self._clock()
+        self._healthy = 0
+        if self._last_decrease is not None and now - self._last_decrease < self.decrease_interval:
+            return False
+        self._last_decrease = now
+        self._set(max(self.min_rate, self.rate * self.decrease))
+        self.decreases += 1
+        return True
+
+    def _set(self, rate: float) -> None:
+        self.rate = rate
+        self.lowest = min(self.lowest, rate)
+        self.highest = max(self.highest, rate)
+        self.limiter.set_rate(rate)
+
+    def summary(self) -> str:
+        with self._lock:
+            return (
+                f"final {self.rate:.2f} req/s (range {self.lowest:.2f}-{self.highest:.2f}, "
+                f"{self.increases} increases, {self.decreases} decreases)"
+            )
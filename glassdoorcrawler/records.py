@@ -0,0 +1,142 @@
+"""Compact in-memory representation of a scraped job.
+
+A crawl that returns a DataFrame keeps every row until the end, so the per-row
+cost matters: a seven-key dict costs several hundred bytes before its values,
+and each page yields its own copy of strings like the company name. ``JobRecord``
+stores the fields in ``__slots__``, interns company and location, and can keep
+the description zlib-compressed until it is read. It is a read-only
+``Mapping``, so code written against the old dict rows keeps working.
+"""
+
+import sys
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+JOB_FIELDS = (
+    "job_title",
+    "company_name",
+    "location",
+    "salary_estimated",
+    "salary_min",
+    "salary_max",
+    "job_description",
+)
+_SCALAR_FIELD_SET = frozenset(JOB_FIELDS[:-1])
+_COMPRESSION_LEVEL = 6
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class JobRecord(Mapping):
+    """One scraped job; reads like the ``dict`` rows of earlier versions.
+
+    Columns added after scraping (``source_searches``, ``scraped_at``) are kept in
+    an extra mapping and follow the job fields in iteration order.
+    """
+
+    # Key of the last job field, whose value is held in ``_description``.
+    _description_key = "job_description"
+
+    __slots__ = (
+        "job_title",
+        "company_name",
+        "location",
+        "salary_estimated",
+        "salary_min",
+        "salary_max",
+        "_description",
+        "_extra",
+    )
+
+    def __init__(
+        self,
+        job_title: Any = None,
+        company_name: Any = None,
+        location: Any = None,
+        salary_estimated: Any = None,
+        salary_min: Any = None,
+        salary_max: Any = None,
+        job_description: Any = None,
+        **extra: Any,
+    ):
+        self.job_title = job_title
+        self.company_name = _intern(company_name)
+        self.location = _intern(location)
+        self.salary_estimated = salary_estimated
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        # ``bytes`` means zlib-compressed UTF-8 text.
+        self._description = job_description
+        self._extra: Optional[Dict[str, Any]] = extra or None
+
+    @classmethod
+    def from_mapping(cls, row: Mapping) -> "JobRecord":
+        if isinstance(row, cls):
+            return row
+        return cls(**row)
+
+    @property
+    def job_description(self) -> Optional[str]:
+        description = self._description
+        if isinstance(description, bytes):
+            return zlib.decompress(description).decode("utf-8")
+        return description
+
+    @property
+    def description_compressed(self) -> bool:
+        return isinstance(self._description, bytes)
+
+    def compress_description(self) -> "JobRecord":
+        """Hold the description compressed from now on; returns the record itself."""
+        if isinstance(self._description, str):
+            self._description = zlib.compress(self._description.encode("utf-8"), _COMPRESSION_LEVEL)
+        return self
+
+    def with_fields(self, **fields: Any) -> "JobRecord":
+        """Copy of the record with ``fields`` set (an untouched description stays as stored)."""
+        values: Dict[str, Any] = {name: getattr(self, name) for name in JOB_FIELDS[:-1]}
+        values[self._description_key] = self._description
+        values.update(self._extra or {})
+        values.update(fields)
+        return type(self)(**values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SCALAR_FIELD_SET or key == self._description_key:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from JOB_FIELDS[:-1]
+        yield self._description_key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(JOB_FIELDS) + len(self._extra or ())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def __reduce__(self) -> Any:
+        # Through the constructor, so strings are interned again in the receiving
+        # process (parse pool workers send records back pickled).
+        args = tuple(getattr(self, name) for name in JOB_FIELDS[:-1]) + (self._description,)
+        return (type(self), args, self._extra)
+
+    def __setstate__(self, extra: Optional[Dict[str, Any]]) -> None:
+        self._extra = extra or None
+
+
+def with_fields(row: Mapping, **fields: Any) -> Mapping:
+    """``row`` with ``fields`` added, keeping a ``JobRecord`` compact."""
+    if isinstance(row, JobRecord):
+        return row.with_fields(**fields)
+    return {**row, **fields}
@@ -0,0 +1,156 @@
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional, Set
+
+# Statuses worth another attempt: throttling and transient gateway/server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_after_seconds(response: Any, clock: Callable[[], float] = time.time) -> Optional[float]:
+    """Seconds requested by a ``Retry-After`` header (delta or HTTP date), if any."""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - clock())
+
+
+class RetryPolicy:
+    """When to retry a request and how long to wait before the next attempt.
+
+    Connection errors, timeouts, ``RETRY_STATUSES`` and Cloudflare blocks are
+    retried up to ``max_retries`` times. Waits grow exponentially from
+    ``backoff_base`` (capped at ``backoff_max``) with full jitter; a ``Retry-After``
+    header on 429/503 responses takes precedence, up to ``max_retry_after``.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        max_retry_after: float = 300.0,
+        retry_statuses: Set[int] = RETRY_STATUSES,
+        rng: Optional[random.Random] = None,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must be greater than or equal to 0")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self._rng = rng or random.Random()
+
+    def should_retry(self, status_code: Optional[int], blocked: bool = False) -> bool:
+        """``status_code`` is ``None`` for a request that raised (connection error, timeout)."""
+        return blocked or status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: Any = None) -> float:
+        """Wait before retry number ``attempt`` (1-based)."""
+        if getattr(response, "status_code", None) in (429, 503):
+            requested = retry_after_seconds(response)
+            if requested is not None:
+                return min(requested, self.max_retry_after)
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return self._rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Pauses every worker when Cloudflare blocks cluster together.
+
+    ``threshold`` blocks within ``window`` seconds open the breaker; while open,
+    ``wait()`` sleeps until ``cooldown`` seconds have passed since it opened. The
+    first request after that probes the site: a success closes the breaker, a
+    block opens it again at once.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        window: float = 60.0,
+        cooldown: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if threshold < 1:
+            raise ValueError("threshold must be greater than or equal to 1")
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._blocks: List[float] = []
+        self._open_until: Optional[float] = None
+        self._half_open = False
+        self.trips = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._open_until is not None and self._clock() < self._open_until
+
+    def wait(self) -> float:
+        """Sleep while the breaker is open. Returns the time waited in seconds."""
+        waited = 0.0
+        # Another worker may reopen the breaker while this one sleeps; check again.
+        while True:
+            with self._lock:
+                wait = self._open_until - self._clock() if self._open_until is not None else 0.0
+            if wait <= 0:
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+    def record_block(self) -> bool:
+        """Count a block; returns ``True`` when it opened the breaker."""
+        with self._lock:
+            now = self._clock()
+            self._blocks = [at for at in self._blocks if now - at < self.window]
+            self._blocks.append(now)
+            if self._open_until is not None and now < self._open_until:
+                return False
+            if self._half_open or len(self._blocks) >= self.threshold:
+                self._open_until = now + self.cooldown
+                self._half_open = True
+                self._blocks = []
+                self.trips += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._open_until is not None and self._clock() >= self._open_until:
+                self._open_until = None
+                self._half_open = False
+
+
+class RetryStats:
+    """Per-run URL counters: retried at least once, recovered after retrying, abandoned."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retried: Set[str] = set()
+        self.recovered: Set[str] = set()
+        self.abandoned: Set[str] = set()
+
+    def record(self, outcome: str, url: str) -> None:
+        with self._lock:
+            getattr(self, outcome).add(url)
+
+    def summary(self) -> str:
+        with self._lock:
+            return (
+                f"{len(self.retried)} URLs retried, {len(self.recovered)} recovered, "
+                f"{len(self.abandoned)} abandoned"
+            )
@@ -0,0 +1,256 @@
+"""Typed columnar schema for the Parquet and Arrow IPC outputs.
+
+Scraped rows keep salaries as the text found on the page ("R$ 7.500 /mes") or
+the JSON-LD number. The columnar outputs convert them to ``float64`` amounts with
+separate currency and period columns, dictionary-encode the low-cardinality
+strings (company, location, currency, period) and add a ``scraped_at``
+timestamp, so the files load into analytics tools without re-parsing.
+"""
+
+import math
+import re
+import unicodedata
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .descriptions import DESCRIPTION_HASH_COLUMN
+
+SALARY_PERIODS = ("hour", "day", "week", "month", "year")
+
+# Symbols are matched longest first, so "R$" wins over "$".
+_CURRENCY_SYMBOLS = (
+    ("US$", "USD"),
+    ("R$", "BRL"),
+    ("CA$", "CAD"),
+    ("C$", "CAD"),
+    ("A$", "AUD"),
+    ("€", "EUR"),
+    ("£", "GBP"),
+    ("₹", "INR"),
+    ("$", "USD"),
+)
+_CURRENCY_CODES = frozenset(
+    {"ARS", "AUD", "BRL", "CAD", "CHF", "CLP", "COP", "EUR", "GBP", "INR", "JPY", "MXN", "PEN", "USD"}
+)
+_CURRENCY_CODE_RE = re.compile(r"\b([A-Z]{3})\b")
+_AMOUNT_RE = re.compile(r"(\d(?:[\d.,  ]*\d)?)\s*(mil|mi|k|m)?(?![a-z])", re.IGNORECASE)
+_MULTIPLIERS = {"mil": 1e3, "k": 1e3, "mi": 1e6, "m": 1e6}
+_PERIOD_PATTERNS = (
+    ("hour", re.compile(r"/\s*(h|hr|hora|hour)\b|\b(por|per|an|a)\s+(hora|hour)\b")),
+    ("day", re.compile(r"/\s*(dia|day)\b|\b(por|per|a)\s+(dia|day)\b")),
+    ("week", re.compile(r"/\s*(semana|sem|week|wk)\b|\b(por|per|a)\s+(semana|week)\b")),
+    ("month", re.compile(r"/\s*(mes|month|mo)\b|\b(por|per|a)\s+(mes|month)\b|\bmensal|\bmonthly")),
+    ("year", re.compile(r"/\s*(ano|year|yr|a)\b|\b(por|per|a)\s+(ano|year)\b|\banual|\bannual|\byearly")),
+)
+
+# Columns every typed output carries, in order; other row keys follow as strings.
+TYPED_COLUMNS = (
+    "job_title",
+    "company_name",
+    "location",
+    "salary_estimated",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "salary_period",
+    "salary_text",
+    "job_description",
+    "scraped_at",
+)
+_DICTIONARY_COLUMNS = ("company_name", "location", "salary_currency", "salary_period")
+_NUMERIC_COLUMNS = ("salary_estimated", "salary_min", "salary_max")
+_SALARY_SOURCE_FIELDS = ("salary_estimated", "salary_min", "salary_max")
+
+
+def _to_number(digits: str) -> Optional[float]:
+    digits = digits.replace(" ", "").replace(" ", "")
+    if "," in digits and "." in digits:
+        decimal = "," if digits.rfind(",") > digits.rfind(".") else "."
+    elif "," in digits or "." in digits:
+        separator = "," if "," in digits else "."
+        groups = digits.split(separator)
+        # "5.000" and "1.250.000" group thousands; "5,5" and "7.25" have decimals.
+        decimal = None if len(groups) > 2 or len(groups[-1]) == 3 else separator
+    else:
+        decimal = None
+    thousands = {",", "."} - {decimal}
+    for separator in thousands:
+        digits = digits.replace(separator, "")
+    if decimal is not None:
+        digits = digits.replace(decimal, ".")
+    try:
+        return float(digits)
+    except ValueError:
+        return None
+
+
+def parse_salary_amount(value: Any) -> Optional[float]:
+    """First amount in a salary value: ``"R$ 7.500 /mes"`` -> 7500.0, ``"$85K"`` -> 85000.0."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return None if isinstance(value, float) and math.isnan(value) else float(value)
+    match = _AMOUNT_RE.search(str(value))
+    if match is None:
+        return None
+    amount = _to_number(match.group(1))
+    if amount is None:
+        return None
+    suffix = (match.group(2) or "").lower()
+    return amount * _MULTIPLIERS.get(suffix, 1.0)
+
+
+def parse_salary_currency(value: Any) -> Optional[str]:
+    """ISO 4217 code of a salary text (``"R$ 5.000"`` -> ``"BRL"``), if recognisable."""
+    if not isinstance(value, str):
+        return None
+    for code in _CURRENCY_CODE_RE.findall(value):
+        if code in _CURRENCY_CODES:
+            return code
+    for symbol, code in _CURRENCY_SYMBOLS:
+        if symbol in value:
+            return code
+    return None
+
+
+def parse_salary_period(value: Any) -> Optional[str]:
+    """Pay period of a salary text (``"R$ 7.500 /mes"`` -> ``"month"``), if stated."""
+    if not isinstance(value, str):
+        return None
+    text = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii").lower()
+    for period, pattern in _PERIOD_PATTERNS:
+        if pattern.search(text):
+            return period
+    return None
+
+
+def _first(values: Iterable[Optional[str]]) -> Optional[str]:
+    return next((value for value in values if value is not None), None)
+
+
+def _parse_timestamp(value: Any, default: datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return default
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return default
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def typed_values(row: Dict[str, Any], default_scraped_at: datetime) -> Dict[str, Any]:
+    """Column values of one row under the typed schema (extra keys are kept as is)."""
+    salary_fields = [row.get(field) for field in _SALARY_SOURCE_FIELDS]
+    values = {key: value for key, value in row.items() if key not in TYPED_COLUMNS}
+    estimated = row.get("salary_estimated")
+    values.update(
+        {
+            "job_title": row.get("job_title"),
+            "company_name": row.get("company_name"),
+            "location": row.get("location"),
+            "salary_estimated": parse_salary_amount(estimated),
+            "salary_min": parse_salary_amount(row.get("salary_min")),
+            "salary_max": parse_salary_amount(row.get("salary_max")),
+            "salary_currency": row.get("salary_currency") or _first(map(parse_salary_currency, salary_fields)),
+            "salary_period": row.get("salary_period") or _first(map(parse_salary_period, salary_fields)),
+            "salary_text": row.get("salary_text") or (estimated if isinstance(estimated, str) else None),
+            "job_description": row.get("job_description"),
+            "scraped_at": _parse_timestamp(row.get("scraped_at"), default_scraped_at),
+        }
+    )
+    return values
+
+
+def _as_text(value: Any) -> Optional[str]:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+class ArrowBatchEncoder:
+    """Turns batches of scraped rows into Arrow record batches of one fixed schema.
+
+    The schema is fixed by the first batch: the ``TYPED_COLUMNS`` followed by any
+    other keys of its rows as strings (keys first seen later are dropped). Rows
+    whose description went to a ``DescriptionStore`` get ``description_hash`` in
+    place of ``job_description``.
+    With ``cumulative_dictionaries`` (what the Arrow IPC file format needs) each
+    dictionary column keeps one growing dictionary for the whole file: only the
+    values first seen in a batch are converted and appended, and the IPC writer
+    sends just those as a dictionary delta. Without it every batch is
+    dictionary-encoded on its own, which suits Parquet, where each column chunk
+    stores its own dictionary. Requires ``pyarrow``.
+    """
+
+    def __init__(self, cumulative_dictionaries: bool = True) -> None:
+        import pyarrow
+
+        self._pa = pyarrow
+        self.schema: Optional[Any] = None
+        self.cumulative_dictionaries = cumulative_dictionaries
+        self._dictionaries: Dict[str, Tuple[Any, Dict[str, int]]] = {
+            column: (pyarrow.array([], type=pyarrow.string()), {}) for column in _DICTIONARY_COLUMNS
+        }
+
+    def _build_schema(self, rows: List[Dict[str, Any]]) -> Any:
+        pa = self._pa
+        types = {
+            "job_title": pa.string(),
+            "salary_text": pa.string(),
+            "job_description": pa.string(),
+            "scraped_at": pa.timestamp("ms", tz="UTC"),
+            **{column: pa.float64() for column in _NUMERIC_COLUMNS},
+            **{column: pa.dictionary(pa.int32(), pa.string()) for column in _DICTIONARY_COLUMNS},
+        }
+        extra = list(dict.fromkeys(key for row in rows for key in row if key not in TYPED_COLUMNS))
+        columns = list(TYPED_COLUMNS)
+        if DESCRIPTION_HASH_COLUMN in extra:
+            # Descriptions live in a side store; the hash takes their place.
+            columns[columns.index("job_description")] = extra.pop(extra.index(DESCRIPTION_HASH_COLUMN))
+            types[DESCRIPTION_HASH_COLUMN] = pa.string()
+        fields = [pa.field(name, types[name]) for name in columns]
+        return pa.schema(fields + [pa.field(name, pa.string()) for name in extra])
+
+    def _dictionary_array(self, column: str, values: List[Optional[str]]) -> Any:
+        pa = self._pa
+        if not self.cumulative_dictionaries:
+            return pa.array(values, type=pa.string()).dictionary_encode()
+        dictionary, positions = self._dictionaries[column]
+        indices: List[Optional[int]] = []
+        new_values: List[str] = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            index = positions.get(value)
+            if index is None:
+                index = positions[value] = len(positions)
+                new_values.append(value)
+            indices.append(index)
+        if new_values:
+            dictionary = pa.concat_arrays([dictionary, pa.array(new_values, type=pa.string())])
+            self._dictionaries[column] = (dictionary, positions)
+        return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()), dictionary)
+
+    def encode(self, rows: List[Dict[str, Any]]) -> Any:
+        pa = self._pa
+        if self.schema is None:
+            self.schema = self._build_schema(rows)
+        now = datetime.now(timezone.utc)
+        typed = [typed_values(row, now) for row in rows]
+        arrays = []
+        for field in self.schema:
+            values = [row.get(field.name) for row in typed]
+            if field.name in _DICTIONARY_COLUMNS:
+                arrays.append(self._dictionary_array(field.name, [_as_text(value) for value in values]))
+            elif pa.types.is_string(field.type):
+                arrays.append(pa.array([_as_text(value) for value in values], type=field.type))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
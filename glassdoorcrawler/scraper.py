@@ -1,23 +1,83 @@
+import bisect
+import functools
+import html as html_lib
 import json
 import logging
+import os
+import queue
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-import numpy as np
-import pandas as pd
-import progressbar
 import requests
-from bs4 import BeautifulSoup
-from requests import Response, Session
+
+from .cache import CachedResponse, ResponseCache
+from .descriptions import DescriptionStore, replace_description
+from .listings import DEFAULT_FRESHNESS_SECONDS, LISTING_ID_PARAMS, ListingIndex, listing_id_from_url
+from .metrics import (
+    TRANSPORT_CACHE,
+    TRANSPORT_REQUESTS,
+    CrawlMetrics,
+    write_json_report,
+    write_prometheus_textfile,
+)
+from .ratelimit import AimdRateController, HostRateLimiter
+from .retry import CircuitBreaker, RetryPolicy, RetryStats
+from .records import JobRecord, with_fields
+from .schema import utc_now_iso
+from .sinks import (
+    DEFAULT_BATCH_SIZE,
+    TYPED_FORMATS,
+    JsonlSink,
+    convert_to_excel,
+    is_excel_path,
+    iter_jsonl,
+    open_sink,
+    sink_format_for_path,
+)
+from .state import CrawlState, PaginationStrategyStore, TransportStore
+
+# pandas, bs4, progressbar and curl_cffi are imported where they are first needed,
+# so the CLI, short runs and parser worker processes don't pay for them up front.
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import pandas as pd
+    from bs4 import BeautifulSoup
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    from curl_cffi import requests as curl_requests
-except ImportError:  # pragma: no cover - optional runtime dependency
-    curl_requests = None
+
+@functools.lru_cache(maxsize=None)
+def _curl_cffi() -> Tuple[Any, Any]:
+    """``(curl_cffi.requests, CurlError)``, or ``(None, None)`` without curl_cffi."""
+    try:
+        from curl_cffi import CurlError
+        from curl_cffi import requests as curl_requests
+    except ImportError:  # pragma: no cover - optional runtime dependency
+        return None, None
+    return curl_requests, CurlError
+
+
+def _curl_requests() -> Any:
+    return _curl_cffi()[0]
+
+
+def _transient_errors() -> Tuple[type, ...]:
+    """Errors raised by either transport that are worth retrying (connection, timeout)."""
+    curl_error = _curl_cffi()[1]
+    return (requests.RequestException,) + ((curl_error,) if curl_error is not None else ())
+
+
+def _soup(markup: str) -> "BeautifulSoup":
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(markup, "html.parser")
+
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -29,18 +89,94 @@ DEFAULT_HEADERS = {
 }
 
 FALLBACK_IMPERSONATE_PROFILES = ("chrome124", "safari184")
+
+# Current Jobs Next pages often react to query-based pagination in SSR/hydration,
+# while legacy pages used path suffixes like _P2.htm / _IP2.htm. Probed in this
+# order unless a scheme was learned for the search (see ``PaginationStrategyStore``).
+PAGINATION_SCHEMES = ("query_page", "query_p", "path_ip", "path_p", "legacy_query")
 JOB_SEARCH_RESULTS_BFF_URL = "https://www.glassdoor.com.br/job-search-next/bff/jobSearchResultsQuery"
+# Checkpoint key prefix for the shared row ledger of a multi-search crawl.
+_BATCH_STATE_PREFIX = "batch:"
 
 
 class _HttpClient:
-    """HTTP client with optional Cloudflare fallback via curl_cffi."""
+    """HTTP client with optional Cloudflare fallback via curl_cffi.
+
+    Every outgoing request (including each curl_cffi impersonation attempt) takes a
+    token from the per-host ``rate_limiter`` when one is configured. With a
+    ``cache``, fresh entries are answered from disk without touching the network.
+
+    The curl_cffi fallback is tracked per host: once a profile gets past the
+    Cloudflare security page, later requests to that host go straight to it. A
+    ``transport_store`` carries those profiles and the cookie jar across runs.
+
+    A ``parse_pool`` travels with the client so that the fetch helpers hand the
+    downloaded HTML to worker processes instead of parsing it under the GIL.
+
+    ``origin`` (e.g. ``http://127.0.0.1:8765``) replaces the scheme and host of
+    every request, which points the whole crawl at a local stand-in server.
 
-    def __init__(self, use_env_proxies: bool = True):
+    Network attempts that fail transiently are retried according to
+    ``retry_policy``; Cloudflare blocks feed the ``circuit_breaker``, which holds
+    every thread of the client while it is open. ``retry_stats`` counts the URLs
+    that were retried, recovered or abandoned.
+
+    A ``rate_controller`` is fed the latency of every network attempt (excluding
+    the time spent waiting for a rate limit token) and whether it was throttled,
+    and retunes the ``rate_limiter`` from that.
+
+    ``metrics`` counts every network attempt and cache hit by endpoint, transport
+    and status, with body bytes and latency, plus the time spent in each parser.
+    """
+
+    def __init__(
+        self,
+        use_env_proxies: bool = True,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        transport_store: Optional[TransportStore] = None,
+        parse_pool: Optional["ProcessPoolExecutor"] = None,
+        origin: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_controller: Optional[AimdRateController] = None,
+        metrics: Optional[CrawlMetrics] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         self._use_env_proxies = use_env_proxies
+        self._origin = urlparse(origin) if origin else None
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.retry_stats = RetryStats()
+        self._sleep = sleep
+        self.rate_limiter = rate_limiter
+        self.rate_controller = rate_controller
+        self.metrics = metrics or CrawlMetrics()
+        # Seconds the current thread spent waiting for rate limit tokens in the
+        # attempt being timed, so the controller sees network latency only.
+        self._waited = threading.local()
+        self.cache = cache
+        self.parse_pool = parse_pool
+        self._transport_store = transport_store
         self._requests_session = requests.Session()
         self._requests_session.trust_env = use_env_proxies
-        self._curl_session = None
-        self._prefer_curl = False
+        # curl_cffi sessions are not safe to share between threads, so each worker
+        # thread gets its own; all of them are tracked so close() can release them.
+        self._curl_local = threading.local()
+        self._curl_sessions: List[Any] = []
+        self._lock = threading.Lock()
+        self._curl_profiles: Dict[str, str] = {}
+        self._saved_cookies: List[Dict[str, Any]] = []
+
+        if transport_store is not None:
+            self._curl_profiles.update(transport_store.profiles)
+            self._saved_cookies = list(transport_store.cookies)
+            _set_cookies(self._requests_session.cookies, self._saved_cookies)
+            if self._curl_profiles:
+                LOGGER.info(
+                    "Using saved curl_cffi transport for %s.",
+                    ", ".join(f"{host} ({profile})" for host, profile in sorted(self._curl_profiles.items())),
+                )
 
     def _is_cloudflare_security_page(self, response: Any) -> bool:
         text = getattr(response, "text", "") or ""
@@ -52,6 +188,39 @@ class _HttpClient:
             and "Security | Glassdoor" in text
         )
 
+    def _acquire(self, url: str) -> None:
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(url)
+            self._waited.seconds = getattr(self._waited, "seconds", 0.0) + waited
+
+    def _timed_request(self, transport: str, url: str, request: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        try:
+            response = request(*args, **kwargs)
+        except _transient_errors():
+            self.metrics.record_request(url, transport, None, latency=time.monotonic() - started)
+            raise
+        self.metrics.record_request(
+            url,
+            transport,
+            response.status_code,
+            _body_size(response),
+            time.monotonic() - started,
+        )
+        return response
+
+    def _observe(self, started: float, response: Any, blocked: bool) -> None:
+        controller = self.rate_controller
+        if controller is None:
+            return
+        latency = None
+        if response is not None:
+            latency = max(0.0, time.monotonic() - started - getattr(self._waited, "seconds", 0.0))
+        previous = controller.rate
+        reason = controller.observe(latency, throttled=blocked or getattr(response, "status_code", None) == 429)
+        if reason is not None:
+            LOGGER.info("Adaptive rate: %.2f -> %.2f req/s (%s).", previous, controller.rate, reason)
+
     def _curl_proxies(self) -> Optional[Dict[str, str]]:
         if self._use_env_proxies:
             return None
@@ -59,11 +228,17 @@ class _HttpClient:
         return {"http": "", "https": ""}
 
     def _ensure_curl_session(self) -> Any:
+        curl_requests = _curl_requests()
         if curl_requests is None:
             raise RuntimeError("curl_cffi is not installed")
-        if self._curl_session is None:
-            self._curl_session = curl_requests.Session()
-        return self._curl_session
+        session = getattr(self._curl_local, "session", None)
+        if session is None:
+            session = curl_requests.Session()
+            _set_cookies(session.cookies, self._saved_cookies)
+            self._curl_local.session = session
+            with self._lock:
+                self._curl_sessions.append(session)
+        return session
 
     def _request_with_curl(
         self,
@@ -76,8 +251,11 @@ class _HttpClient:
         last_response = None
         session = self._ensure_curl_session()
         proxies = self._curl_proxies()
+        host = _host_of(url)
+        preferred_profile = self._curl_profiles.get(host)
+        profiles = sorted(FALLBACK_IMPERSONATE_PROFILES, key=lambda profile: profile != preferred_profile)
 
-        for profile in FALLBACK_IMPERSONATE_PROFILES:
+        for profile in profiles:
             kwargs: Dict[str, Any] = {
                 "headers": headers,
                 "timeout": timeout,
@@ -88,17 +266,23 @@ class _HttpClient:
             if proxies is not None:
                 kwargs["proxies"] = proxies
 
-            response = session.request(method, url, **kwargs)
+            self._acquire(url)
+            response = self._timed_request(f"curl_cffi:{profile}", url, session.request, method, url, **kwargs)
             last_response = response
             if response.status_code < 400 or not self._is_cloudflare_security_page(response):
-                if not self._prefer_curl:
-                    LOGGER.info("Enabled curl_cffi fallback transport (%s) after Cloudflare block.", profile)
-                self._prefer_curl = True
+                with self._lock:
+                    if self._curl_profiles.get(host) != profile:
+                        LOGGER.info(
+                            "Enabled curl_cffi fallback transport (%s) for %s after Cloudflare block.",
+                            profile,
+                            host,
+                        )
+                    self._curl_profiles[host] = profile
                 return response
 
         return last_response
 
-    def _request(
+    def _send(
         self,
         method: str,
         url: str,
@@ -106,7 +290,7 @@ class _HttpClient:
         timeout: int,
         json_payload: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        if self._prefer_curl and curl_requests is not None:
+        if _host_of(url) in self._curl_profiles and _curl_requests() is not None:
             return self._request_with_curl(
                 method,
                 url,
@@ -115,14 +299,18 @@ class _HttpClient:
                 json_payload=json_payload,
             )
 
-        response = self._requests_session.request(
+        self._acquire(url)
+        response = self._timed_request(
+            TRANSPORT_REQUESTS,
+            url,
+            self._requests_session.request,
             method,
             url,
             headers=headers,
             timeout=timeout,
             json=json_payload,
         )
-        if self._is_cloudflare_security_page(response) and curl_requests is not None:
+        if self._is_cloudflare_security_page(response) and _curl_requests() is not None:
             LOGGER.warning("Cloudflare security page detected for %s; retrying with curl_cffi.", url)
             return self._request_with_curl(
                 method,
@@ -133,6 +321,99 @@ class _HttpClient:
             )
         return response
 
+    def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: int,
+        json_payload: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        attempt = 1
+        while True:
+            if breaker is not None:
+                breaker.wait()
+            response = None
+            self._waited.seconds = 0.0
+            started = time.monotonic()
+            try:
+                response = self._send(method, url, headers=headers, timeout=timeout, json_payload=json_payload)
+            except _transient_errors() as exc:
+                self._observe(started, None, False)
+                if policy is None or attempt > policy.max_retries:
+                    if attempt > 1:
+                        self.retry_stats.record("abandoned", url)
+                    raise
+                reason = str(exc)
+            else:
+                blocked = self._is_cloudflare_security_page(response)
+                self._observe(started, response, blocked)
+                if breaker is not None:
+                    if blocked and breaker.record_block():
+                        LOGGER.warning(
+                            "Cloudflare blocks are clustering; pausing all requests for %.0f seconds.",
+                            breaker.cooldown,
+                        )
+                    elif not blocked:
+                        breaker.record_success()
+                if policy is None or not policy.should_retry(response.status_code, blocked):
+                    if attempt > 1:
+                        self.retry_stats.record("recovered" if response.status_code < 400 else "abandoned", url)
+                    return response
+                if attempt > policy.max_retries:
+                    self.retry_stats.record("abandoned", url)
+                    return response
+                reason = "Cloudflare block" if blocked else f"HTTP {response.status_code}"
+
+            delay = policy.delay(attempt, response)
+            self.retry_stats.record("retried", url)
+            LOGGER.info(
+                "Retrying %s in %.1fs (attempt %s of %s): %s.",
+                url,
+                delay,
+                attempt + 1,
+                policy.max_retries + 1,
+                reason,
+            )
+            self._sleep(delay)
+            attempt += 1
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: int,
+        json_payload: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        if self._origin is not None:
+            url = urlunparse(urlparse(url)._replace(scheme=self._origin.scheme, netloc=self._origin.netloc))
+        if self.cache is None:
+            return self._send_with_retry(method, url, headers=headers, timeout=timeout, json_payload=json_payload)
+
+        key = self.cache.key(method, url, json_payload)
+        entry = self.cache.load(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record("hits")
+            response = CachedResponse(entry)
+            self.metrics.record_request(url, TRANSPORT_CACHE, response.status_code, _body_size(response))
+            return response
+        if entry is not None:
+            headers = {**headers, **self.cache.validators(entry)}
+
+        response = self._send_with_retry(method, url, headers=headers, timeout=timeout, json_payload=json_payload)
+        if entry is not None and response.status_code == 304:
+            self.cache.record("revalidated")
+            self.cache.refresh(key, entry)
+            return CachedResponse(entry)
+
+        self.cache.record("misses")
+        if 200 <= response.status_code < 300:
+            self.cache.store(key, method, url, response)
+        return response
+
     def get(self, url: str, headers: Dict[str, str], timeout: int) -> Any:
         return self._request("GET", url, headers=headers, timeout=timeout)
 
@@ -151,17 +432,107 @@ class _HttpClient:
             json_payload=json_payload,
         )
 
+    def _collect_cookies(self, curl_sessions: List[Any]) -> List[Dict[str, Any]]:
+        merged: Dict[tuple, Dict[str, Any]] = {}
+        jars = [self._requests_session.cookies] + [curl_session.cookies.jar for curl_session in curl_sessions]
+        for jar in jars:
+            for cookie in jar:
+                merged[(cookie.domain, cookie.path, cookie.name)] = {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "expires": cookie.expires,
+                }
+        return list(merged.values())
+
     def close(self) -> None:
+        with self._lock:
+            curl_sessions, self._curl_sessions = self._curl_sessions, []
+        if self._transport_store is not None:
+            try:
+                self._transport_store.save(self._curl_profiles, self._collect_cookies(curl_sessions))
+            except OSError as exc:
+                LOGGER.warning("Could not save transport state to %s: %s", self._transport_store.path, exc)
         self._requests_session.close()
-        if self._curl_session is not None:
+        for curl_session in curl_sessions:
             try:
-                self._curl_session.close()
+                curl_session.close()
             except Exception:  # pragma: no cover - defensive cleanup
                 pass
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=True, cancel_futures=True)
+            self.parse_pool = None
+
+
+def _body_size(response: Any) -> int:
+    content = getattr(response, "content", None)
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _set_cookies(jar: Any, cookies: List[Dict[str, Any]]) -> None:
+    for cookie in cookies:
+        jar.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+
 
+def _start_parse_pool(parse_workers: int) -> "ProcessPoolExecutor":
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
 
-def _build_session(use_env_proxies: bool = True) -> _HttpClient:
-    return _HttpClient(use_env_proxies=use_env_proxies)
+    # "spawn" keeps the workers independent of the crawler's threads and locks.
+    return ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _build_session(
+    use_env_proxies: bool = True,
+    requests_per_second: Optional[float] = None,
+    burst: int = 1,
+    cache_dir: Optional[str] = None,
+    cache_ttls: Optional[Dict[str, float]] = None,
+    transport_state: Optional[str] = None,
+    parse_workers: int = 0,
+    origin: Optional[str] = None,
+    max_retries: int = 3,
+    backoff_base: float = 1.0,
+    breaker_threshold: int = 5,
+    breaker_cooldown: float = 120.0,
+    adaptive_rate: Optional[Tuple[float, float]] = None,
+    metrics: Optional[CrawlMetrics] = None,
+) -> _HttpClient:
+    if adaptive_rate is not None and not requests_per_second:
+        requests_per_second = adaptive_rate[0]
+    rate_limiter = HostRateLimiter(requests_per_second, burst=burst) if requests_per_second else None
+    rate_controller = AimdRateController(rate_limiter, *adaptive_rate) if adaptive_rate is not None else None
+    cache = ResponseCache(cache_dir, ttls=cache_ttls) if cache_dir else None
+    transport_store = TransportStore(transport_state) if transport_state else None
+    parse_pool = _start_parse_pool(parse_workers) if parse_workers > 0 else None
+    return _HttpClient(
+        use_env_proxies=use_env_proxies,
+        rate_limiter=rate_limiter,
+        cache=cache,
+        transport_store=transport_store,
+        parse_pool=parse_pool,
+        origin=origin,
+        retry_policy=RetryPolicy(max_retries=max_retries, backoff_base=backoff_base) if max_retries else None,
+        circuit_breaker=CircuitBreaker(threshold=breaker_threshold, cooldown=breaker_cooldown),
+        rate_controller=rate_controller,
+        metrics=metrics,
+    )
+
+
+def _pace(session: Optional[Any], delay_seconds: float) -> None:
+    # Rate-limited clients pace themselves; the fixed sleep is only kept for callers
+    # that pass a plain session (or none) to the public helpers.
+    if getattr(session, "rate_limiter", None) is None:
+        time.sleep(delay_seconds)
+
+
+def _requests_per_second_from_delay(delay_seconds: float) -> Optional[float]:
+    return 1.0 / delay_seconds if delay_seconds > 0 else None
 
 
 def _get(
@@ -175,27 +546,62 @@ def _get(
     return response
 
 
-def _extract_page_state(body: Optional[BeautifulSoup]) -> Optional[Dict[str, Any]]:
+def _parse(session: Optional[Any], parser: Callable[..., Any], *args: Any) -> Any:
+    """Run ``parser(*args)`` in the session's parse pool, or inline without one.
+
+    Parsers are module-level functions taking and returning plain data, so they
+    pickle cleanly to and from the worker processes. The time spent (including the
+    hand-off to a worker) is recorded per parser in the session's ``metrics``.
+    """
+    parse_pool = getattr(session, "parse_pool", None)
+    metrics = getattr(session, "metrics", None)
+    started = time.perf_counter()
+    if parse_pool is None:
+        result = parser(*args)
+    else:
+        result = parse_pool.submit(parser, *args).result()
+    if metrics is not None:
+        metrics.record_parse(parser.__name__, time.perf_counter() - started)
+    return result
+
+
+def _page_state_from_script(text: str) -> Optional[Dict[str, Any]]:
+    if not text or "initialState" not in text or "=" not in text:
+        return None
+    try:
+        data = json.loads(text[text.index("=") + 1 :].rstrip(";"))
+    except (ValueError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) and "initialState" in data else None
+
+
+def _job_posting_from_jsonld_script(text: str) -> Optional[Dict[str, Any]]:
+    if not text:
+        return None
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    items = payload if isinstance(payload, list) else [payload]
+    for item in items:
+        if isinstance(item, dict) and item.get("@type") == "JobPosting":
+            return item
+    return None
+
+
+def _extract_page_state(body: Optional["BeautifulSoup"]) -> Optional[Dict[str, Any]]:
     if body is None:
         return None
 
     for script in body.find_all("script"):
-        text = script.get_text(strip=True)
-        if not text or "initialState" not in text or "=" not in text:
-            continue
-
-        try:
-            payload = text[text.index("=") + 1 :].rstrip(";")
-            data = json.loads(payload)
-            if isinstance(data, dict) and "initialState" in data:
-                return data
-        except (ValueError, json.JSONDecodeError):
-            continue
+        data = _page_state_from_script(script.get_text(strip=True))
+        if data is not None:
+            return data
 
     return None
 
 
-def _extract_next_flight_decoded_payload(soup: BeautifulSoup) -> Optional[str]:
+def _extract_next_flight_decoded_payload(soup: "BeautifulSoup") -> Optional[str]:
     for script in soup.find_all("script"):
         text = script.string or script.get_text() or ""
         if "paginationCursors" not in text or "self.__next_f.push" not in text:
@@ -222,7 +628,7 @@ def _map_location_type_for_bff(location_type: str) -> str:
     }.get(location_type, location_type)
 
 
-def _extract_search_bootstrap_for_pagination(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+def _extract_search_bootstrap_for_pagination(soup: "BeautifulSoup") -> Optional[Dict[str, Any]]:
     decoded = _extract_next_flight_decoded_payload(soup)
     if not decoded:
         return None
@@ -269,23 +675,23 @@ def _extract_search_bootstrap_for_pagination(soup: BeautifulSoup) -> Optional[Di
     }
 
 
-def _extract_job_links_from_search_soup(soup: BeautifulSoup) -> List[str]:
+def _extract_job_links_from_search_soup(soup: "BeautifulSoup", base_url: Optional[str] = None) -> List[str]:
     links: List[str] = []
 
     # Legacy selector kept for backward compatibility (older Glassdoor markup).
     for anchor in soup.find_all("a", class_="jobLink"):
         href = anchor.get("href")
         if href and _is_job_listing_href(href):
-            links.append(_normalize_job_link(href))
+            links.append(_normalize_job_link(href, base_url))
 
     # Fallback for current markup: scan all anchors and keep canonical job-listing URLs.
     if not links:
         for anchor in soup.find_all("a", href=True):
             href = anchor["href"]
             if _is_job_listing_href(href):
-                links.append(_normalize_job_link(href))
+                links.append(_normalize_job_link(href, base_url))
 
-    return list(dict.fromkeys(links))
+    return _dedupe_job_links(links, base_url)
 
 
 def _get_search_page_links_and_bootstrap(
@@ -293,8 +699,16 @@ def _get_search_page_links_and_bootstrap(
     session: Optional[Any] = None,
 ) -> tuple[List[str], Optional[Dict[str, Any]]]:
     response = _get(url, session=session)
-    soup = BeautifulSoup(response.text, "html.parser")
-    return _extract_job_links_from_search_soup(soup), _extract_search_bootstrap_for_pagination(soup)
+    return _parse(session, _parse_search_page, response.text, url)
+
+
+def _parse_search_page(html: str, url: str) -> tuple[List[str], Optional[Dict[str, Any]]]:
+    soup = _soup(html)
+    return _extract_job_links_from_search_soup(soup, url), _extract_search_bootstrap_for_pagination(soup)
+
+
+def _parse_search_page_links(html: str, url: str) -> List[str]:
+    return _extract_job_links_from_search_soup(_soup(html), url)
 
 
 def _get_links_from_bff_page(
@@ -354,6 +768,7 @@ def _get_links_from_bff_page(
     job_listings_section = (data_section or {}).get("jobListings", {})
     items = job_listings_section.get("jobListings", []) if isinstance(job_listings_section, dict) else []
 
+    search_url = bootstrap.get("absolute_url") or JOB_SEARCH_RESULTS_BFF_URL
     links: List[str] = []
     for item in items:
         if not isinstance(item, dict):
@@ -361,34 +776,48 @@ def _get_links_from_bff_page(
         header = ((item.get("jobview") or {}).get("header") or {})
         seo_link = header.get("seoJobLink")
         if isinstance(seo_link, str) and seo_link:
-            links.append(_normalize_job_link(seo_link))
+            links.append(_normalize_job_link(seo_link, search_url))
 
-    return list(dict.fromkeys(links))
+    return _dedupe_job_links(links, search_url)
 
 
-def _extract_job_posting_jsonld(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+def _extract_job_posting_jsonld(soup: "BeautifulSoup") -> Optional[Dict[str, Any]]:
     for script in soup.find_all("script", type="application/ld+json"):
-        text = script.get_text(strip=True)
-        if not text:
-            continue
+        job_posting = _job_posting_from_jsonld_script(script.get_text(strip=True))
+        if job_posting is not None:
+            return job_posting
 
-        try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
-            continue
+    return None
 
-        items = payload if isinstance(payload, list) else [payload]
-        for item in items:
-            if isinstance(item, dict) and item.get("@type") == "JobPosting":
-                return item
 
-    return None
+def _normalize_job_link(href: str, base_url: Optional[str] = None) -> str:
+    """Make a job link absolute and drop its tracking parameters.
+
+    Relative links resolve against the host of ``base_url`` (the search being
+    crawled), defaulting to ``www.glassdoor.com``. Only the listing ID parameters
+    are kept in the query, so the same posting always yields the same fetch URL.
+    """
+    parsed = urlparse(href)
+    if not parsed.netloc:
+        origin = urlparse(base_url) if base_url else None
+        if origin is not None and origin.netloc:
+            parsed = parsed._replace(scheme=origin.scheme or "https", netloc=origin.netloc)
+        else:
+            parsed = parsed._replace(scheme="https", netloc="www.glassdoor.com")
+    query = [(key, value) for key, value in parse_qsl(parsed.query) if key in LISTING_ID_PARAMS]
+    return urlunparse(parsed._replace(query=urlencode(query), fragment=""))
 
 
-def _normalize_job_link(href: str) -> str:
-    if href.startswith("http"):
-        return href
-    return "https://www.glassdoor.com" + href
+def _dedupe_job_links(links: Iterable[str], base_url: Optional[str] = None) -> List[str]:
+    """Keep one URL per listing ID, preferring one on the host of ``base_url``."""
+    search_host = _host_of(base_url) if base_url else None
+    by_listing: Dict[str, str] = {}
+    for link in links:
+        listing_id = listing_id_from_url(link)
+        current = by_listing.get(listing_id)
+        if current is None or (_host_of(current) != search_host and _host_of(link) == search_host):
+            by_listing[listing_id] = link
+    return list(by_listing.values())
 
 
 def _is_job_listing_href(href: str) -> bool:
@@ -400,7 +829,7 @@ def _is_job_listing_href(href: str) -> bool:
 def _extract_location_from_job_posting(job_posting: Dict[str, Any]) -> Any:
     location = job_posting.get("jobLocation")
     if not location:
-        return np.nan
+        return None
 
     location_items = location if isinstance(location, list) else [location]
     formatted_locations: List[str] = []
@@ -421,7 +850,7 @@ def _extract_location_from_job_posting(job_posting: Dict[str, Any]) -> Any:
             formatted_locations.append(joined)
 
     if not formatted_locations:
-        return np.nan
+        return None
 
     return " | ".join(dict.fromkeys(formatted_locations))
 
@@ -430,40 +859,39 @@ def _extract_salary_fields_from_job_posting(job_posting: Dict[str, Any]) -> Dict
     base_salary = job_posting.get("baseSalary")
     if not isinstance(base_salary, dict):
         return {
-            "salary_estimated": np.nan,
-            "salary_min": np.nan,
-            "salary_max": np.nan,
+            "salary_estimated": None,
+            "salary_min": None,
+            "salary_max": None,
         }
 
     value = base_salary.get("value", {})
     currency = job_posting.get("salaryCurrency", "")
     if not isinstance(value, dict):
         return {
-            "salary_estimated": np.nan,
-            "salary_min": np.nan,
-            "salary_max": np.nan,
+            "salary_estimated": None,
+            "salary_min": None,
+            "salary_max": None,
         }
 
-    min_value = value.get("minValue", np.nan)
-    max_value = value.get("maxValue", np.nan)
-    exact_value = value.get("value", np.nan)
+    min_value = value.get("minValue", None)
+    max_value = value.get("maxValue", None)
+    exact_value = value.get("value", None)
 
     salary_estimated = exact_value
     if isinstance(exact_value, (int, float)) and currency:
         salary_estimated = f"{currency} {exact_value}"
 
     return {
-        "salary_estimated": salary_estimated if salary_estimated == salary_estimated else np.nan,
-        "salary_min": min_value if min_value == min_value else np.nan,
-        "salary_max": max_value if max_value == max_value else np.nan,
+        "salary_estimated": salary_estimated if salary_estimated == salary_estimated else None,
+        "salary_min": min_value if min_value == min_value else None,
+        "salary_max": max_value if max_value == max_value else None,
     }
 
 
 def get_position_links(url: str, session: Optional[Any] = None) -> List[str]:
     """Collect job links from a single result page."""
     response = _get(url, session=session)
-    soup = BeautifulSoup(response.text, "html.parser")
-    return _extract_job_links_from_search_soup(soup)
+    return _parse(session, _parse_search_page_links, response.text, url)
 
 
 def get_position_link(url: str) -> List[str]:
@@ -487,145 +915,312 @@ def _replace_query_param(url: str, key: str, value: Any) -> str:
     return urlunparse(parsed._replace(query=urlencode(query)))
 
 
+def _page_url_for_scheme(base_url: str, page: int, scheme: str) -> Optional[str]:
+    if scheme == "query_page":
+        return _replace_query_param(base_url, "page", page)
+    if scheme == "query_p":
+        return _replace_query_param(base_url, "p", page)
+    if scheme == "path_ip" and base_url.endswith(".htm"):
+        return base_url[:-4] + f"_IP{page}.htm"
+    if scheme == "path_p" and base_url.endswith(".htm"):
+        return base_url[:-4] + f"_P{page}.htm"
+    if scheme == "legacy_query" and not base_url.endswith(".htm"):
+        return f"{base_url}?page={page}"
+    return None
+
+
+def _page_url_candidates_by_scheme(
+    base_url: str,
+    page: int,
+    preferred_scheme: Optional[str] = None,
+) -> List[tuple[str, str]]:
+    """(scheme, url) pairs to probe for ``page``, the preferred scheme first."""
+    schemes = list(PAGINATION_SCHEMES)
+    if preferred_scheme in schemes:
+        schemes.remove(preferred_scheme)
+        schemes.insert(0, preferred_scheme)
+
+    candidates: Dict[str, str] = {}
+    for scheme in schemes:
+        url = _page_url_for_scheme(base_url, page, scheme)
+        # Preserve order while removing duplicates.
+        if url is not None and url not in candidates:
+            candidates[url] = scheme
+    return [(scheme, url) for url, scheme in candidates.items()]
+
+
 def _build_page_url_candidates(base_url: str, page: int) -> List[str]:
     if page <= 1:
         return [base_url]
+    return [url for _scheme, url in _page_url_candidates_by_scheme(base_url, page)]
 
-    candidates: List[str] = []
 
-    # Current Jobs Next pages often react to query-based pagination in SSR/hydration,
-    # while legacy pages used path suffixes like _P2.htm / _IP2.htm.
-    candidates.append(_replace_query_param(base_url, "page", page))
-    candidates.append(_replace_query_param(base_url, "p", page))
+class _BffPagePrefetcher:
+    """Fetches known-cursor BFF pages concurrently for ``iter_page_links``.
 
-    if base_url.endswith(".htm"):
-        candidates.append(base_url[:-4] + f"_IP{page}.htm")
-        candidates.append(base_url[:-4] + f"_P{page}.htm")
-    else:
-        candidates.append(f"{base_url}?page={page}")
+    With ``concurrency <= 1`` nothing is prefetched and ``result`` simply performs
+    the request inline, keeping the original one-page-at-a-time behaviour.
+    """
 
-    # Preserve order while removing duplicates.
-    return list(dict.fromkeys(candidates))
+    def __init__(self, concurrency: int, session: Optional[Any]):
+        self._concurrency = concurrency
+        self._session = session
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[int, Future] = {}
 
+    def start(self, bootstrap: Optional[Dict[str, Any]], first_page: int, last_page: int) -> None:
+        if self._concurrency <= 1 or not bootstrap or self._executor is not None:
+            return
+        pages = [
+            page
+            for page in sorted(bootstrap.get("pagination_cursors") or {})
+            if first_page <= page <= last_page
+        ]
+        if not pages:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(self._concurrency, len(pages)),
+            thread_name_prefix="glassdoor-bff",
+        )
+        for page in pages:
+            self._futures[page] = self._executor.submit(
+                _get_links_from_bff_page,
+                page_number=page,
+                bootstrap=bootstrap,
+                session=self._session,
+            )
+        LOGGER.info("Requested %s BFF result pages concurrently.", len(pages))
 
-def get_all_links(
+    def result(self, page: int, bootstrap: Dict[str, Any]) -> List[str]:
+        future = self._futures.pop(page, None)
+        if future is not None:
+            return future.result()
+        return _get_links_from_bff_page(page_number=page, bootstrap=bootstrap, session=self._session)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _count_new_listings(links: List[str], seen_listing_ids: set) -> int:
+    return len([link for link in links if listing_id_from_url(link) not in seen_listing_ids])
+
+
+def iter_page_links(
     num_pages: int,
     base_url: str,
     delay_seconds: float = 0.5,
     session: Optional[Any] = None,
-) -> List[List[str]]:
-    """Collect job links across result pages."""
-    all_links: List[List[str]] = []
-    seen_links: set[str] = set()
+    state: Optional[CrawlState] = None,
+    page_concurrency: int = 1,
+    strategy_store: Optional[PaginationStrategyStore] = None,
+) -> Iterator[List[str]]:
+    """Yield the job links of each result page as soon as the page is loaded.
+
+    With a ``state``, pages already recorded by an earlier run are replayed (along
+    with the BFF bootstrap) and collection resumes at the first missing page.
+
+    With ``page_concurrency > 1`` every page that has a cursor in the BFF bootstrap
+    is requested up front by that many threads (still under the client's rate
+    limit). Pages are consumed in order with the same "no new links, stop" rule, so
+    the result is unchanged; pages prefetched past the stop point are discarded.
+
+    When BFF pagination is unavailable, pages are found by probing URL schemes
+    (``PAGINATION_SCHEMES``). A ``strategy_store`` puts the scheme that last worked
+    for this search first, so other schemes are only probed when it returns no new
+    links, and records the winner for later pages and runs.
+    """
+    seen_listing_ids: set[str] = set()
     search_bootstrap: Optional[Dict[str, Any]] = None
+    first_page = 1
+
+    if state is not None:
+        recorded_pages = state.recorded_pages()
+        if state.links_complete:
+            LOGGER.info("Reusing %s result pages from the crawl checkpoint.", len(recorded_pages))
+        elif recorded_pages:
+            LOGGER.info("Resuming link collection at page %s from the crawl checkpoint.", len(recorded_pages) + 1)
+        for page_links in recorded_pages:
+            seen_listing_ids.update(map(listing_id_from_url, page_links))
+            yield page_links
+        if state.links_complete:
+            return
+        search_bootstrap = state.bootstrap
+        first_page = len(recorded_pages) + 1
+
     LOGGER.info("Collecting links...")
 
-    for page in range(1, num_pages + 1):
-        try:
-            if page == 1:
-                page_url = _build_page_url(base_url, page)
-                page_links, search_bootstrap = _get_search_page_links_and_bootstrap(page_url, session=session)
-            else:
-                page_url = _build_page_url(base_url, page)
-                page_links: List[str] = []
-                new_links_count = 0
-
-                if search_bootstrap:
-                    try:
-                        bff_links = _get_links_from_bff_page(
-                            page_number=page,
-                            bootstrap=search_bootstrap,
-                            session=session,
+    bff_prefetcher = _BffPagePrefetcher(page_concurrency, session)
+    try:
+        if first_page > 1:
+            bff_prefetcher.start(search_bootstrap, first_page, num_pages)
+
+        for page in range(first_page, num_pages + 1):
+            try:
+                if page == 1:
+                    page_url = _build_page_url(base_url, page)
+                    page_links, search_bootstrap = _get_search_page_links_and_bootstrap(page_url, session=session)
+                    bff_prefetcher.start(search_bootstrap, 2, num_pages)
+                else:
+                    page_url = _build_page_url(base_url, page)
+                    page_links: List[str] = []
+                    new_links_count = 0
+
+                    if search_bootstrap:
+                        try:
+                            bff_links = bff_prefetcher.result(page, search_bootstrap)
+                            if bff_links:
+                                page_links = bff_links
+                                new_links_count = _count_new_listings(page_links, seen_listing_ids)
+                                LOGGER.info(
+                                    "Page %s loaded via BFF pagination (%s links, %s new).",
+                                    page,
+                                    len(page_links),
+                                    new_links_count,
+                                )
+                        except _transient_errors() as exc:
+                            LOGGER.warning("BFF pagination failed for page %s: %s", page, exc)
+                        except Exception as exc:  # pragma: no cover - defensive for unstable payloads
+                            LOGGER.warning("Unexpected BFF pagination error on page %s: %s", page, exc)
+
+                    if not page_links:
+                        best_links: List[str] = []
+                        best_url: Optional[str] = None
+                        best_scheme: Optional[str] = None
+                        best_new_count = -1
+                        preferred_scheme = strategy_store.lookup(base_url) if strategy_store else None
+
+                        for scheme, candidate_url in _page_url_candidates_by_scheme(base_url, page, preferred_scheme):
+                            candidate_links = get_position_links(candidate_url, session=session)
+                            candidate_new_count = _count_new_listings(candidate_links, seen_listing_ids)
+
+                            if candidate_new_count > best_new_count:
+                                best_new_count = candidate_new_count
+                                best_links = candidate_links
+                                best_url = candidate_url
+                                best_scheme = scheme
+
+                            # A page may repeat a pinned listing, so the learned scheme
+                            # only has to bring something new to be trusted.
+                            if candidate_links and (
+                                candidate_new_count == len(candidate_links)
+                                or (scheme == preferred_scheme and candidate_new_count > 0)
+                            ):
+                                break
+
+                        page_url = best_url or _build_page_url(base_url, page)
+                        page_links = best_links
+                        new_links_count = max(best_new_count, 0)
+                        if strategy_store is not None and best_scheme and new_links_count:
+                            strategy_store.remember(base_url, best_scheme)
+                        LOGGER.info(
+                            "Page %s selected URL %s (%s links, %s new).",
+                            page,
+                            page_url,
+                            len(page_links),
+                            new_links_count,
                         )
-                        if bff_links:
-                            page_links = bff_links
-                            new_links_count = len([link for link in page_links if link not in seen_links])
-                            LOGGER.info(
-                                "Page %s loaded via BFF pagination (%s links, %s new).",
-                                page,
-                                len(page_links),
-                                new_links_count,
-                            )
-                    except requests.RequestException as exc:
-                        LOGGER.warning("BFF pagination failed for page %s: %s", page, exc)
-                    except Exception as exc:  # pragma: no cover - defensive for unstable payloads
-                        LOGGER.warning("Unexpected BFF pagination error on page %s: %s", page, exc)
-
-                if not page_links:
-                    best_links: List[str] = []
-                    best_url: Optional[str] = None
-                    best_new_count = -1
-
-                    for candidate_url in _build_page_url_candidates(base_url, page):
-                        candidate_links = get_position_links(candidate_url, session=session)
-                        candidate_new_count = len([link for link in candidate_links if link not in seen_links])
-
-                        if candidate_new_count > best_new_count:
-                            best_new_count = candidate_new_count
-                            best_links = candidate_links
-                            best_url = candidate_url
-
-                        if candidate_new_count == len(candidate_links) and candidate_links:
-                            break
-
-                    page_url = best_url or _build_page_url(base_url, page)
-                    page_links = best_links
-                    new_links_count = max(best_new_count, 0)
-                    LOGGER.info(
-                        "Page %s selected URL %s (%s links, %s new).",
-                        page,
-                        page_url,
-                        len(page_links),
-                        new_links_count,
-                    )
-
-                if page_links and new_links_count == 0:
-                    LOGGER.warning(
-                        "Page %s returned no new links; stopping pagination to avoid duplicate scraping.",
-                        page,
-                    )
-                    break
 
-            all_links.append(page_links)
-            seen_links.update(page_links)
-            time.sleep(delay_seconds)
-        except requests.RequestException as exc:
-            LOGGER.warning("Error collecting links from page %s (%s): %s", page, page_url, exc)
-            break
+                    if page_links and new_links_count == 0:
+                        LOGGER.warning(
+                            "Page %s returned no new links; stopping pagination to avoid duplicate scraping.",
+                            page,
+                        )
+                        break
+
+                seen_listing_ids.update(map(listing_id_from_url, page_links))
+                if state is not None:
+                    state.record_page(page, page_links, bootstrap=search_bootstrap if page == 1 else None)
+            except _transient_errors() as exc:
+                LOGGER.warning("Error collecting links from page %s (%s): %s", page, page_url, exc)
+                # Leave the checkpoint open so the next run retries from this page.
+                return
+
+            yield page_links
+            _pace(session, delay_seconds)
+    finally:
+        bff_prefetcher.close()
 
-    return all_links
+    if state is not None:
+        state.mark_links_complete()
 
 
-def scrap_job_page(url: str, session: Optional[Any] = None) -> Dict[str, Any]:
-    """Scrape a single job page."""
-    result: Dict[str, Any] = {}
-    response = _get(url, session=session)
-    soup = BeautifulSoup(response.text, "html.parser")
-    body = soup.find("body")
+def get_all_links(
+    num_pages: int,
+    base_url: str,
+    delay_seconds: float = 0.5,
+    session: Optional[Any] = None,
+    state: Optional[CrawlState] = None,
+    page_concurrency: int = 1,
+    strategy_store: Optional[PaginationStrategyStore] = None,
+) -> List[List[str]]:
+    """Collect job links across result pages."""
+    return list(
+        iter_page_links(
+            num_pages,
+            base_url,
+            delay_seconds=delay_seconds,
+            session=session,
+            state=state,
+            page_concurrency=page_concurrency,
+            strategy_store=strategy_store,
+        )
+    )
 
-    data = _extract_page_state(body)
-    job_posting = _extract_job_posting_jsonld(soup)
+
+# Salary nodes of the legacy job page markup: (record field, tag, class).
+_SALARY_NODES = (
+    ("salary_estimated", "h2", "salEst"),
+    ("salary_min", "div", "minor cell alignLt"),
+    ("salary_max", "div", "minor cell alignRt"),
+)
+_SALARY_CLASS_MARKERS = ("salEst", "alignLt", "alignRt")
+
+# Attributes of a start tag; a ">" inside a quoted value does not end the tag.
+_TAG_ATTRS = r"""(?:"[^"]*"|'[^']*'|[^'">])*"""
+# Comments are matched too so that commented-out scripts are skipped, as html.parser does.
+_SCRIPT_RE = re.compile(rf"<!--.*?-->|<script\b({_TAG_ATTRS})>(.*?)</script\s*>", re.I | re.S)
+_SCRIPT_TYPE_RE = re.compile(r"""\btype\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I)
+# Candidates only: the class itself is matched by BeautifulSoup on the element.
+_SALARY_START_TAG_RE = re.compile(rf"<(h2|div)\b({_TAG_ATTRS})>", re.I)
+_BODY_START_RE = re.compile(r"<body(?=[\s/>])", re.I)
+_BODY_END_RE = re.compile(r"</body\s*>", re.I)
+
+
+def _build_job_record(
+    data: Optional[Dict[str, Any]],
+    job_posting: Optional[Dict[str, Any]],
+    has_body: bool,
+    salary_texts: Dict[str, Optional[str]],
+) -> JobRecord:
+    """Assemble a job record from the extracted page pieces.
+
+    ``salary_texts`` maps each salary field to the stripped text of its legacy
+    node, or ``None`` when the node is missing (then JSON-LD is used instead).
+    """
+    result: Dict[str, Any] = {}
 
     try:
         if data:
             result["job_title"] = data["initialState"]["jlData"]["header"]["jobTitleText"]
         elif job_posting:
-            result["job_title"] = job_posting.get("title", np.nan)
+            result["job_title"] = job_posting.get("title", None)
         else:
-            result["job_title"] = np.nan
+            result["job_title"] = None
     except (KeyError, TypeError):
-        result["job_title"] = np.nan
+        result["job_title"] = None
 
     try:
         if data:
             result["company_name"] = data["initialState"]["jlData"]["header"]["employer"]["name"]
         elif job_posting:
             employer = job_posting.get("hiringOrganization", {})
-            result["company_name"] = employer.get("name", np.nan) if isinstance(employer, dict) else np.nan
+            result["company_name"] = employer.get("name", None) if isinstance(employer, dict) else None
         else:
-            result["company_name"] = np.nan
+            result["company_name"] = None
     except (KeyError, TypeError):
-        result["company_name"] = np.nan
+        result["company_name"] = None
 
     try:
         if data:
@@ -633,96 +1228,878 @@ def scrap_job_page(url: str, session: Optional[Any] = None) -> Dict[str, Any]:
         elif job_posting:
             result["location"] = _extract_location_from_job_posting(job_posting)
         else:
-            result["location"] = np.nan
+            result["location"] = None
     except (KeyError, TypeError):
-        result["location"] = np.nan
-
-    try:
-        result["salary_estimated"] = body.find("h2", class_="salEst").text.strip() if body else np.nan
-    except AttributeError:
-        if job_posting:
-            result["salary_estimated"] = _extract_salary_fields_from_job_posting(job_posting)[
-                "salary_estimated"
-            ]
-        else:
-            result["salary_estimated"] = np.nan
-
-    try:
-        result["salary_min"] = body.find("div", class_="minor cell alignLt").text.strip() if body else np.nan
-    except AttributeError:
-        if job_posting:
-            result["salary_min"] = _extract_salary_fields_from_job_posting(job_posting)["salary_min"]
-        else:
-            result["salary_min"] = np.nan
-
-    try:
-        result["salary_max"] = body.find("div", class_="minor cell alignRt").text.strip() if body else np.nan
-    except AttributeError:
-        if job_posting:
-            result["salary_max"] = _extract_salary_fields_from_job_posting(job_posting)["salary_max"]
+        result["location"] = None
+
+    for field, _tag, _class in _SALARY_NODES:
+        node_text = salary_texts.get(field)
+        if not has_body:
+            result[field] = None
+        elif node_text is not None:
+            result[field] = node_text
+        elif job_posting:
+            result[field] = _extract_salary_fields_from_job_posting(job_posting)[field]
         else:
-            result["salary_max"] = np.nan
+            result[field] = None
 
     try:
         if data:
             result["job_description"] = data["initialState"]["jlData"]["job"]["description"]
         elif job_posting:
-            result["job_description"] = job_posting.get("description", np.nan)
+            result["job_description"] = job_posting.get("description", None)
         else:
-            result["job_description"] = np.nan
+            result["job_description"] = None
     except (KeyError, TypeError):
-        result["job_description"] = np.nan
+        result["job_description"] = None
 
-    return result
+    return JobRecord(**result)
 
 
-def crawl_jobs(
-    base_url: str,
-    num_pages: int = 1,
-    output_path: str = "belohorizonte_vagas.xlsx",
-    delay_seconds: float = 0.5,
-    use_env_proxies: bool = True,
-) -> pd.DataFrame:
-    """Run the crawl and save the results to an Excel file."""
-    session = _build_session(use_env_proxies=use_env_proxies)
+def _salary_texts_from_soup(body: Optional[Any]) -> Dict[str, Optional[str]]:
+    texts: Dict[str, Optional[str]] = {}
+    for field, tag, class_name in _SALARY_NODES:
+        node = body.find(tag, class_=class_name) if body is not None else None
+        texts[field] = node.text.strip() if node is not None else None
+    return texts
+
+
+def _parse_job_page(html: str) -> JobRecord:
+    """Reference job page parser over a full BeautifulSoup tree."""
+    soup = _soup(html)
+    body = soup.find("body")
+    return _build_job_record(
+        _extract_page_state(body),
+        _extract_job_posting_jsonld(soup),
+        body is not None,
+        _salary_texts_from_soup(body),
+    )
+
+
+def _script_type(attrs: str) -> Optional[str]:
+    match = _SCRIPT_TYPE_RE.search(attrs)
+    if not match:
+        return None
+    return html_lib.unescape(next(group for group in match.groups() if group is not None))
+
+
+def _in_ranges(ranges: List[Tuple[int, int]], position: int) -> bool:
+    """Whether ``position`` falls in one of the sorted, disjoint ``(start, end)`` ranges."""
+    index = bisect.bisect_right(ranges, (position, float("inf"))) - 1
+    return index >= 0 and ranges[index][0] <= position < ranges[index][1]
+
+
+def _element_end(html: str, tag: str, start: int, end: int, raw_ranges: List[Tuple[int, int]]) -> int:
+    """End offset of the element whose start tag is at ``start`` (same-name nesting aware).
+
+    Tags inside ``raw_ranges`` (script bodies, comments) are text to an HTML parser
+    and are not counted.
+    """
+    depth = 0
+    for match in re.compile(rf"<(/?){tag}\b{_TAG_ATTRS}>", re.I).finditer(html, start, end):
+        if match.group(0).endswith("/>") or _in_ranges(raw_ranges, match.start()):
+            continue
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.end()
+    return end
+
+
+def _salary_texts_from_html(
+    html: str, body_start: int, body_end: int, raw_ranges: List[Tuple[int, int]]
+) -> Dict[str, Optional[str]]:
+    # Only the candidate elements are handed to BeautifulSoup, so the class match and
+    # the text extraction stay identical to ``_salary_texts_from_soup`` on the full tree.
+    texts: Dict[str, Optional[str]] = {field: None for field, _tag, _class in _SALARY_NODES}
+    if not any(html.find(marker, body_start, body_end) != -1 for marker in _SALARY_CLASS_MARKERS):
+        return texts
+
+    for match in _SALARY_START_TAG_RE.finditer(html, body_start, body_end):
+        if not any(marker in match.group(2) for marker in _SALARY_CLASS_MARKERS):
+            continue
+        if _in_ranges(raw_ranges, match.start()):
+            continue
+        snippet = html[match.start() : _element_end(html, match.group(1), match.start(), body_end, raw_ranges)]
+        for field, text in _salary_texts_from_soup(_soup(snippet)).items():
+            if texts[field] is None and text is not None:
+                texts[field] = text
+        if all(text is not None for text in texts.values()):
+            break
+    return texts
+
+
+def _parse_job_page_fast(html: str) -> JobRecord:
+    """Single-pass job page parser producing the same record as ``_parse_job_page``.
+
+    Scripts are located with one regex scan instead of building a tree: the first
+    ``initialState`` script inside ``<body>`` and the first JSON-LD ``JobPosting``
+    anywhere. BeautifulSoup only sees the few elements carrying a legacy salary class.
+    """
+    scripts = []
+    # Script bodies and comments are raw text to an HTML parser: markup inside them
+    # (a "<body" string, salary elements) must not be matched.
+    raw_ranges: List[Tuple[int, int]] = []
+    for match in _SCRIPT_RE.finditer(html):
+        raw_ranges.append((match.start(), match.end()))
+        if match.group(2) is not None:
+            scripts.append((match.start(), match.end(), match.group(1), match.group(2)))
+
+    body_start_match = next(
+        (match for match in _BODY_START_RE.finditer(html) if not _in_ranges(raw_ranges, match.start())), None
+    )
+    has_body = body_start_match is not None
+    body_start = body_start_match.start() if body_start_match else len(html)
+    body_end = len(html)
+    if has_body:
+        for end_match in _BODY_END_RE.finditer(html, body_start):
+            if not _in_ranges(raw_ranges, end_match.start()):
+                body_end = end_match.start()
+                break
+
+    data: Optional[Dict[str, Any]] = None
+    job_posting: Optional[Dict[str, Any]] = None
+    for start, _end, attrs, text in scripts:
+        if data is None and body_start <= start < body_end:
+            data = _page_state_from_script(text.strip())
+        if job_posting is None and _script_type(attrs) == "application/ld+json":
+            job_posting = _job_posting_from_jsonld_script(text.strip())
+        if data is not None and job_posting is not None:
+            break
+
+    salary_texts = _salary_texts_from_html(html, body_start, body_end, raw_ranges) if has_body else {}
+    return _build_job_record(data, job_posting, has_body, salary_texts)
+
+
+def scrap_job_page(url: str, session: Optional[Any] = None) -> JobRecord:
+    """Scrape a single job page.
+
+    The ``JobRecord`` reads like a dict (``record["company_name"]``, ``dict(record)``).
+    """
+    response = _get(url, session=session)
+    return _parse(session, _parse_job_page_fast, response.text)
+
+
+def _scrape_job_or_none(url: str, session: Optional[Any] = None) -> Optional[Dict[str, Any]]:
     try:
-        links = get_all_links(num_pages, base_url, delay_seconds=delay_seconds, session=session)
-        flattened = [item for sublist in links for item in sublist]
-        unique_links = list(dict.fromkeys(flattened))
+        return scrap_job_page(url, session=session)
+    except _transient_errors() as exc:
+        LOGGER.warning("Error scraping %s: %s", url, exc)
+    except Exception as exc:  # pragma: no cover - defensive for unstable HTML
+        LOGGER.warning("Unexpected parsing error in %s: %s", url, exc)
+    return None
 
-        if not unique_links:
-            LOGGER.warning("No job links found.")
-            df_empty = pd.DataFrame()
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                df_empty.to_excel(writer, index=False)
-            return df_empty
+
+def _scrape_jobs_sequentially(
+    links: Iterable[str],
+    session: Any,
+    delay_seconds: float,
+    bar: Any,
+    emit: Callable[[str, Dict[str, Any]], None],
+) -> None:
+    for index, page in enumerate(links, start=1):
+        result = _scrape_job_or_none(page, session=session)
+        bar.update(index)
+        if result is not None:
+            emit(page, result)
+        _pace(session, delay_seconds)
+
+
+def _scrape_jobs_concurrently(
+    links: Iterable[str],
+    session: Any,
+    delay_seconds: float,
+    concurrency: int,
+    bar: Any,
+    emit: Callable[[str, Dict[str, Any]], None],
+) -> None:
+    def _worker(url: str) -> Optional[Dict[str, Any]]:
+        # The client's token bucket caps the global rate; without one, fall back to
+        # spacing each worker's requests by ``delay_seconds``.
+        result = _scrape_job_or_none(url, session=session)
+        _pace(session, delay_seconds)
+        return result
+
+    # A producer thread drains ``links`` (which may still be fetching result pages)
+    # and submits each link as soon as it appears. Futures are queued in discovery
+    # order and resolved in that order, so rows keep it; the bounded queue keeps
+    # discovery from running arbitrarily far ahead of the workers.
+    submitted: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=concurrency * 4)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="glassdoor-job") as executor:
+
+        def _produce() -> None:
+            try:
+                for url in links:
+                    submitted.put((url, executor.submit(_worker, url)))
+            except BaseException as exc:  # surfaced in the consumer thread
+                submitted.put((None, exc))
+                return
+            submitted.put(None)
+
+        producer = threading.Thread(target=_produce, name="glassdoor-links", daemon=True)
+        producer.start()
+
+        done = 0
+        while True:
+            item = submitted.get()
+            if item is None:
+                break
+            url, future = item
+            if isinstance(future, BaseException):
+                raise future
+            result = future.result()
+            done += 1
+            bar.update(done)
+            if result is not None:
+                emit(url, result)
+        producer.join()
+
+
+def _staging_path_for(output_path: str) -> str:
+    return output_path + ".partial.jsonl"
+
+
+def _pending_path_for(output_path: str) -> str:
+    return output_path + ".pending.jsonl"
+
+
+def _iter_search_links(
+    searches: List[str],
+    num_pages: int,
+    delay_seconds: float,
+    session: Any,
+    states: Dict[str, CrawlState],
+    page_concurrency: int,
+    strategy_store: Optional[PaginationStrategyStore],
+    search_concurrency: int,
+) -> Iterator[Tuple[str, List[str]]]:
+    """Yield ``(search URL, page links)`` for every result page of every search.
+
+    With ``search_concurrency > 1`` the searches are paginated by that many threads
+    sharing ``session`` (and so its rate limiter and transport); pages are yielded
+    as they arrive, interleaving searches.
+    """
+
+    def _pages(search: str) -> Iterator[List[str]]:
+        return iter_page_links(
+            num_pages,
+            search,
+            delay_seconds=delay_seconds,
+            session=session,
+            state=states.get(search),
+            page_concurrency=page_concurrency,
+            strategy_store=strategy_store,
+        )
+
+    if search_concurrency <= 1 or len(searches) <= 1:
+        for search in searches:
+            for page_links in _pages(search):
+                yield search, page_links
+        return
+
+    arrived: "queue.Queue[Tuple[str, Optional[List[str]]]]" = queue.Queue()
+    stop = threading.Event()
+
+    def _discover(search: str) -> None:
+        try:
+            for page_links in _pages(search):
+                if stop.is_set():
+                    break
+                arrived.put((search, page_links))
+        finally:
+            arrived.put((search, None))
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(search_concurrency, len(searches)),
+        thread_name_prefix="glassdoor-search",
+    )
+    futures = [executor.submit(_discover, search) for search in searches]
+    try:
+        running = len(futures)
+        while running:
+            search, page_links = arrived.get()
+            if page_links is None:
+                running -= 1
+                continue
+            yield search, page_links
+        for future in futures:
+            future.result()
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_crawl(
+    searches: List[str],
+    num_pages: int,
+    output_path: str,
+    delay_seconds: float,
+    use_env_proxies: bool,
+    concurrency: int,
+    requests_per_second: Optional[float],
+    burst: int,
+    batch_size: int,
+    return_dataframe: bool,
+    cache_dir: Optional[str],
+    cache_ttls: Optional[Dict[str, float]],
+    state_dir: Optional[str],
+    page_concurrency: int,
+    pagination_cache: Optional[str],
+    transport_state: Optional[str],
+    search_concurrency: int,
+    record_sources: bool,
+    incremental: bool = False,
+    listing_index: Optional[str] = None,
+    freshness_seconds: float = DEFAULT_FRESHNESS_SECONDS,
+    parse_workers: int = 0,
+    origin: Optional[str] = None,
+    max_retries: int = 3,
+    backoff_base: float = 1.0,
+    breaker_threshold: int = 5,
+    breaker_cooldown: float = 120.0,
+    adaptive_rate: Optional[Tuple[float, float]] = None,
+    metrics_path: Optional[str] = None,
+    prometheus_path: Optional[str] = None,
+    compress_descriptions: bool = False,
+    description_store: Optional[str] = None,
+    description_codec: str = "zlib",
+) -> Optional["pd.DataFrame"]:
+    to_excel = is_excel_path(output_path)
+    sink_path = _staging_path_for(output_path) if to_excel else output_path
+
+    # A single crawl keeps frontier and rows in one checkpoint; a batch keeps one
+    # frontier per search plus a shared ledger of scraped rows.
+    states: Dict[str, CrawlState] = {}
+    ledger: Optional[CrawlState] = None
+    if state_dir and record_sources:
+        states = {search: CrawlState(state_dir, search, num_pages) for search in searches}
+        ledger = CrawlState(state_dir, _BATCH_STATE_PREFIX + "\n".join(searches), num_pages)
+    elif state_dir:
+        ledger = CrawlState(state_dir, searches[0], num_pages)
+        states = {searches[0]: ledger}
+
+    if pagination_cache is None and state_dir:
+        pagination_cache = os.path.join(state_dir, "pagination.json")
+    strategy_store = PaginationStrategyStore(pagination_cache) if pagination_cache else None
+    if transport_state is None and state_dir:
+        transport_state = os.path.join(state_dir, "transport.json")
+    if incremental and listing_index is None:
+        listing_index = os.path.join(state_dir or os.path.dirname(output_path), "listings.sqlite")
+    index = ListingIndex(listing_index, freshness_seconds=freshness_seconds) if listing_index else None
+    descriptions = DescriptionStore(description_store, codec=description_codec) if description_store else None
+    collected: List[Dict[str, Any]] = []
+    sink: Optional[Any] = None
+
+    sources: Dict[str, List[str]] = {}
+    discovery_done = threading.Event()
+    # Rows scraped while discovery may still add sources wait on disk, not in memory.
+    pending: Optional[JsonlSink] = None
+
+    def _with_sources(url: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        if not record_sources:
+            return row
+        return with_fields(row, source_searches=" ".join(sources.get(listing_id_from_url(url), [])))
+
+    def _compact(row: Dict[str, Any]) -> Dict[str, Any]:
+        if not compress_descriptions or "job_description" not in row:
+            return row
+        return JobRecord.from_mapping(row).compress_description()
+
+    def _write(url: str, row: Dict[str, Any]) -> None:
+        row = _with_sources(url, row)
+        sink.write(row)
+        if return_dataframe:
+            collected.append(_compact(row))
+        if index is not None:
+            unindexed.append(url)
+            _index_persisted_rows()
+
+    def _stage(url: str, row: Dict[str, Any]) -> None:
+        nonlocal pending
+        if pending is None:
+            pending = JsonlSink(_pending_path_for(output_path), batch_size=batch_size)
+        pending.write({"url": url, "row": dict(row)})
+
+    def _flush_pending() -> None:
+        nonlocal pending
+        if pending is None:
+            return
+        pending.close()
+        for entry in iter_jsonl(pending.path):
+            _write(entry["url"], entry["row"])
+        os.remove(pending.path)
+        pending = None
+
+    # A listing counts as scraped only once its row would survive a crash: after the
+    # ledger records it, or once the sink has persisted it.
+    unindexed: Deque[str] = deque()
+    indexed_rows = 0
+
+    def _index_persisted_rows() -> None:
+        nonlocal indexed_rows
+        while indexed_rows < sink.rows_persisted:
+            index.mark_scraped(unindexed.popleft())
+            indexed_rows += 1
+
+    # Typed outputs carry the time each row was scraped, which for checkpointed
+    # rows is earlier than the time they are written.
+    stamp_rows = sink_format_for_path(sink_path) in TYPED_FORMATS
+
+    def _prepare(url: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        if descriptions is not None:
+            key = descriptions.put(listing_id_from_url(url), row.get("job_description"))
+            # The hash must not reach the sink or the ledger before its text is durable.
+            descriptions.commit()
+            row = replace_description(row, key)
+        return with_fields(row, scraped_at=utc_now_iso()) if stamp_rows else row
+
+    metrics = CrawlMetrics()
+
+    if ledger is None:
+        sink = open_sink(sink_path, batch_size=batch_size)
+
+        def _emit(url: str, row: Dict[str, Any]) -> None:
+            metrics.record_rows()
+            row = _prepare(url, row)
+            # A later search may still surface this listing, so rows scraped before
+            # discovery ends wait until their source list is final.
+            if record_sources and not discovery_done.is_set():
+                _stage(url, row)
+                return
+            _flush_pending()
+            _write(url, row)
+
+    else:
+
+        def _emit(url: str, row: Dict[str, Any]) -> None:
+            metrics.record_rows()
+            ledger.record_row(url, _prepare(url, row))
+            if index is not None:
+                index.mark_scraped(url)
+
+    if requests_per_second is None:
+        requests_per_second = _requests_per_second_from_delay(delay_seconds)
+    session = _build_session(
+        use_env_proxies=use_env_proxies,
+        requests_per_second=requests_per_second,
+        burst=burst,
+        cache_dir=cache_dir,
+        cache_ttls=cache_ttls,
+        transport_state=transport_state,
+        parse_workers=parse_workers,
+        origin=origin,
+        max_retries=max_retries,
+        backoff_base=backoff_base,
+        breaker_threshold=breaker_threshold,
+        breaker_cooldown=breaker_cooldown,
+        adaptive_rate=adaptive_rate,
+        metrics=metrics,
+    )
+    try:
+        discovered_links: List[str] = []
+        skipped_count = 0
+        duplicate_count = 0
+        known_count = 0
+
+        def _new_links() -> Iterator[str]:
+            # Links flow page by page from discovery straight into the scrapers and
+            # are deduplicated by listing ID across every page and search before any
+            # job page is fetched; the first URL seen for a listing is the one fetched.
+            nonlocal skipped_count, duplicate_count, known_count
+            seen_listing_ids: set[str] = set()
+            discovery_started = time.monotonic()
+            for search, page_links in _iter_search_links(
+                searches,
+                num_pages,
+                delay_seconds,
+                session,
+                states,
+                page_concurrency,
+                strategy_store,
+                search_concurrency,
+            ):
+                for link in page_links:
+                    listing_id = listing_id_from_url(link)
+                    if record_sources:
+                        link_sources = sources.setdefault(listing_id, [])
+                        if search not in link_sources:
+                            link_sources.append(search)
+                    if listing_id in seen_listing_ids:
+                        duplicate_count += 1
+                        continue
+                    seen_listing_ids.add(listing_id)
+                    discovered_links.append(link)
+                    if ledger is not None and link in ledger.completed_urls:
+                        skipped_count += 1
+                        continue
+                    if incremental and index.is_fresh(link):
+                        # Still listed, scraped recently: only refresh last_seen.
+                        index.mark_seen(link)
+                        known_count += 1
+                        continue
+                    yield link
+            metrics.add_phase("discovery", time.monotonic() - discovery_started)
+            discovery_done.set()
+
+        import progressbar
 
         bar = progressbar.ProgressBar(
-            maxval=len(unique_links),
+            max_value=progressbar.UnknownLength,
             widgets=[
                 "Crawling the site: ",
-                progressbar.Bar("=", "[", "]"),
+                progressbar.Counter("%(value)d jobs"),
                 " ",
-                progressbar.Percentage(),
+                progressbar.Timer(),
             ],
         ).start()
 
-        results: List[Dict[str, Any]] = []
-        for index, page in enumerate(unique_links, start=1):
-            bar.update(index)
-            try:
-                results.append(scrap_job_page(page, session=session))
-            except requests.RequestException as exc:
-                LOGGER.warning("Error scraping %s: %s", page, exc)
-            except Exception as exc:  # pragma: no cover - defensive for unstable HTML
-                LOGGER.warning("Unexpected parsing error in %s: %s", page, exc)
-            time.sleep(delay_seconds)
+        # Discovery overlaps the scrape phase, which runs until the last job page.
+        with metrics.phase("scrape"):
+            if concurrency > 1:
+                _scrape_jobs_concurrently(_new_links(), session, delay_seconds, concurrency, bar, _emit)
+            else:
+                _scrape_jobs_sequentially(_new_links(), session, delay_seconds, bar, _emit)
 
         bar.finish()
 
-        df_glass = pd.DataFrame.from_dict(results)
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            df_glass.to_excel(writer, index=False)
-        return df_glass
+        if not discovered_links:
+            LOGGER.warning("No job links found.")
+        if duplicate_count:
+            LOGGER.info(
+                "Avoided %s duplicate job page fetches across %s searches (%s unique listings).",
+                duplicate_count,
+                len(searches),
+                len(discovered_links),
+            )
+        if skipped_count:
+            LOGGER.info("Skipped %s job pages already scraped according to the crawl checkpoint.", skipped_count)
+        if incremental:
+            LOGGER.info(
+                "Incremental crawl: skipped %s listings scraped in the last %.1f hours; %s new or stale.",
+                known_count,
+                freshness_seconds / 3600,
+                len(discovered_links) - known_count,
+            )
     finally:
         session.close()
+        if descriptions is not None:
+            LOGGER.info("Description store %s: %s.", description_store, descriptions.summary())
+            descriptions.close()
+        if sink is not None:
+            _flush_pending()
+            sink.close()
+            if index is not None:
+                _index_persisted_rows()
+        if index is not None:
+            index.close()
+        if ledger is not None:
+            ledger.close()
+
+    if session.cache is not None:
+        LOGGER.info("HTTP cache: %s.", session.cache.summary())
+    if session.retry_stats.retried:
+        LOGGER.info("Retries: %s.", session.retry_stats.summary())
+    if session.rate_controller is not None:
+        LOGGER.info("Adaptive rate: %s.", session.rate_controller.summary())
+
+    with metrics.phase("write"):
+        if ledger is not None:
+            # The checkpoint holds every row of this and earlier runs; copy it to the
+            # output and drop it only once the output exists.
+            with open_sink(sink_path, batch_size=batch_size) as sink:
+                for url, row in ledger.iter_url_rows():
+                    row = _with_sources(url, row)
+                    sink.write(row)
+                    if return_dataframe:
+                        collected.append(_compact(row))
+
+        LOGGER.info("Wrote %s rows to %s.", sink.rows_written, sink_path)
+        if to_excel:
+            convert_to_excel(sink_path, output_path)
+            os.remove(sink_path)
+        result = _dataframe(collected) if return_dataframe else None
+
+    LOGGER.info("Metrics: %s.", metrics.summary())
+    if metrics_path or prometheus_path:
+        _write_metrics_report(metrics, session, metrics_path, prometheus_path)
+
+    if ledger is not None:
+        failed_count = len([link for link in discovered_links if link not in ledger.completed_urls])
+        links_complete = all(state.links_complete for state in states.values())
+        if links_complete and not failed_count:
+            for state in {ledger, *states.values()}:
+                state.clear()
+        else:
+            LOGGER.warning(
+                "Crawl incomplete (%s job pages failed%s); keeping checkpoint in %s.",
+                failed_count,
+                "" if links_complete else ", link collection unfinished",
+                ledger.directory,
+            )
+    return result
+
+
+def _dataframe(rows: List[Dict[str, Any]]) -> "pd.DataFrame":
+    import pandas as pd
+
+    # Records turn into plain dicts (descriptions decompressed) only here.
+    return pd.DataFrame.from_dict([dict(row) for row in rows])
+
+
+def _write_metrics_report(
+    metrics: CrawlMetrics,
+    session: _HttpClient,
+    metrics_path: Optional[str],
+    prometheus_path: Optional[str],
+) -> None:
+    report = metrics.report()
+    if session.cache is not None:
+        report["cache"] = {
+            "hits": session.cache.hits,
+            "revalidated": session.cache.revalidated,
+            "misses": session.cache.misses,
+        }
+    report["retries"] = {
+        "retried": len(session.retry_stats.retried),
+        "recovered": len(session.retry_stats.recovered),
+        "abandoned": len(session.retry_stats.abandoned),
+    }
+    if session.rate_controller is not None:
+        report["adaptive_rate"] = {
+            "final": session.rate_controller.rate,
+            "lowest": session.rate_controller.lowest,
+            "highest": session.rate_controller.highest,
+        }
+    try:
+        if metrics_path:
+            write_json_report(report, metrics_path)
+            LOGGER.info("Wrote run report to %s.", metrics_path)
+        if prometheus_path:
+            write_prometheus_textfile(report, prometheus_path)
+    except OSError as exc:
+        LOGGER.warning("Could not write the metrics report: %s", exc)
+
+
+def crawl_jobs(
+    base_url: str,
+    num_pages: int = 1,
+    output_path: str = "belohorizonte_vagas.xlsx",
+    delay_seconds: float = 0.5,
+    use_env_proxies: bool = True,
+    concurrency: int = 1,
+    requests_per_second: Optional[float] = None,
+    burst: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    return_dataframe: bool = True,
+    cache_dir: Optional[str] = None,
+    cache_ttls: Optional[Dict[str, float]] = None,
+    state_dir: Optional[str] = None,
+    page_concurrency: int = 1,
+    pagination_cache: Optional[str] = None,
+    transport_state: Optional[str] = None,
+    incremental: bool = False,
+    listing_index: Optional[str] = None,
+    freshness_seconds: float = DEFAULT_FRESHNESS_SECONDS,
+    parse_workers: int = 0,
+    origin: Optional[str] = None,
+    max_retries: int = 3,
+    backoff_base: float = 1.0,
+    breaker_threshold: int = 5,
+    breaker_cooldown: float = 120.0,
+    adaptive_rate: Optional[Tuple[float, float]] = None,
+    metrics_path: Optional[str] = None,
+    prometheus_path: Optional[str] = None,
+    compress_descriptions: bool = False,
+    description_store: Optional[str] = None,
+    description_codec: str = "zlib",
+) -> Optional["pd.DataFrame"]:
+    """Run the crawl and stream the results to ``output_path``.
+
+    Rows are flushed every ``batch_size`` rows to a sink picked by the extension of
+    ``output_path`` (``.jsonl``, ``.csv``, ``.parquet`` or ``.arrow``; the last two
+    use the typed schema of ``glassdoorcrawler.schema``). An Excel path is written
+    as a final conversion of a ``<output>.partial.jsonl`` staging file, which is
+    kept if the crawl dies. Set ``return_dataframe=False`` to keep memory flat; the
+    rows are then only on disk.
+
+    Requests are paced by a per-host token bucket of ``requests_per_second`` (with
+    ``burst`` tokens banked); when it is not given, ``delay_seconds`` is converted to
+    the equivalent rate. With ``concurrency > 1`` job pages are fetched by a pool of
+    worker threads under the same limit; rows keep discovery order. Scraping starts
+    as soon as the first result page is loaded, overlapping with link discovery;
+    ``page_concurrency`` fans out the BFF result pages (see ``iter_page_links``).
+
+    ``cache_dir`` enables the on-disk response cache; ``cache_ttls`` overrides the
+    freshness (in seconds) per URL class (``search``, ``bff``, ``job``).
+
+    ``state_dir`` makes the crawl resumable: discovered links, pagination cursors
+    and scraped rows are checkpointed there, a re-run of the same crawl continues
+    where the previous one stopped, and the checkpoint is removed once the output
+    has been written for a fully collected crawl.
+
+    ``pagination_cache`` is a JSON file remembering which fallback pagination URL
+    scheme worked per search; it defaults to ``<state_dir>/pagination.json``.
+    ``transport_state`` is a JSON file keeping the curl_cffi profile per host and
+    the cookie jar between runs (default ``<state_dir>/transport.json``).
+
+    ``listing_index`` is a SQLite index of scraped listings keyed by listing ID (see
+    ``glassdoorcrawler.listings``); every scraped job is recorded there. With
+    ``incremental=True`` listings scraped within ``freshness_seconds`` are skipped,
+    so the output only holds new or stale listings. The index defaults to
+    ``listings.sqlite`` in ``state_dir`` (or next to the output) in that mode.
+
+    ``parse_workers > 0`` moves HTML parsing of search and job pages to a pool of
+    that many processes; the network threads only download and hand over the
+    HTML, so parsing scales with cores instead of sharing the GIL.
+
+    ``origin`` sends every request to another scheme and host, such as the local
+    stand-in server in ``benchmarks/standin_server.py``.
+
+    Transient failures (connection errors, 429, 5xx, Cloudflare blocks) are retried
+    up to ``max_retries`` times with jittered exponential backoff from
+    ``backoff_base`` seconds, honouring ``Retry-After``. ``breaker_threshold``
+    Cloudflare blocks within a minute pause every worker for ``breaker_cooldown``
+    seconds. The run ends with a summary of retried, recovered and abandoned URLs.
+
+    ``adaptive_rate=(min_rps, max_rps)`` lets an AIMD controller retune the request
+    rate within those bounds: it starts from ``requests_per_second`` (clamped),
+    grows additively while responses stay fast and healthy, and halves on 429s,
+    Cloudflare security pages, transport errors or latency spikes.
+
+    Every run logs a metrics summary. ``metrics_path`` writes the full run report
+    as JSON: per-phase timings (discovery, scrape, write), requests by endpoint,
+    transport and status, bytes downloaded, latency histograms, parse time per
+    extractor and rows per second. ``prometheus_path`` writes the same report as a
+    Prometheus textfile (``glassdoorcrawler.metrics``).
+
+    Rows are ``glassdoorcrawler.records.JobRecord`` objects until the DataFrame is
+    built. With ``compress_descriptions=True`` the rows held for the DataFrame (or
+    waiting for their ``source_searches``) keep ``job_description`` zlib-compressed,
+    which cuts their memory several times over for a little CPU.
+
+    ``description_store`` moves descriptions out of the rows into a SQLite side
+    store (``glassdoorcrawler.descriptions``): each distinct text is compressed
+    once with ``description_codec`` (``zlib``, or ``zstd`` with ``zstandard``
+    installed) and the row carries a ``description_hash`` column instead of
+    ``job_description``.
+    """
+    return _run_crawl(
+        [base_url],
+        num_pages,
+        output_path,
+        delay_seconds,
+        use_env_proxies,
+        concurrency,
+        requests_per_second,
+        burst,
+        batch_size,
+        return_dataframe,
+        cache_dir,
+        cache_ttls,
+        state_dir,
+        page_concurrency,
+        pagination_cache,
+        transport_state,
+        search_concurrency=1,
+        record_sources=False,
+        incremental=incremental,
+        listing_index=listing_index,
+        freshness_seconds=freshness_seconds,
+        parse_workers=parse_workers,
+        origin=origin,
+        max_retries=max_retries,
+        backoff_base=backoff_base,
+        breaker_threshold=breaker_threshold,
+        breaker_cooldown=breaker_cooldown,
+        adaptive_rate=adaptive_rate,
+        metrics_path=metrics_path,
+        prometheus_path=prometheus_path,
+        compress_descriptions=compress_descriptions,
+        description_store=description_store,
+        description_codec=description_codec,
+    )
+
+
+def crawl_searches(
+    base_urls: Iterable[str],
+    num_pages: int = 1,
+    output_path: str = "glassdoor_vagas.xlsx",
+    delay_seconds: float = 0.5,
+    use_env_proxies: bool = True,
+    concurrency: int = 1,
+    requests_per_second: Optional[float] = None,
+    burst: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    return_dataframe: bool = True,
+    cache_dir: Optional[str] = None,
+    cache_ttls: Optional[Dict[str, float]] = None,
+    state_dir: Optional[str] = None,
+    page_concurrency: int = 1,
+    pagination_cache: Optional[str] = None,
+    transport_state: Optional[str] = None,
+    incremental: bool = False,
+    listing_index: Optional[str] = None,
+    freshness_seconds: float = DEFAULT_FRESHNESS_SECONDS,
+    parse_workers: int = 0,
+    origin: Optional[str] = None,
+    max_retries: int = 3,
+    backoff_base: float = 1.0,
+    breaker_threshold: int = 5,
+    breaker_cooldown: float = 120.0,
+    adaptive_rate: Optional[Tuple[float, float]] = None,
+    metrics_path: Optional[str] = None,
+    prometheus_path: Optional[str] = None,
+    compress_descriptions: bool = False,
+    description_store: Optional[str] = None,
+    description_codec: str = "zlib",
+    search_concurrency: int = 2,
+) -> Optional["pd.DataFrame"]:
+    """Crawl several searches into one output with a single shared client.
+
+    Every search is paginated like ``crawl_jobs`` (``num_pages`` each), up to
+    ``search_concurrency`` at a time, through one ``_HttpClient``: the rate limit,
+    response cache and Cloudflare transport are shared. Job links are deduplicated
+    across all searches before any job page is scraped, and each row gets a
+    ``source_searches`` column with the space-separated URLs of the searches that
+    surfaced the listing. The remaining options behave as in ``crawl_jobs``; with
+    ``state_dir`` each search keeps its own frontier checkpoint and the scraped rows
+    share one ledger for the batch.
+    """
+    searches = list(dict.fromkeys(base_urls))
+    if not searches:
+        raise ValueError("at least one search URL is required")
+    return _run_crawl(
+        searches,
+        num_pages,
+        output_path,
+        delay_seconds,
+        use_env_proxies,
+        concurrency,
+        requests_per_second,
+        burst,
+        batch_size,
+        return_dataframe,
+        cache_dir,
+        cache_ttls,
+        state_dir,
+        page_concurrency,
+        pagination_cache,
+        transport_state,
+        search_concurrency=search_concurrency,
+        record_sources=True,
+        incremental=incremental,
+        listing_index=listing_index,
+        freshness_seconds=freshness_seconds,
+        parse_workers=parse_workers,
+        origin=origin,
+        max_retries=max_retries,
+        backoff_base=backoff_base,
+        breaker_threshold=breaker_threshold,
+        breaker_cooldown=breaker_cooldown,
+        adaptive_rate=adaptive_rate,
+        metrics_path=metrics_path,
+        prometheus_path=prometheus_path,
+        compress_descriptions=compress_descriptions,
+        description_store=description_store,
+        description_codec=description_codec,
+    )
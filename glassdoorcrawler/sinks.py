@@ -0,0 +1,396 @@
+import csv
+import json
+import logging
+import math
+import os
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
+
+# pandas and pyarrow are imported by the outputs that need them.
+if TYPE_CHECKING:
+    import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+# Rows per Parquet row group; batches are held encoded until one is full.
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+SINK_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+# Formats written with the typed schema of ``glassdoorcrawler.schema``.
+TYPED_FORMATS = ("parquet", "arrow")
+EXCEL_SUFFIXES = (".xlsx", ".xlsm")
+# Worksheet limits of Excel 2007+; rows include the header row.
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_CELL_CHARS = 32_767
+
+
+def _clean_value(value: Any) -> Any:
+    # Scraped records use None for missing values; NaN (from older checkpoints or
+    # callers' rows) is accepted by neither JSON nor Arrow string columns.
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class RowSink:
+    """Base class for outputs that receive scraped rows while the crawl runs.
+
+    Rows are buffered and handed to ``_write_batch`` every ``batch_size`` rows, so
+    only one batch is held in memory and everything flushed survives a crash.
+    """
+
+    # False for formats that are only readable once ``close()`` writes their footer.
+    _durable_on_flush = True
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than or equal to 1")
+        self.path = path
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._closed = False
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._buffer.append({key: _clean_value(value) for key, value in row.items()})
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        self._write_batch(batch)
+        self.rows_written += len(batch)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._closed = True
+
+    @property
+    def rows_persisted(self) -> int:
+        """Rows that a crash from now on would not lose."""
+        return self.rows_written if self._durable_on_flush or self._closed else 0
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self) -> "RowSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class JsonlSink(RowSink):
+    """One JSON object per line; the staging format for other conversions."""
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(path, batch_size=batch_size)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class CsvSink(RowSink):
+    """CSV output; the header comes from ``fieldnames`` or the first row."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fieldnames: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(path, batch_size=batch_size)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._fieldnames = list(fieldnames) if fieldnames else None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._file,
+                fieldnames=self._fieldnames or list(rows[0].keys()),
+                extrasaction="ignore",
+            )
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class _TypedSink(RowSink):
+    """Base for columnar outputs using ``glassdoorcrawler.schema`` (requires ``pyarrow``).
+
+    Salaries become numeric columns with currency and period, company, location,
+    currency and period are dictionary-encoded and ``scraped_at`` is a UTC
+    timestamp.
+    """
+
+    _durable_on_flush = False
+    # Whether dictionary columns share one dictionary across batches.
+    _cumulative_dictionaries = True
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        try:
+            import pyarrow
+        except ImportError as exc:
+            raise RuntimeError("pyarrow is not installed") from exc
+        from .schema import ArrowBatchEncoder
+
+        super().__init__(path, batch_size=batch_size)
+        self._pa = pyarrow
+        self._encoder = ArrowBatchEncoder(cumulative_dictionaries=self._cumulative_dictionaries)
+        self._writer: Optional[Any] = None
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        batch = self._encoder.encode(rows)
+        if self._writer is None:
+            self._writer = self._open_writer(batch.schema)
+        self._writer.write_batch(batch)
+
+    def _close(self) -> None:
+        if self._writer is None:
+            # No rows: still leave a readable file with the typed columns.
+            self._writer = self._open_writer(self._encoder.encode([]).schema)
+        self._writer.close()
+
+    def _open_writer(self, schema: Any) -> Any:
+        raise NotImplementedError
+
+
+class ParquetSink(_TypedSink):
+    """Parquet output written in row groups of about ``row_group_size`` rows.
+
+    Each batch is encoded as it is flushed, with its own dictionaries, and held
+    until a row group is full; the batches of a row group are then unified into
+    one dictionary per column chunk. A Parquet file is only readable once its
+    footer is written on ``close()``, so holding a row group loses nothing.
+    """
+
+    _cumulative_dictionaries = False
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be greater than or equal to 1")
+        super().__init__(path, batch_size=batch_size)
+        import pyarrow.parquet
+
+        self._pq = pyarrow.parquet
+        self.row_group_size = row_group_size
+        self._row_group: List[Any] = []
+        self._row_group_rows = 0
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        batch = self._encoder.encode(rows)
+        self._row_group.append(batch)
+        self._row_group_rows += batch.num_rows
+        if self._row_group_rows >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        if not self._row_group:
+            return
+        table = self._pa.Table.from_batches(self._row_group).unify_dictionaries()
+        self._row_group, self._row_group_rows = [], 0
+        if self._writer is None:
+            self._writer = self._open_writer(table.schema)
+        self._writer.write_table(table, row_group_size=table.num_rows)
+
+    def _close(self) -> None:
+        self._write_row_group()
+        super()._close()
+
+    def _open_writer(self, schema: Any) -> Any:
+        return self._pq.ParquetWriter(self.path, schema, compression="zstd")
+
+
+class ArrowSink(_TypedSink):
+    """Arrow IPC file (Feather v2) output, one record batch per batch.
+
+    Dictionaries grow across batches; each batch writes only its new entries as
+    a dictionary delta.
+    """
+
+    def _open_writer(self, schema: Any) -> Any:
+        options = self._pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        return self._pa.ipc.new_file(self.path, schema, options=options)
+
+
+def sink_format_for_path(path: str) -> Optional[str]:
+    return SINK_FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def is_excel_path(path: str) -> bool:
+    return path.lower().endswith(EXCEL_SUFFIXES)
+
+
+def open_sink(path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> RowSink:
+    """Open the sink matching the extension of ``path``."""
+    sink_format = sink_format_for_path(path)
+    if sink_format == "jsonl":
+        return JsonlSink(path, batch_size=batch_size)
+    if sink_format == "csv":
+        return CsvSink(path, batch_size=batch_size)
+    if sink_format == "parquet":
+        return ParquetSink(path, batch_size=batch_size)
+    if sink_format == "arrow":
+        return ArrowSink(path, batch_size=batch_size)
+    raise ValueError(f"Unsupported output format: {path}")
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield rows from a JSONL file, skipping a truncated trailing line."""
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+class ExcelSink(RowSink):
+    """Excel output through openpyxl's write-only mode (requires ``openpyxl``).
+
+    Rows are streamed to the worksheet XML as they come, so memory stays flat
+    however many rows are written. A new sheet (``Sheet2``, ...) starts when one
+    reaches ``max_rows`` rows, header included, and text longer than Excel's cell
+    limit is truncated. The header comes from ``fieldnames`` or the first row.
+    """
+
+    _durable_on_flush = False
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fieldnames: Optional[Sequence[str]] = None,
+        max_rows: int = EXCEL_MAX_ROWS,
+    ):
+        if max_rows < 2:
+            raise ValueError("max_rows must leave room for the header and one row")
+        try:
+            import openpyxl
+            from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        except ImportError as exc:
+            raise RuntimeError("openpyxl is not installed") from exc
+        super().__init__(path, batch_size=batch_size)
+        self.max_rows = max_rows
+        self.cells_truncated = 0
+        self._illegal_characters = ILLEGAL_CHARACTERS_RE
+        self._workbook = openpyxl.Workbook(write_only=True)
+        self._fieldnames = list(fieldnames) if fieldnames else None
+        self._sheet: Optional[Any] = None
+        self._sheet_rows = 0
+
+    def _cell(self, value: Any) -> Any:
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            # Excel has no time zones; typed outputs store UTC.
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, ensure_ascii=False)
+        if not isinstance(value, str):
+            return value
+        value = self._illegal_characters.sub("", value)
+        if len(value) > EXCEL_MAX_CELL_CHARS:
+            self.cells_truncated += 1
+            value = value[:EXCEL_MAX_CELL_CHARS]
+        return value
+
+    def _new_sheet(self) -> None:
+        self._sheet = self._workbook.create_sheet(f"Sheet{len(self._workbook.worksheets) + 1}")
+        self._sheet.append(self._fieldnames)
+        self._sheet_rows = 1
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        if self._fieldnames is None:
+            self._fieldnames = list(rows[0].keys())
+        for row in rows:
+            if self._sheet is None or self._sheet_rows >= self.max_rows:
+                self._new_sheet()
+            self._sheet.append([self._cell(row.get(name)) for name in self._fieldnames])
+            self._sheet_rows += 1
+
+    def _close(self) -> None:
+        if self._sheet is None:
+            self._workbook.create_sheet("Sheet1")
+        self._workbook.save(self.path)
+        if self.cells_truncated:
+            LOGGER.warning(
+                "Truncated %s cells of %s to Excel's %s character limit.",
+                self.cells_truncated,
+                self.path,
+                EXCEL_MAX_CELL_CHARS,
+            )
+
+
+def iter_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a JSONL, CSV, Parquet or Arrow IPC file one batch at a time."""
+    sink_format = sink_format_for_path(path)
+    if sink_format == "jsonl":
+        yield from iter_jsonl(path)
+    elif sink_format == "csv":
+        with open(path, encoding="utf-8", newline="") as handle:
+            yield from csv.DictReader(handle)
+    elif sink_format == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches():
+            yield from batch.to_pylist()
+    elif sink_format == "arrow":
+        import pyarrow as pa
+
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                yield from reader.get_batch(index).to_pylist()
+    else:
+        raise ValueError(f"Unsupported input format: {path}")
+
+
+def convert_to_excel(source_path: str, excel_path: str, batch_size: int = 1000) -> int:
+    """Stream the rows of ``source_path`` into an Excel workbook; returns the row count."""
+    with ExcelSink(excel_path, batch_size=batch_size) as sink:
+        for row in iter_rows(source_path):
+            sink.write(row)
+    return sink.rows_written
+
+
+def jsonl_to_excel(jsonl_path: str, excel_path: str) -> "pd.DataFrame":
+    """Convert a JSONL staging file into an Excel workbook and return the DataFrame.
+
+    Loads every row into memory for the DataFrame; ``convert_to_excel`` does not.
+    """
+    import pandas as pd
+
+    convert_to_excel(jsonl_path, excel_path)
+    return pd.DataFrame.from_records(list(iter_jsonl(jsonl_path)))
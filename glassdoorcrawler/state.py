@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+
+class CrawlState:
+    """Checkpoint of one crawl, kept in ``<state_dir>/<crawl id>/``.
+
+    The crawl id is derived from the search URL and page count, so re-running the
+    same command finds the same checkpoint. ``frontier.json`` holds the links found
+    per result page plus the BFF pagination bootstrap (cursors included);
+    ``rows.jsonl`` holds one ``{"url": ..., "row": ...}`` line per scraped job and
+    doubles as the set of completed job URLs.
+    """
+
+    def __init__(self, state_dir: str, base_url: str, num_pages: int):
+        crawl_id = hashlib.sha256(f"{base_url}|{num_pages}".encode("utf-8")).hexdigest()[:16]
+        self.directory = os.path.join(state_dir, crawl_id)
+        self.base_url = base_url
+        self.num_pages = num_pages
+        self._frontier_path = os.path.join(self.directory, "frontier.json")
+        self._rows_path = os.path.join(self.directory, "rows.jsonl")
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+        frontier = self._load_frontier()
+        self.pages: Dict[int, List[str]] = {int(page): links for page, links in frontier["pages"].items()}
+        self.bootstrap: Optional[Dict[str, Any]] = _decode_bootstrap(frontier.get("bootstrap"))
+        self.links_complete: bool = bool(frontier.get("links_complete"))
+        self.completed_urls: Set[str] = {entry["url"] for entry in self._iter_entries()}
+        self._rows_file: Optional[Any] = None
+
+    def _load_frontier(self) -> Dict[str, Any]:
+        try:
+            with open(self._frontier_path, encoding="utf-8") as handle:
+                frontier = json.load(handle)
+        except (OSError, ValueError):
+            return {"pages": {}}
+        if frontier.get("base_url") != self.base_url:
+            return {"pages": {}}
+        return frontier
+
+    def _save_frontier(self) -> None:
+        frontier = {
+            "base_url": self.base_url,
+            "num_pages": self.num_pages,
+            "pages": {str(page): links for page, links in sorted(self.pages.items())},
+            "bootstrap": _encode_bootstrap(self.bootstrap),
+            "links_complete": self.links_complete,
+        }
+        tmp_path = self._frontier_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(frontier, handle, ensure_ascii=False)
+        os.replace(tmp_path, self._frontier_path)
+
+    def recorded_pages(self) -> List[List[str]]:
+        """Links of the contiguous run of recorded pages starting at page 1."""
+        pages: List[List[str]] = []
+        page = 1
+        while page in self.pages:
+            pages.append(self.pages[page])
+            page += 1
+        return pages
+
+    def record_page(self, page: int, links: List[str], bootstrap: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self.pages[page] = list(links)
+            if bootstrap is not None:
+                self.bootstrap = bootstrap
+            self._save_frontier()
+
+    def mark_links_complete(self) -> None:
+        with self._lock:
+            self.links_complete = True
+            self._save_frontier()
+
+    def record_row(self, url: str, row: Dict[str, Any]) -> None:
+        """Append a scraped row; once flushed the URL counts as completed."""
+        line = json.dumps({"url": url, "row": dict(row)}, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._rows_file is None:
+                self._rows_file = open(self._rows_path, "a", encoding="utf-8")
+            self._rows_file.write(line)
+            self._rows_file.flush()
+            self.completed_urls.add(url)
+
+    def _iter_entries(self) -> Iterator[Dict[str, Any]]:
+        try:
+            handle = open(self._rows_path, encoding="utf-8")
+        except OSError:
+            return
+        with handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write leaves a truncated last line; that job is redone.
+                    continue
+                if isinstance(entry, dict) and "url" in entry:
+                    yield entry
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        for _url, row in self.iter_url_rows():
+            yield row
+
+    def iter_url_rows(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        self.close()
+        for entry in self._iter_entries():
+            yield entry["url"], entry["row"]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._rows_file is not None:
+                self._rows_file.close()
+                self._rows_file = None
+
+    def clear(self) -> None:
+        """Drop the checkpoint once the crawl output has been written."""
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _encode_bootstrap(bootstrap: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if bootstrap is None:
+        return None
+    cursors = bootstrap.get("pagination_cursors") or {}
+    return {**bootstrap, "pagination_cursors": {str(page): cursor for page, cursor in cursors.items()}}
+
+
+def _decode_bootstrap(bootstrap: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if bootstrap is None:
+        return None
+    cursors = bootstrap.get("pagination_cursors") or {}
+    return {**bootstrap, "pagination_cursors": {int(page): cursor for page, cursor in cursors.items()}}
+
+
+class PaginationStrategyStore:
+    """Remembers which pagination URL scheme worked, persisted across runs.
+
+    Schemes are stored per exact search URL and per URL pattern (host, first path
+    segment and ``.htm`` suffix), so a new search on the same site starts with the
+    scheme that worked for its siblings.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            data = {}
+        self._by_url: Dict[str, str] = dict(data.get("by_url") or {})
+        self._by_pattern: Dict[str, str] = dict(data.get("by_pattern") or {})
+
+    @staticmethod
+    def pattern_for(base_url: str) -> str:
+        parsed = urlparse(base_url)
+        segments = [segment for segment in parsed.path.split("/") if segment]
+        first_segment = segments[0] if len(segments) > 1 else ""
+        suffix = ".htm" if parsed.path.endswith(".htm") else ""
+        return f"{parsed.netloc.lower()}/{first_segment}/*{suffix}"
+
+    def lookup(self, base_url: str) -> Optional[str]:
+        with self._lock:
+            return self._by_url.get(base_url) or self._by_pattern.get(self.pattern_for(base_url))
+
+    def remember(self, base_url: str, scheme: str) -> None:
+        with self._lock:
+            pattern = self.pattern_for(base_url)
+            if self._by_url.get(base_url) == scheme and self._by_pattern.get(pattern) == scheme:
+                return
+            self._by_url[base_url] = scheme
+            self._by_pattern[pattern] = scheme
+            self._save()
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"by_url": self._by_url, "by_pattern": self._by_pattern}, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class TransportStore:
+    """Persists the winning transport per host and the session cookie jar.
+
+    ``hosts`` maps a host to the curl_cffi impersonation profile that got past the
+    Cloudflare security page; ``cookies`` holds the jar (clearance cookies
+    included). Everything saved expires ``ttl_seconds`` after it was obtained so a
+    stale profile or clearance is rediscovered instead of being trusted forever;
+    saving an entry unchanged keeps its original expiry.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 6 * 3600, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            data = {}
+        now = clock()
+        self._profile_expiry: Dict[str, float] = {
+            host: entry["expires_at"]
+            for host, entry in (data.get("hosts") or {}).items()
+            if entry.get("profile") and entry.get("expires_at", 0) > now
+        }
+        self.profiles: Dict[str, str] = {host: data["hosts"][host]["profile"] for host in self._profile_expiry}
+        self._cookies_expire_at: float = data.get("cookies_expire_at", 0)
+        cookies_valid = self._cookies_expire_at > now
+        self.cookies: List[Dict[str, Any]] = [
+            cookie
+            for cookie in (data.get("cookies") or [])
+            if cookies_valid and (cookie.get("expires") is None or cookie["expires"] > now)
+        ]
+
+    def save(self, profiles: Dict[str, str], cookies: List[Dict[str, Any]]) -> None:
+        expires_at = self._clock() + self.ttl_seconds
+        hosts = {
+            host: {
+                "profile": profile,
+                "expires_at": self._profile_expiry[host] if self.profiles.get(host) == profile else expires_at,
+            }
+            for host, profile in profiles.items()
+        }
+        cookies_expire_at = expires_at
+        if self.cookies and _cookie_values(cookies) == _cookie_values(self.cookies):
+            # The jar was only loaded and written back: keep its original expiry.
+            cookies, cookies_expire_at = self.cookies, self._cookies_expire_at
+        data = {"hosts": hosts, "cookies": cookies, "cookies_expire_at": cookies_expire_at}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def _cookie_values(cookies: List[Dict[str, Any]]) -> set:
+    return {(cookie["domain"], cookie["path"], cookie["name"], cookie["value"]) for cookie in cookies}
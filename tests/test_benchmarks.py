@@ -0,0 +1,70 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from benchmarks import bench_description_store, bench_import_time, bench_record_memory, make_fixtures, suite
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_every_case_runs_on_the_fixture_corpus(self) -> None:
+        cases = suite.build_cases(repeat=1, crawl_repeat=1)
+
+        results = [suite.measure(case) for case in cases]
+
+        self.assertIn("search_bootstrap", [result.name for result in results])
+        self.assertIn(f"crawl_jobs_{suite.CRAWL_PAGES}_pages", [result.name for result in results])
+        self.assertTrue(all(result.rows_per_second > 0 and result.peak_kib > 0 for result in results))
+
+    def test_fixture_corpus_is_what_the_generator_produces(self) -> None:
+        self.assertEqual(make_fixtures.stale_fixtures(), [])
+
+    def test_compare_flags_only_cases_beyond_the_threshold(self) -> None:
+        results = [suite.Result("fast", 1.05, 1.0, 100.0), suite.Result("slow", 1.5, 1.0, 100.0)]
+        baseline = {
+            "fast": {"seconds": 1.0, "peak_kib": 100.0},
+            "slow": {"seconds": 1.0, "peak_kib": 100.0},
+        }
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            regressions = suite.compare(results, baseline, threshold=0.10)
+
+        self.assertEqual(regressions, ["slow"])
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_entry_points_do_not_load_heavy_modules(self) -> None:
+        for module, allowed in bench_import_time.TARGETS.items():
+            with self.subTest(module=module):
+                self.assertEqual(bench_import_time.loaded_heavy_modules(module) - set(allowed), set())
+
+
+class RecordMemoryTests(unittest.TestCase):
+    def test_compact_records_hold_less_than_dicts(self) -> None:
+        rows = bench_record_memory.make_rows(300, description_bytes=2000)
+
+        held = {
+            name: bench_record_memory.measure(rows, build)["bytes"]
+            for name, build in bench_record_memory.REPRESENTATIONS.items()
+        }
+
+        self.assertLess(held["JobRecord"], held["dict"])
+        self.assertLess(held["JobRecord, compressed"], held["dict"] / 2)
+
+
+class DescriptionStoreBenchmarkTests(unittest.TestCase):
+    def test_store_output_is_smaller_when_descriptions_repeat(self) -> None:
+        rows = bench_description_store.make_listings(400, distinct=20, description_bytes=2000)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            inline = bench_description_store.write_inline(rows, os.path.join(tmp_dir, "inline.jsonl"), 100)
+            stored = bench_description_store.write_with_store(
+                rows, os.path.join(tmp_dir, "hashed.jsonl"), os.path.join(tmp_dir, "store.sqlite"), 100, "zlib"
+            )
+
+        self.assertLess(stored["bytes"] * 5, inline["bytes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.cache import ResponseCache, classify_url
+
+JOB_URL = "https://www.glassdoor.com.br/job-listing/dev-JV_IC2514646.htm?jl=1"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.clock = FakeClock()
+        self.cache = ResponseCache(tmp_dir.name, ttls={"job": 60}, clock=self.clock)
+        self.client = scraper._HttpClient(cache=self.cache)
+
+    def _send(self, *responses: SimpleNamespace) -> mock.MagicMock:
+        patcher = mock.patch.object(self.client._requests_session, "request", side_effect=list(responses))
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_classify_url_by_path(self) -> None:
+        self.assertEqual(classify_url(JOB_URL), "job")
+        self.assertEqual(classify_url(scraper.JOB_SEARCH_RESULTS_BFF_URL), "bff")
+        self.assertEqual(classify_url("https://www.glassdoor.com.br/Vaga/base.htm"), "search")
+
+    def test_key_depends_on_method_url_and_payload(self) -> None:
+        base = ResponseCache.key("POST", scraper.JOB_SEARCH_RESULTS_BFF_URL, {"pageNumber": 2})
+
+        self.assertEqual(base, ResponseCache.key("post", scraper.JOB_SEARCH_RESULTS_BFF_URL, {"pageNumber": 2}))
+        self.assertNotEqual(base, ResponseCache.key("POST", scraper.JOB_SEARCH_RESULTS_BFF_URL, {"pageNumber": 3}))
+        self.assertNotEqual(base, ResponseCache.key("GET", scraper.JOB_SEARCH_RESULTS_BFF_URL))
+
+    def test_fresh_entry_is_served_without_a_request(self) -> None:
+        request_mock = self._send(SimpleNamespace(status_code=200, headers={}, text="<html>1</html>"))
+
+        first = self.client.get(JOB_URL, headers={}, timeout=1)
+        self.clock.now += 30
+        second = self.client.get(JOB_URL, headers={}, timeout=1)
+
+        self.assertEqual(first.text, second.text)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(request_mock.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_stale_entry_is_revalidated_with_validators(self) -> None:
+        request_mock = self._send(
+            SimpleNamespace(status_code=200, headers={"etag": '"v1"'}, text="<html>1</html>"),
+            SimpleNamespace(status_code=304, headers={}, text=""),
+        )
+
+        self.client.get(JOB_URL, headers={}, timeout=1)
+        self.clock.now += 120
+        response = self.client.get(JOB_URL, headers={"Accept": "text/html"}, timeout=1)
+
+        self.assertEqual(response.text, "<html>1</html>")
+        self.assertEqual(
+            request_mock.call_args_list[1].kwargs["headers"],
+            {"Accept": "text/html", "If-None-Match": '"v1"'},
+        )
+        self.assertEqual(self.cache.revalidated, 1)
+        self.clock.now += 30
+        self.assertTrue(self.client.get(JOB_URL, headers={}, timeout=1).from_cache)
+
+    def test_error_responses_are_not_cached(self) -> None:
+        request_mock = self._send(
+            SimpleNamespace(status_code=502, headers={}, text="bad gateway"),
+            SimpleNamespace(status_code=200, headers={}, text="ok"),
+        )
+
+        self.client.get(JOB_URL, headers={}, timeout=1)
+        response = self.client.get(JOB_URL, headers={}, timeout=1)
+
+        self.assertEqual(response.text, "ok")
+        self.assertEqual(request_mock.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+import unittest
+
+from glassdoorcrawler.descriptions import DescriptionStore, HashedJobRecord, description_hash, replace_description
+from glassdoorcrawler.records import JobRecord, with_fields
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class DescriptionStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.path = os.path.join(self._tmp_dir.name, "state", "descriptions.sqlite")
+
+    def test_identical_text_is_stored_once_and_mapped_per_listing(self) -> None:
+        text = "<p>Experiencia com Python.</p>" * 100
+        store = DescriptionStore(self.path)
+
+        keys = [store.put("1", text), store.put("2", text), store.put("3", "<p>Outra vaga</p>")]
+
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], description_hash(text))
+        self.assertEqual((store.stored, store.deduplicated), (2, 1))
+        self.assertEqual(store.get(keys[0]), text)
+        self.assertEqual(store.get_for_listing("2"), text)
+        self.assertIsNone(store.put("4", None))
+        self.assertIsNone(store.get_for_listing("4"))
+        self.assertIn("2 distinct descriptions", store.summary())
+        store.close()
+
+    def test_descriptions_persist_and_reposts_are_deduplicated_across_runs(self) -> None:
+        store = DescriptionStore(self.path)
+        key = store.put("1", "texto")
+        store.close()
+
+        store = DescriptionStore(self.path)
+        self.assertEqual(store.put("2", "texto"), key)
+        self.assertEqual((store.stored, store.deduplicated), (0, 1))
+        self.assertEqual(store.get_for_listing("1"), "texto")
+        store.close()
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_store_reads_blobs_written_with_zlib(self) -> None:
+        store = DescriptionStore(self.path, codec="zlib")
+        key = store.put("1", "texto")
+        store.close()
+
+        store = DescriptionStore(self.path, codec="zstd")
+        self.assertEqual(store.get(key), "texto")
+        self.assertEqual(store.get(store.put("2", "outro")), "outro")
+        store.close()
+
+    def test_unknown_codec_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            DescriptionStore(self.path, codec="lzma")
+
+    def test_commit_makes_puts_visible_before_close(self) -> None:
+        store = DescriptionStore(self.path)
+        self.addCleanup(store.close)
+        key = store.put("1", "texto")
+
+        store.commit()
+
+        connection = sqlite3.connect(self.path)
+        self.addCleanup(connection.close)
+        self.assertEqual(
+            connection.execute("SELECT hash FROM listing_descriptions WHERE listing_id = '1'").fetchone(), (key,)
+        )
+
+    def test_replace_description_keeps_the_column_position(self) -> None:
+        row = JobRecord(job_title="Dev", job_description="texto", source_searches="a").compress_description()
+
+        record = replace_description(row, "abc")
+
+        self.assertIsInstance(record, HashedJobRecord)
+        self.assertNotIn("job_description", record)
+        self.assertEqual(
+            list(record.items()),
+            [
+                ("job_title", "Dev"),
+                ("company_name", None),
+                ("location", None),
+                ("salary_estimated", None),
+                ("salary_min", None),
+                ("salary_max", None),
+                ("description_hash", "abc"),
+                ("source_searches", "a"),
+            ],
+        )
+
+    def test_hashed_record_survives_new_fields_and_pickling(self) -> None:
+        record = with_fields(replace_description({"job_title": "Dev", "job_description": "texto"}, "abc"), scraped_at="t")
+
+        self.assertIsInstance(record, HashedJobRecord)
+        self.assertEqual((record["description_hash"], record["scraped_at"]), ("abc", "t"))
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertIs(record.compress_description(), record)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.listings import ListingIndex, listing_id_from_url
+
+BASE_URL = "https://www.glassdoor.com.br/Vaga/base.htm"
+
+
+def _link(listing_id: int) -> str:
+    return f"https://www.glassdoor.com/job-listing/dev-acme-JV_IC2514646_KO0,3_KE4,8.htm?jl={listing_id}&pos=101"
+
+
+class ListingIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        self.now = 1000.0
+
+    def test_listing_id_comes_from_jl_parameter_or_path(self) -> None:
+        self.assertEqual(listing_id_from_url(_link(1009)), "1009")
+        self.assertEqual(
+            listing_id_from_url("https://www.glassdoor.com/job-listing/Dev-Acme-JV_KO0,3.htm"),
+            "/job-listing/dev-acme-jv_ko0,3.htm",
+        )
+
+    def test_listing_is_fresh_until_the_window_passes(self) -> None:
+        index = ListingIndex(os.path.join(self.tmp_dir, "listings.sqlite"), freshness_seconds=60, clock=lambda: self.now)
+        self.addCleanup(index.close)
+
+        index.mark_seen(_link(1))
+        self.assertFalse(index.is_fresh(_link(1)))
+
+        index.mark_scraped(_link(1).replace("pos=101", "pos=205"))
+        self.now += 30
+        self.assertTrue(index.is_fresh(_link(1)))
+        self.now += 31
+        self.assertFalse(index.is_fresh(_link(1)))
+        self.assertEqual(len(index), 1)
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_incremental_crawl_only_scrapes_new_listings(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        scrap_job_page_mock.side_effect = lambda url, session: {"job_title": url}
+        output_path = os.path.join(self.tmp_dir, "vagas.jsonl")
+        index_path = os.path.join(self.tmp_dir, "listings.sqlite")
+
+        iter_page_links_mock.return_value = [[_link(1), _link(2)]]
+        scraper.crawl_jobs(BASE_URL, output_path=output_path, delay_seconds=0, listing_index=index_path)
+
+        scrap_job_page_mock.reset_mock()
+        iter_page_links_mock.return_value = [[_link(1), _link(2), _link(3)]]
+        scraper.crawl_jobs(BASE_URL, output_path=output_path, delay_seconds=0, listing_index=index_path, incremental=True)
+
+        self.assertEqual([call.args[0] for call in scrap_job_page_mock.call_args_list], [_link(3)])
+        with open(output_path, encoding="utf-8") as handle:
+            rows = [json.loads(line) for line in handle]
+        self.assertEqual(rows, [{"job_title": _link(3)}])
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_listings_are_marked_scraped_only_once_their_rows_are_flushed(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        index_path = os.path.join(self.tmp_dir, "listings.sqlite")
+        marked_before_scrape = {}
+
+        def fake_scrape(url: str, session: object) -> dict:
+            index = ListingIndex(index_path)
+            marked_before_scrape[url] = [link for link in (_link(1), _link(2)) if index.last_scraped(link) is not None]
+            index.close()
+            return {"job_title": url}
+
+        iter_page_links_mock.return_value = [[_link(1), _link(2), _link(3)]]
+        scrap_job_page_mock.side_effect = fake_scrape
+        scraper.crawl_jobs(
+            BASE_URL,
+            output_path=os.path.join(self.tmp_dir, "vagas.jsonl"),
+            delay_seconds=0,
+            batch_size=2,
+            listing_index=index_path,
+        )
+
+        # The row of listing 1 sits in the sink buffer until listing 2 fills the batch.
+        self.assertEqual(marked_before_scrape, {_link(1): [], _link(2): [], _link(3): [_link(1), _link(2)]})
+        index = ListingIndex(index_path)
+        self.addCleanup(index.close)
+        self.assertTrue(all(index.last_scraped(_link(listing_id)) is not None for listing_id in (1, 2, 3)))
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_fetches_each_listing_once_across_hosts_and_slugs(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        variant = "https://www.glassdoor.com.br/job-listing/desenvolvedor-acme-JV_KO0,13.htm?jl=1"
+        iter_page_links_mock.return_value = [[_link(1), _link(2)], [variant, _link(3)]]
+        scrap_job_page_mock.side_effect = lambda url, session: {"job_title": url}
+
+        with self.assertLogs("glassdoorcrawler.scraper", level="INFO") as logs:
+            scraper.crawl_jobs(BASE_URL, output_path=os.path.join(self.tmp_dir, "vagas.jsonl"), delay_seconds=0)
+
+        self.assertEqual([call.args[0] for call in scrap_job_page_mock.call_args_list], [_link(1), _link(2), _link(3)])
+        self.assertTrue(any("Avoided 1 duplicate job page fetches" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
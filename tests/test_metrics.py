@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.metrics import CrawlMetrics, render_prometheus
+
+BASE_URL = "https://www.glassdoor.com.br/Vaga/base.htm"
+JOB_URL = "https://www.glassdoor.com.br/job-listing/dev-acme-JV_KO0,3.htm?jl=1"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CrawlMetricsTests(unittest.TestCase):
+    def test_report_groups_requests_and_fills_latency_buckets(self) -> None:
+        clock = FakeClock()
+        metrics = CrawlMetrics(clock=clock, wall_clock=lambda: 1_700_000_000.0)
+
+        metrics.record_request(JOB_URL, "requests", 200, 1000, 0.2)
+        metrics.record_request(JOB_URL, "curl_cffi:chrome", 200, 500, 3.0)
+        metrics.record_request(BASE_URL, "requests", None, latency=0.01)
+        metrics.record_parse("_parse_job_page_fast", 0.004)
+        with metrics.phase("scrape"):
+            clock.now += 2
+        metrics.record_rows(4)
+        report = metrics.report()
+
+        self.assertEqual(report["requests"]["by_endpoint"], {"job": 2, "search": 1})
+        self.assertEqual(report["requests"]["by_status"], {"200": 2, "error": 1})
+        self.assertEqual(report["bytes"]["by_endpoint"], {"job": 1500, "search": 0})
+        self.assertEqual(report["latency_seconds"]["job"]["buckets"]["0.25"], 1)
+        self.assertEqual(report["latency_seconds"]["job"]["buckets"]["5.0"], 2)
+        self.assertEqual(report["parse"], {"_parse_job_page_fast": {"calls": 1, "seconds": 0.004}})
+        self.assertEqual(report["rows_per_second"], 2.0)
+
+        text = render_prometheus(report)
+        self.assertIn('glassdoorcrawler_requests{endpoint="job",transport="curl_cffi:chrome",status="200"} 1', text)
+        self.assertIn('glassdoorcrawler_request_latency_seconds_bucket{endpoint="job",le="+Inf"} 2', text)
+        self.assertIn("# TYPE glassdoorcrawler_request_latency_seconds histogram", text)
+
+    def test_http_client_records_transport_status_and_bytes(self) -> None:
+        client = scraper._HttpClient(use_env_proxies=False)
+        response = mock.Mock(status_code=200, headers={}, text="ok", content=b"ok")
+
+        with mock.patch.object(client._requests_session, "request", return_value=response):
+            client.get(JOB_URL, headers={}, timeout=5)
+
+        report = client.metrics.report()
+        self.assertEqual(report["requests"]["by_transport"], {"requests": 1})
+        self.assertEqual(report["bytes"]["total"], 2)
+        self.assertEqual(report["latency_seconds"]["job"]["count"], 1)
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_writes_json_report_and_prometheus_textfile(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        iter_page_links_mock.return_value = [[JOB_URL, JOB_URL.replace("jl=1", "jl=2")]]
+        scrap_job_page_mock.side_effect = lambda url, session: {"job_title": url}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            metrics_path = os.path.join(tmp_dir, "report.json")
+            prometheus_path = os.path.join(tmp_dir, "metrics", "glassdoorcrawler.prom")
+            scraper.crawl_jobs(
+                BASE_URL,
+                output_path=os.path.join(tmp_dir, "vagas.jsonl"),
+                delay_seconds=0,
+                metrics_path=metrics_path,
+                prometheus_path=prometheus_path,
+            )
+            with open(metrics_path, encoding="utf-8") as handle:
+                report = json.load(handle)
+            with open(prometheus_path, encoding="utf-8") as handle:
+                text = handle.read()
+
+        self.assertEqual(report["rows"], 2)
+        self.assertEqual(sorted(report["phases"]), ["discovery", "scrape", "write"])
+        self.assertEqual(report["retries"], {"retried": 0, "recovered": 0, "abandoned": 0})
+        self.assertIn("glassdoorcrawler_rows 2", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from glassdoorcrawler import profiling
+
+SCRAPER = os.path.join("site-packages", "glassdoorcrawler", "scraper.py")
+
+
+class CategorizeTests(unittest.TestCase):
+    def test_innermost_matching_frame_decides(self) -> None:
+        cases = {
+            profiling.CATEGORY_SOUP: [
+                ("/usr/lib/python3/re/__init__.py", "sub"),
+                ("/x/bs4/builder/_htmlparser.py", "feed"),
+                (SCRAPER, "_parse_search_page"),
+            ],
+            profiling.CATEGORY_PAYLOAD: [
+                ("/usr/lib/python3/json/decoder.py", "decode"),
+                (SCRAPER, "_extract_search_bootstrap_for_pagination"),
+            ],
+            profiling.CATEGORY_EXTRACT: [(SCRAPER, "_parse_job_page_fast"), (SCRAPER, "_parse")],
+            profiling.CATEGORY_NETWORK: [("/usr/lib/python3/socket.py", "readinto"), (SCRAPER, "_send_with_retry")],
+            profiling.CATEGORY_WAIT: [(SCRAPER, "_send_with_retry"), (SCRAPER, "_request")],
+            profiling.CATEGORY_OUTPUT: [
+                ("/x/openpyxl/cell/_writer.py", "write_cell"),
+                ("/x/glassdoorcrawler/sinks.py", "jsonl_to_excel"),
+            ],
+            profiling.CATEGORY_IMPORT: [("/x/pandas/__init__.py", "<module>"), ("<frozen importlib._bootstrap>", "_load")],
+            profiling.CATEGORY_IDLE: [("/usr/lib/python3/threading.py", "wait"), (SCRAPER, "_scrape_jobs_concurrently")],
+            profiling.CATEGORY_OTHER: [("/usr/lib/python3/enum.py", "__call__")],
+        }
+        for category, stack in cases.items():
+            with self.subTest(category=category):
+                self.assertEqual(profiling.categorize(stack), category)
+
+
+class CrawlProfilerTests(unittest.TestCase):
+    def test_profiler_writes_collapsed_stacks_breakdown_and_pstats(self) -> None:
+        def busy() -> None:
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                sum(range(1000))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prefix = profiling.profile_prefix(os.path.join(tmp_dir, "out", "vagas.xlsx"))
+            with profiling.CrawlProfiler(prefix, mode="deterministic", interval=0.001) as profiler:
+                worker = threading.Thread(target=busy, name="glassdoor-job_0")
+                worker.start()
+                worker.join()
+
+            self.assertEqual([os.path.exists(path) for path in profiler.paths], [True, True, True])
+            with open(prefix + ".collapsed", encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+            with open(prefix + ".txt", encoding="utf-8") as handle:
+                breakdown = handle.read()
+
+        self.assertTrue(prefix.endswith(os.path.join("out", "vagas.profile")))
+        self.assertTrue(any(line.startswith("glassdoor-job;") and "test_profiling.py:busy" in line for line in lines))
+        self.assertIn("BeautifulSoup parsing", breakdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from unittest import mock
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.ratelimit import AimdRateController, HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_bucket_spends_burst_then_paces_at_rate(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.5)
+        self.assertAlmostEqual(waits[4], 0.5)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_time_spent_outside_the_bucket_counts_towards_the_next_token(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        clock.now += 0.75  # e.g. response latency plus parsing
+        wait = bucket.acquire()
+
+        self.assertAlmostEqual(wait, 0.25)
+
+    def test_host_limiter_keeps_one_bucket_per_host(self) -> None:
+        clock = FakeClock()
+        limiter = HostRateLimiter(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(limiter.acquire("https://www.glassdoor.com.br/a"), 0.0)
+        self.assertEqual(limiter.acquire("https://www.glassdoor.com/b"), 0.0)
+        self.assertAlmostEqual(limiter.acquire("https://www.glassdoor.com.br/c"), 1.0)
+
+    def test_host_limiter_without_rate_never_waits(self) -> None:
+        limiter = HostRateLimiter(rate=None)
+
+        self.assertIsNone(limiter.bucket_for("https://www.glassdoor.com.br/a"))
+        self.assertEqual(limiter.acquire("https://www.glassdoor.com.br/a"), 0.0)
+
+    def test_set_rate_credits_earned_tokens_at_the_old_rate(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        clock.now += 0.5
+        bucket.set_rate(4)
+
+        self.assertAlmostEqual(bucket.acquire(), 0.125)
+
+
+class AimdRateControllerTests(unittest.TestCase):
+    def _controller(self, clock: FakeClock, **kwargs: float) -> AimdRateController:
+        limiter = HostRateLimiter(rate=2, burst=1, clock=clock, sleep=clock.sleep)
+        return AimdRateController(limiter, min_rate=0.5, max_rate=3, clock=clock, **kwargs)
+
+    def test_healthy_responses_raise_the_rate_additively_up_to_the_maximum(self) -> None:
+        controller = self._controller(FakeClock(), increase=0.5, increase_every=2)
+        bucket = controller.limiter.bucket_for("https://www.glassdoor.com.br/a")
+
+        for _ in range(10):
+            self.assertIsNone(controller.observe(0.1))
+
+        self.assertEqual(controller.rate, 3)
+        self.assertEqual(bucket.rate, 3)
+        self.assertEqual(controller.increases, 2)
+
+    def test_throttling_halves_the_rate_once_per_interval_down_to_the_minimum(self) -> None:
+        clock = FakeClock()
+        controller = self._controller(clock, decrease_interval=5)
+
+        self.assertEqual(controller.observe(0.1, throttled=True), "throttled")
+        self.assertIsNone(controller.observe(0.1, throttled=True))  # same burst of failures
+        self.assertEqual(controller.rate, 1)
+        clock.now += 5
+        self.assertEqual(controller.observe(None), "error")
+        clock.now += 5
+        controller.observe(0.1, throttled=True)
+        self.assertEqual(controller.rate, 0.5)
+        self.assertEqual(controller.limiter.rate, 0.5)
+
+    def test_latency_spike_cuts_the_rate(self) -> None:
+        controller = self._controller(FakeClock(), increase_every=5, spike_factor=3)
+
+        for _ in range(5):
+            controller.observe(0.1)
+        self.assertEqual(controller.observe(0.5), "latency spike")
+        self.assertLess(controller.rate, 2)
+
+    def test_http_client_reports_429_to_the_controller(self) -> None:
+        limiter = HostRateLimiter(rate=4)
+        controller = AimdRateController(limiter, min_rate=1, max_rate=8)
+        client = scraper._HttpClient(use_env_proxies=False, rate_limiter=limiter, rate_controller=controller)
+        response = mock.Mock(status_code=429, headers={}, text="")
+
+        with mock.patch.object(client._requests_session, "request", return_value=response):
+            client.get("https://www.glassdoor.com.br/job-listing/1.htm", headers={}, timeout=5)
+
+        self.assertEqual(controller.rate, 2)
+        self.assertEqual(controller.decreases, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import pickle
+import sys
+import unittest
+
+from glassdoorcrawler.records import JOB_FIELDS, JobRecord, with_fields
+
+
+def _row(**fields: object) -> dict:
+    row = dict.fromkeys(JOB_FIELDS)
+    row.update(fields)
+    return row
+
+
+class JobRecordTests(unittest.TestCase):
+    def test_record_reads_like_the_dict_rows(self) -> None:
+        row = _row(job_title="Dev", company_name="ACME", salary_min=5000, job_description="<p>Python</p>")
+        record = JobRecord(**row)
+
+        self.assertEqual(record, row)
+        self.assertEqual(row, record)
+        self.assertEqual(list(record), list(JOB_FIELDS))
+        self.assertEqual(record["company_name"], "ACME")
+        self.assertIsNone(record.get("location"))
+        self.assertIsNone(record.get("missing"))
+        self.assertEqual({**record}, row)
+        self.assertEqual(json.loads(json.dumps(record.as_dict())), row)
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_company_and_location_are_interned(self) -> None:
+        first = JobRecord(company_name="".join(["AC", "ME"]), location="".join(["Belo ", "Horizonte"]))
+        second = JobRecord(company_name="".join(["A", "CME"]), location="".join(["Belo Hor", "izonte"]))
+
+        self.assertIs(first.company_name, second.company_name)
+        self.assertIs(first.location, second.location)
+
+    def test_compressed_description_reads_back_unchanged(self) -> None:
+        description = "<p>Experiencia com Python e APIs.</p>" * 50
+        record = JobRecord(job_description=description).compress_description()
+
+        self.assertTrue(record.description_compressed)
+        self.assertLess(sys.getsizeof(record._description), len(description))
+        self.assertEqual(record["job_description"], description)
+        self.assertEqual(record.compress_description()["job_description"], description)
+
+    def test_with_fields_appends_columns_and_keeps_the_compressed_description(self) -> None:
+        record = JobRecord(job_title="Dev", job_description="texto").compress_description()
+
+        stamped = with_fields(record, scraped_at="2026-01-01T00:00:00+00:00")
+
+        self.assertIsInstance(stamped, JobRecord)
+        self.assertTrue(stamped.description_compressed)
+        self.assertEqual(list(stamped)[-1], "scraped_at")
+        self.assertEqual(stamped["scraped_at"], "2026-01-01T00:00:00+00:00")
+        self.assertNotIn("scraped_at", record)
+        self.assertEqual(with_fields({"job_title": "Dev"}, scraped_at="x"), {"job_title": "Dev", "scraped_at": "x"})
+
+    def test_pickle_round_trip_keeps_extra_columns_and_interning(self) -> None:
+        record = JobRecord(company_name="ACME", job_description="texto", source_searches="a b").compress_description()
+
+        restored = pickle.loads(pickle.dumps(record))
+
+        self.assertEqual(restored, record)
+        self.assertTrue(restored.description_compressed)
+        self.assertIs(restored.company_name, sys.intern("ACME"))
+
+
+if __name__ == "__main__":
+    unittest.main()
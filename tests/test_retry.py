@@ -0,0 +1,136 @@
+import random
+import unittest
+from unittest import mock
+
+import requests
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.retry import CircuitBreaker, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status_code: int, headers: dict = None, text: str = "") -> mock.Mock:
+    return mock.Mock(status_code=status_code, headers=headers or {}, text=text)
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_backoff_is_jittered_exponential_and_capped(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, rng=random.Random(3))
+
+        delays = [policy.delay(attempt) for attempt in range(1, 6)]
+
+        for attempt, delay in enumerate(delays, start=1):
+            self.assertLessEqual(delay, min(5.0, 2 ** (attempt - 1)))
+        self.assertGreater(delays[3], 1.0)
+
+    def test_retry_after_takes_precedence_and_is_capped(self) -> None:
+        policy = RetryPolicy(max_retry_after=30)
+
+        self.assertEqual(policy.delay(1, _response(429, {"Retry-After": "12"})), 12.0)
+        self.assertEqual(policy.delay(1, _response(503, {"Retry-After": "900"})), 30.0)
+        self.assertTrue(policy.should_retry(None))
+        self.assertTrue(policy.should_retry(403, blocked=True))
+        self.assertFalse(policy.should_retry(404))
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_clustered_blocks_open_the_breaker_until_a_probe_succeeds(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(threshold=3, window=10, cooldown=60, clock=clock, sleep=clock.sleep)
+
+        self.assertFalse(breaker.record_block())
+        clock.now += 20  # outside the window: the first block no longer counts
+        self.assertFalse(breaker.record_block())
+        self.assertFalse(breaker.record_block())
+        self.assertTrue(breaker.record_block())
+
+        self.assertEqual(breaker.wait(), 60)
+        self.assertTrue(breaker.record_block())  # the probe after the cooldown was blocked again
+        self.assertEqual(breaker.wait(), 60)
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+        self.assertFalse(breaker.record_block())
+        self.assertEqual(breaker.trips, 2)
+
+    def test_wait_sleeps_again_when_the_breaker_reopens_meanwhile(self) -> None:
+        clock = FakeClock()
+
+        def sleep_while_another_worker_probes(seconds: float) -> None:
+            clock.sleep(seconds)
+            if len(clock.sleeps) == 1:
+                breaker.record_block()  # the other worker's probe was blocked
+
+        breaker = CircuitBreaker(threshold=1, cooldown=60, clock=clock, sleep=sleep_while_another_worker_probes)
+        self.assertTrue(breaker.record_block())
+
+        self.assertEqual(breaker.wait(), 120)
+        self.assertEqual(clock.sleeps, [60, 60])
+        self.assertFalse(breaker.is_open)
+
+
+class HttpClientRetryTests(unittest.TestCase):
+    def _client(self, clock: FakeClock) -> scraper._HttpClient:
+        return scraper._HttpClient(
+            use_env_proxies=False,
+            retry_policy=RetryPolicy(max_retries=3, backoff_base=1.0, rng=random.Random(0)),
+            sleep=clock.sleep,
+        )
+
+    def test_transient_failures_are_retried_and_recovered(self) -> None:
+        clock = FakeClock()
+        client = self._client(clock)
+        outcomes = [requests.ConnectionError("reset"), _response(429, {"Retry-After": "7"}), _response(200)]
+
+        with mock.patch.object(client._requests_session, "request", side_effect=outcomes):
+            response = client.get("https://www.glassdoor.com.br/job-listing/1.htm", headers={}, timeout=5)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(clock.sleeps), 2)
+        self.assertEqual(clock.sleeps[1], 7.0)
+        self.assertEqual(client.retry_stats.summary(), "1 URLs retried, 1 recovered, 0 abandoned")
+
+    def test_url_is_abandoned_after_the_last_retry(self) -> None:
+        clock = FakeClock()
+        client = self._client(clock)
+
+        with mock.patch.object(client._requests_session, "request", return_value=_response(503)) as request_mock:
+            response = client.get("https://www.glassdoor.com.br/job-listing/1.htm", headers={}, timeout=5)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(request_mock.call_count, 4)
+        self.assertEqual(client.retry_stats.summary(), "1 URLs retried, 0 recovered, 1 abandoned")
+
+    def test_fallback_transport_errors_abandon_the_url_without_aborting(self) -> None:
+        class FakeCurlError(Exception):
+            pass
+
+        clock = FakeClock()
+        client = self._client(clock)
+        client._curl_profiles["www.glassdoor.com.br"] = "chrome"
+        curl_requests = mock.Mock()
+        curl_requests.Session.return_value.request.side_effect = FakeCurlError("connection reset")
+        job_url = "https://www.glassdoor.com.br/job-listing/1.htm"
+
+        with mock.patch.object(scraper, "_curl_cffi", return_value=(curl_requests, FakeCurlError)):
+            self.assertIsNone(scraper._scrape_job_or_none(job_url, session=client))
+            links = scraper.get_all_links(2, "https://www.glassdoor.com.br/Vaga/base.htm", delay_seconds=0, session=client)
+
+        self.assertEqual(links, [])
+        self.assertIn(job_url, client.retry_stats.abandoned)
+        self.assertEqual(len(client.retry_stats.abandoned), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
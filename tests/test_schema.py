@@ -0,0 +1,106 @@
+import unittest
+from datetime import datetime, timezone
+
+from glassdoorcrawler import schema
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+class SalaryParsingTests(unittest.TestCase):
+    def test_amounts_follow_brazilian_and_english_separators(self) -> None:
+        cases = {
+            "R$ 7.500 /mes": 7500.0,
+            "R$ 1.250.000": 1250000.0,
+            "R$ 5,5 mil": 5500.0,
+            "US$ 120,000.50": 120000.5,
+            "€1.234,56": 1234.56,
+            "$85K": 85000.0,
+            "BRL 8500": 8500.0,
+            6000: 6000.0,
+            "a combinar": None,
+            float("nan"): None,
+            None: None,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(schema.parse_salary_amount(value), expected)
+
+    def test_currency_and_period_come_from_the_text(self) -> None:
+        self.assertEqual(schema.parse_salary_currency("R$ 5.000"), "BRL")
+        self.assertEqual(schema.parse_salary_currency("BRL 8500"), "BRL")
+        self.assertEqual(schema.parse_salary_currency("US$ 10"), "USD")
+        self.assertIsNone(schema.parse_salary_currency(6000))
+        self.assertEqual(schema.parse_salary_period("R$ 7.500 /mês"), "month")
+        self.assertEqual(schema.parse_salary_period("R$ 30/hora"), "hour")
+        self.assertEqual(schema.parse_salary_period("R$ 80 mil por ano"), "year")
+        self.assertIsNone(schema.parse_salary_period("R$ 5.000"))
+
+    def test_typed_values_keep_the_salary_text_and_extra_columns(self) -> None:
+        default = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        values = schema.typed_values(
+            {
+                "job_title": "Dev",
+                "salary_estimated": "R$ 7.500 /mes",
+                "salary_min": "R$ 5.000",
+                "salary_max": "R$ 10.000",
+                "source_searches": "python",
+                "scraped_at": "2026-03-04T05:06:07+00:00",
+            },
+            default,
+        )
+
+        self.assertEqual(values["salary_estimated"], 7500.0)
+        self.assertEqual((values["salary_min"], values["salary_max"]), (5000.0, 10000.0))
+        self.assertEqual((values["salary_currency"], values["salary_period"]), ("BRL", "month"))
+        self.assertEqual(values["salary_text"], "R$ 7.500 /mes")
+        self.assertEqual(values["source_searches"], "python")
+        self.assertEqual(values["scraped_at"], datetime(2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc))
+        self.assertEqual(schema.typed_values({}, default)["scraped_at"], default)
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class ArrowBatchEncoderTests(unittest.TestCase):
+    def test_dictionaries_grow_across_batches(self) -> None:
+        encoder = schema.ArrowBatchEncoder()
+
+        first = encoder.encode([{"company_name": "ACME"}, {"company_name": "Beta"}])
+        second = encoder.encode([{"company_name": "Beta"}, {"company_name": "Gamma"}, {"company_name": None}])
+
+        self.assertEqual(first.schema.field("company_name").type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(second.column("company_name").dictionary.to_pylist(), ["ACME", "Beta", "Gamma"])
+        self.assertEqual(second.column("company_name").indices.to_pylist(), [1, 2, None])
+
+    def test_batches_can_be_encoded_with_their_own_dictionaries(self) -> None:
+        encoder = schema.ArrowBatchEncoder(cumulative_dictionaries=False)
+
+        encoder.encode([{"company_name": "ACME"}])
+        batch = encoder.encode([{"company_name": "Beta"}, {"company_name": None}, {"company_name": "Beta"}])
+
+        self.assertEqual(batch.schema.field("company_name").type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(batch.column("company_name").dictionary.to_pylist(), ["Beta"])
+        self.assertEqual(batch.column("company_name").indices.to_pylist(), [0, None, 0])
+
+    def test_schema_is_fixed_by_the_first_batch(self) -> None:
+        encoder = schema.ArrowBatchEncoder()
+
+        encoder.encode([{"job_title": "a", "source_searches": "python"}])
+        batch = encoder.encode([{"job_title": "b", "salary_min": 6000, "unexpected": 1}])
+
+        self.assertEqual(batch.schema.names, [*schema.TYPED_COLUMNS, "source_searches"])
+        self.assertEqual(batch.schema.field("salary_min").type, pa.float64())
+        self.assertEqual(batch.schema.field("scraped_at").type, pa.timestamp("ms", tz="UTC"))
+
+    def test_description_hash_takes_the_place_of_the_description(self) -> None:
+        batch = schema.ArrowBatchEncoder().encode([{"job_title": "a", "description_hash": "abc"}])
+
+        names = batch.schema.names
+        self.assertNotIn("job_description", names)
+        self.assertEqual(names.index("description_hash"), schema.TYPED_COLUMNS.index("job_description"))
+        self.assertEqual(batch.column("description_hash").to_pylist(), ["abc"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,15 @@
 import json
+import os
+import tempfile
 import unittest
 from types import SimpleNamespace
 from unittest import mock
 
 from bs4 import BeautifulSoup
 
-from glassdoorcrawler import scraper
+from glassdoorcrawler import scraper, sinks
+from glassdoorcrawler.descriptions import DescriptionStore
+from glassdoorcrawler.records import JobRecord
 
 
 class ScraperParsingTests(unittest.TestCase):
@@ -32,6 +36,28 @@ class ScraperParsingTests(unittest.TestCase):
             ],
         )
 
+    def test_job_links_are_canonicalized_by_listing_id_on_the_search_host(self) -> None:
+        html = """
+        <html>
+          <body>
+            <a href="/job-listing/dev-acme-JV_IC2514646_KO0,3_KE4,8.htm?jl=1009&pos=101&guid=abc">vaga</a>
+            <a href="https://www.glassdoor.com/job-listing/developer-acme-JV_KO0,9.htm?jl=1009&pos=7">mesma vaga</a>
+            <a href="/job-listing/data-acme-JV_IC2514646_KO0,4_KE5,9.htm?jl=2002#top">outra vaga</a>
+          </body>
+        </html>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        links = scraper._extract_job_links_from_search_soup(soup, "https://www.glassdoor.com.br/Vaga/base.htm")
+
+        self.assertEqual(
+            links,
+            [
+                "https://www.glassdoor.com.br/job-listing/dev-acme-JV_IC2514646_KO0,3_KE4,8.htm?jl=1009",
+                "https://www.glassdoor.com.br/job-listing/data-acme-JV_IC2514646_KO0,4_KE5,9.htm?jl=2002",
+            ],
+        )
+
     def test_extract_search_bootstrap_for_pagination_from_next_payload(self) -> None:
         decoded_payload = (
             '{"searchContext":{"absoluteUrl":"https://www.glassdoor.com.br/Vaga/base.htm"},'
@@ -181,6 +207,364 @@ class ScraperParsingTests(unittest.TestCase):
         self.assertEqual(result["salary_max"], 9000)
         self.assertEqual(result["job_description"], "Trabalhar com Python e APIs.")
 
+    @mock.patch("glassdoorcrawler.scraper.time.sleep", return_value=None)
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_jobs_concurrent_matches_sequential_order(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+        _sleep_mock: mock.MagicMock,
+    ) -> None:
+        links = [f"https://www.glassdoor.com/job-listing/{index}.htm" for index in range(8)]
+        iter_page_links_mock.return_value = [links[:5], links[3:]]
+
+        def fake_scrape(url: str, session: object) -> dict:
+            if url.endswith("/2.htm"):
+                raise scraper.requests.RequestException("boom")
+            return {"job_title": url}
+
+        scrap_job_page_mock.side_effect = fake_scrape
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sequential = scraper.crawl_jobs(
+                "https://www.glassdoor.com.br/Vaga/base.htm",
+                output_path=os.path.join(tmp_dir, "seq.xlsx"),
+                delay_seconds=0,
+            )
+            concurrent = scraper.crawl_jobs(
+                "https://www.glassdoor.com.br/Vaga/base.htm",
+                output_path=os.path.join(tmp_dir, "conc.xlsx"),
+                delay_seconds=0,
+                concurrency=4,
+            )
+
+        expected = [url for url in links if not url.endswith("/2.htm")]
+        self.assertEqual(sequential["job_title"].tolist(), expected)
+        self.assertEqual(concurrent["job_title"].tolist(), expected)
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_jobs_can_hold_descriptions_compressed_until_the_dataframe(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        links = [f"https://www.glassdoor.com/job-listing/{index}.htm" for index in range(3)]
+        iter_page_links_mock.return_value = [links]
+        scrap_job_page_mock.side_effect = lambda url, session: JobRecord(job_title=url, job_description=url * 20)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.object(
+            scraper, "_dataframe", wraps=scraper._dataframe
+        ) as dataframe_mock:
+            df = scraper.crawl_jobs(
+                "https://www.glassdoor.com.br/Vaga/base.htm",
+                output_path=os.path.join(tmp_dir, "rows.jsonl"),
+                delay_seconds=0,
+                compress_descriptions=True,
+            )
+            written = list(sinks.iter_jsonl(os.path.join(tmp_dir, "rows.jsonl")))
+
+        held = dataframe_mock.call_args.args[0]
+        self.assertTrue(all(record.description_compressed for record in held))
+        self.assertEqual(df["job_description"].tolist(), [url * 20 for url in links])
+        self.assertEqual([row["job_description"] for row in written], [url * 20 for url in links])
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_jobs_moves_descriptions_to_the_side_store(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        links = [f"https://www.glassdoor.com/job-listing/x.htm?jl={index}" for index in range(3)]
+        iter_page_links_mock.return_value = [links]
+        scrap_job_page_mock.side_effect = lambda url, session: JobRecord(job_title=url, job_description="mesmo texto")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store_path = os.path.join(tmp_dir, "descriptions.sqlite")
+            scraper.crawl_jobs(
+                "https://www.glassdoor.com.br/Vaga/base.htm",
+                output_path=os.path.join(tmp_dir, "rows.jsonl"),
+                delay_seconds=0,
+                return_dataframe=False,
+                description_store=store_path,
+            )
+            rows = list(sinks.iter_jsonl(os.path.join(tmp_dir, "rows.jsonl")))
+            store = DescriptionStore(store_path)
+            stored = [store.get_for_listing(str(index)) for index in range(3)]
+            store.close()
+
+        self.assertTrue(all("job_description" not in row for row in rows))
+        self.assertEqual(len({row["description_hash"] for row in rows}), 1)
+        self.assertEqual(stored, ["mesmo texto"] * 3)
+
+    def test_http_client_takes_a_rate_limit_token_per_request(self) -> None:
+        limiter = mock.MagicMock()
+        client = scraper._HttpClient(rate_limiter=limiter)
+        response = SimpleNamespace(status_code=200, headers={}, text="ok")
+
+        with mock.patch.object(client._requests_session, "request", return_value=response):
+            client.get("https://www.glassdoor.com.br/a", headers={}, timeout=1)
+            client.post("https://www.glassdoor.com.br/b", headers={}, timeout=1, json_payload={})
+
+        self.assertEqual(
+            [call.args[0] for call in limiter.acquire.call_args_list],
+            ["https://www.glassdoor.com.br/a", "https://www.glassdoor.com.br/b"],
+        )
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_jobs_streams_rows_to_sink_without_keeping_them(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        links = [f"https://www.glassdoor.com/job-listing/{index}.htm" for index in range(3)]
+        iter_page_links_mock.return_value = [links]
+        scrap_job_page_mock.side_effect = lambda url, session: {"job_title": url}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "vagas.jsonl")
+            result = scraper.crawl_jobs(
+                "https://www.glassdoor.com.br/Vaga/base.htm",
+                output_path=output_path,
+                delay_seconds=0,
+                batch_size=2,
+                return_dataframe=False,
+            )
+            with open(output_path, encoding="utf-8") as handle:
+                rows = [json.loads(line) for line in handle]
+
+        self.assertIsNone(result)
+        self.assertEqual(rows, [{"job_title": url} for url in links])
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_crawl_searches_deduplicates_across_searches_and_records_sources(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        searches = [f"https://www.glassdoor.com.br/Vaga/{name}.htm" for name in ("bh", "sp", "rj")]
+        shared = "https://www.glassdoor.com/job-listing/shared.htm"
+        links_by_search = {
+            searches[0]: [["https://www.glassdoor.com/job-listing/bh.htm", shared]],
+            searches[1]: [[shared], ["https://www.glassdoor.com/job-listing/sp.htm"]],
+            searches[2]: [[shared]],
+        }
+        iter_page_links_mock.side_effect = lambda num_pages, base_url, **kwargs: iter(links_by_search[base_url])
+        scrap_job_page_mock.side_effect = lambda url, session: {"job_title": url}
+
+        for search_concurrency in (1, 3):
+            with self.subTest(search_concurrency=search_concurrency):
+                scrap_job_page_mock.reset_mock()
+                tmp_dir = tempfile.TemporaryDirectory()
+                self.addCleanup(tmp_dir.cleanup)
+                df = scraper.crawl_searches(
+                    searches + [searches[0]],
+                    output_path=os.path.join(tmp_dir.name, "vagas.jsonl"),
+                    delay_seconds=0,
+                    concurrency=2,
+                    search_concurrency=search_concurrency,
+                )
+
+                scraped = [call.args[0] for call in scrap_job_page_mock.call_args_list]
+                self.assertEqual(sorted(scraped), sorted(set(scraped)))
+                self.assertEqual(len(scraped), 3)
+                sources = dict(zip(df["job_title"], df["source_searches"]))
+                self.assertEqual(set(sources[shared].split(" ")), set(searches))
+                self.assertEqual(sources["https://www.glassdoor.com/job-listing/sp.htm"], searches[1])
+
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    @mock.patch("glassdoorcrawler.scraper.iter_page_links")
+    def test_rows_awaiting_their_sources_are_staged_on_disk(
+        self,
+        iter_page_links_mock: mock.MagicMock,
+        scrap_job_page_mock: mock.MagicMock,
+    ) -> None:
+        searches = [f"https://www.glassdoor.com.br/Vaga/{name}.htm" for name in ("bh", "sp")]
+        links = [f"https://www.glassdoor.com/job-listing/x.htm?jl={index}" for index in range(3)]
+        links_by_search = {searches[0]: [links[:2]], searches[1]: [links[1:]]}
+        iter_page_links_mock.side_effect = lambda num_pages, base_url, **kwargs: iter(links_by_search[base_url])
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        output_path = os.path.join(tmp_dir.name, "vagas.jsonl")
+        staged_before_scrape = []
+
+        def fake_scrape(url: str, session: object) -> dict:
+            pending_path = scraper._pending_path_for(output_path)
+            staged = list(sinks.iter_jsonl(pending_path)) if os.path.exists(pending_path) else []
+            staged_before_scrape.append([entry["url"] for entry in staged])
+            return {"job_title": url}
+
+        scrap_job_page_mock.side_effect = fake_scrape
+        scraper.crawl_searches(searches, output_path=output_path, delay_seconds=0, batch_size=1, return_dataframe=False)
+
+        self.assertEqual(staged_before_scrape, [[], links[:1], links[:2]])
+        self.assertFalse(os.path.exists(scraper._pending_path_for(output_path)))
+        rows = list(sinks.iter_jsonl(output_path))
+        self.assertEqual([row["job_title"] for row in rows], links)
+        self.assertEqual(rows[1]["source_searches"], " ".join(searches))
+
+    @mock.patch("glassdoorcrawler.scraper._get")
+    def test_parse_pool_returns_the_same_records_as_inline_parsing(self, get_mock: mock.MagicMock) -> None:
+        fixtures_dir = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "fixtures")
+        pages = {}
+        for name in ("job_page_initial_state.html", "job_page_jsonld.html"):
+            with open(os.path.join(fixtures_dir, name), encoding="utf-8") as handle:
+                pages[f"https://www.glassdoor.com.br/job-listing/{name}"] = handle.read()
+        get_mock.side_effect = lambda url, session=None: SimpleNamespace(text=pages[url])
+
+        session = scraper._build_session(use_env_proxies=False, parse_workers=2)
+        try:
+            pooled = {url: scraper.scrap_job_page(url, session=session) for url in pages}
+        finally:
+            session.close()
+
+        for url, html in pages.items():
+            self.assertEqual(repr(pooled[url]), repr(scraper._parse_job_page_fast(html)))
+
+    def test_fast_job_page_parser_matches_full_tree_parser(self) -> None:
+        state = json.dumps(
+            {
+                "initialState": {
+                    "jlData": {
+                        "header": {
+                            "jobTitleText": "Dev",
+                            "employer": {"name": "ACME"},
+                            "locationName": "BH",
+                        },
+                        "job": {"description": "<p>desc</p>"},
+                    }
+                }
+            }
+        )
+        posting = json.dumps(
+            [{"@type": "BreadcrumbList"}, {"@type": "JobPosting", "title": "Data", "baseSalary": {"value": {"minValue": 1}}}]
+        )
+        pages = {
+            "no body": f"<html><head><script type='application/ld+json'>{posting}</script></head></html>",
+            "state only in head": f"<html><head><script>window.appCache={state};</script></head><body></body></html>",
+            "commented state": f"<body><!-- <script>window.appCache={state}</script> --><p>x</p></body>",
+            "state after body": f"<html><body><p>x</p></body><script>window.appCache={state}</script></html>",
+            "state and salary nodes": (
+                f"<body><script>window.appCache={state};</script>"
+                "<div class='wrap'><div class='minor cell alignLt'>R$ <b>1.000</b> &amp; mais</div></div>"
+                "<h2 class='salEst other'> R$ 2.000 </h2><div class='minor  cell alignRt'><div>R$ 3.000</div></div>"
+                "</body>"
+            ),
+            "jsonld with partial salary nodes": (
+                f"<body><div class='minor cell alignLt extra'>ignored</div>"
+                f"<script type=\"application/ld+json\">{posting}</script><h2 class='salEst'>R$ 9</h2></body>"
+            ),
+            "salary markup inside a script": (
+                "<body><script>var x=\"<h2 class='salEst'>R$ 1</h2>\"</script><h2 class='salEst'>R$ 2</h2></body>"
+            ),
+            "salary markup inside a comment": (
+                "<body><!-- <div class='minor cell alignLt'>R$ 1</div> --><div class='minor cell alignLt'>R$ 2</div></body>"
+            ),
+            "quoted > in a salary node attribute": (
+                "<body><div data-x='a>b' class='minor cell alignLt'>gt</div><div class='minor cell alignLt'>R$ 3</div></body>"
+            ),
+            "quoted > in a script attribute": (
+                f"<body><script data-x=\"a>b\" type=\"application/ld+json\">{posting}</script></body>"
+            ),
+            "body tag inside a head script": (
+                f"<html><head><script>document.write('<body>');</script><script>window.appCache={state};</script></head>"
+                "<body><h2 class='salEst'>R$ 5</h2></body></html>"
+            ),
+            "closing tag inside a script in the salary node": (
+                "<body><h2 class='salEst'>R$ 7<script>var s='</h2>';</script> mil</h2></body>"
+            ),
+        }
+        fixtures_dir = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "fixtures")
+        for name in ("job_page_initial_state.html", "job_page_jsonld.html"):
+            with open(os.path.join(fixtures_dir, name), encoding="utf-8") as handle:
+                pages[name] = handle.read()
+
+        for name, html in pages.items():
+            with self.subTest(page=name):
+                expected = scraper._parse_job_page(html)
+                actual = scraper._parse_job_page_fast(html)
+                self.assertEqual(
+                    {key: repr(value) for key, value in actual.items()},
+                    {key: repr(value) for key, value in expected.items()},
+                )
+
+    @mock.patch("glassdoorcrawler.scraper._get_links_from_bff_page")
+    @mock.patch("glassdoorcrawler.scraper._get_search_page_links_and_bootstrap")
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    def test_crawl_jobs_scrapes_first_page_links_before_loading_next_page(
+        self,
+        scrap_job_page_mock: mock.MagicMock,
+        get_first_page_mock: mock.MagicMock,
+        get_bff_links_mock: mock.MagicMock,
+    ) -> None:
+        link_1 = "https://www.glassdoor.com/job-listing/1.htm"
+        link_2 = "https://www.glassdoor.com/job-listing/2.htm"
+        events: list[str] = []
+
+        def first_page(url: str, session: object) -> tuple:
+            events.append("search page 1")
+            return [link_1], {"pagination_cursors": {2: "cursor-page-2"}}
+
+        def bff_page(page_number: int, bootstrap: dict, session: object) -> list[str]:
+            events.append(f"search page {page_number}")
+            return [link_1, link_2]
+
+        def scrape(url: str, session: object) -> dict:
+            events.append(url)
+            return {"job_title": url}
+
+        get_first_page_mock.side_effect = first_page
+        get_bff_links_mock.side_effect = bff_page
+        scrap_job_page_mock.side_effect = scrape
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = scraper.crawl_jobs(
+                "https://www.glassdoor.com.br/Vaga/base.htm",
+                num_pages=2,
+                output_path=os.path.join(tmp_dir, "vagas.jsonl"),
+                delay_seconds=0,
+            )
+
+        self.assertEqual(events, ["search page 1", link_1, "search page 2", link_2])
+        self.assertEqual(result["job_title"].tolist(), [link_1, link_2])
+
+    @mock.patch("glassdoorcrawler.scraper.time.sleep", return_value=None)
+    @mock.patch("glassdoorcrawler.scraper._get_links_from_bff_page")
+    @mock.patch("glassdoorcrawler.scraper._get_search_page_links_and_bootstrap")
+    def test_get_all_links_parallel_bff_pages_keep_order_and_stop_rule(
+        self,
+        get_first_page_mock: mock.MagicMock,
+        get_bff_links_mock: mock.MagicMock,
+        _sleep_mock: mock.MagicMock,
+    ) -> None:
+        links = {
+            page: [f"https://www.glassdoor.com/job-listing/{page}-{index}.htm" for index in range(2)]
+            for page in range(1, 6)
+        }
+        links[4] = links[2]  # page 4 repeats page 2: pagination stops there
+        get_first_page_mock.return_value = (
+            links[1],
+            {"pagination_cursors": {page: f"cursor-page-{page}" for page in range(2, 6)}},
+        )
+        get_bff_links_mock.side_effect = lambda page_number, bootstrap, session: links[page_number]
+
+        all_links = scraper.get_all_links(
+            num_pages=5,
+            base_url="https://www.glassdoor.com.br/Vaga/base.htm",
+            delay_seconds=0,
+            session=object(),
+            page_concurrency=4,
+        )
+
+        self.assertEqual(all_links, [links[1], links[2], links[3]])
+        requested_pages = {call.kwargs["page_number"] for call in get_bff_links_mock.call_args_list}
+        # Page 5 was prefetched concurrently; it may be cancelled once page 4 stops pagination.
+        self.assertTrue({2, 3, 4} <= requested_pages <= {2, 3, 4, 5})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from glassdoorcrawler import schema, sinks
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - optional dependency
+    openpyxl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+
+class SinkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._tmp_dir.name, name)
+
+    def test_jsonl_sink_flushes_each_full_batch_and_replaces_nan(self) -> None:
+        path = self._path("rows.jsonl")
+        sink = sinks.open_sink(path, batch_size=2)
+
+        sink.write({"job_title": "a", "salary_min": float("nan")})
+        self.assertEqual(os.path.getsize(path), 0)
+        sink.write({"job_title": "b", "salary_min": 10})
+        self.assertEqual(sink.rows_written, 2)
+        sink.write({"job_title": "c", "salary_min": 20})
+        sink.close()
+
+        self.assertEqual(
+            list(sinks.iter_jsonl(path)),
+            [
+                {"job_title": "a", "salary_min": None},
+                {"job_title": "b", "salary_min": 10},
+                {"job_title": "c", "salary_min": 20},
+            ],
+        )
+
+    def test_iter_jsonl_skips_truncated_trailing_line(self) -> None:
+        path = self._path("rows.jsonl")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps({"job_title": "a"}) + "\n" + '{"job_ti')
+
+        self.assertEqual(list(sinks.iter_jsonl(path)), [{"job_title": "a"}])
+
+    def test_csv_sink_writes_header_from_first_row(self) -> None:
+        path = self._path("rows.csv")
+        with sinks.open_sink(path, batch_size=1) as sink:
+            sink.write({"job_title": "a", "company_name": "ACME"})
+            sink.write({"job_title": "b", "company_name": None})
+
+        with open(path, encoding="utf-8", newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual(rows, [{"job_title": "a", "company_name": "ACME"}, {"job_title": "b", "company_name": ""}])
+
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_parquet_sink_gathers_batches_into_row_groups(self) -> None:
+        path = self._path("rows.parquet")
+        with sinks.ParquetSink(path, batch_size=2, row_group_size=4) as sink:
+            for index in range(5):
+                sink.write({"job_title": f"job {index}", "company_name": f"company {index}"})
+
+        parquet_file = pq.ParquetFile(path)
+        self.assertEqual(
+            [parquet_file.metadata.row_group(index).num_rows for index in range(parquet_file.num_row_groups)], [4, 1]
+        )
+        self.assertIn("RLE_DICTIONARY", parquet_file.metadata.row_group(0).column(1).encodings)
+        table = parquet_file.read()
+        self.assertEqual(table.column("company_name").to_pylist(), [f"company {index}" for index in range(5)])
+
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_parquet_sink_uses_the_typed_schema_across_mixed_batches(self) -> None:
+        path = self._path("rows.parquet")
+        with sinks.open_sink(path, batch_size=1) as sink:
+            sink.write({"job_title": "a", "company_name": "ACME", "salary_min": "R$ 5.000", "salary_max": None})
+            sink.write({"job_title": "b", "company_name": "ACME", "salary_min": 6000, "salary_max": 11000})
+
+        table = pq.read_table(path)
+        self.assertEqual(table.schema.field("salary_min").type, pa.float64())
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("company_name").type))
+        self.assertEqual(table.column("salary_min").to_pylist(), [5000.0, 6000.0])
+        self.assertEqual(table.column("salary_currency").to_pylist(), ["BRL", None])
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_sink_writes_an_ipc_file_with_one_batch_per_flush(self) -> None:
+        path = self._path("rows.arrow")
+        with sinks.open_sink(path, batch_size=2) as sink:
+            for index in range(5):
+                sink.write({"job_title": f"job {index}", "company_name": f"company {index % 3}"})
+
+        reader = pa.ipc.open_file(path)
+        self.assertEqual(reader.num_record_batches, 3)
+        table = reader.read_all()
+        self.assertEqual(table.column("company_name").to_pylist(), [f"company {index % 3}" for index in range(5)])
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_rows_count_as_persisted_once_the_file_can_be_read(self) -> None:
+        jsonl_sink = sinks.open_sink(self._path("rows.jsonl"), batch_size=1)
+        arrow_sink = sinks.open_sink(self._path("rows.arrow"), batch_size=1)
+        for sink in (jsonl_sink, arrow_sink):
+            sink.write({"job_title": "a"})
+
+        self.assertEqual((jsonl_sink.rows_persisted, arrow_sink.rows_persisted), (1, 0))
+        arrow_sink.close()
+        jsonl_sink.close()
+        self.assertEqual(arrow_sink.rows_persisted, 1)
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_empty_typed_output_still_has_the_columns(self) -> None:
+        path = self._path("rows.feather")
+        sinks.open_sink(path).close()
+
+        self.assertEqual(pa.ipc.open_file(path).schema.names, list(schema.TYPED_COLUMNS))
+
+    @unittest.skipIf(openpyxl is None, "openpyxl is not installed")
+    def test_excel_sink_starts_a_new_sheet_at_the_row_limit(self) -> None:
+        path = self._path("rows.xlsx")
+        with sinks.ExcelSink(path, batch_size=2, max_rows=3) as sink:
+            for index in range(5):
+                sink.write({"job_title": f"job {index}"})
+
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        self.assertEqual(workbook.sheetnames, ["Sheet1", "Sheet2", "Sheet3"])
+        self.assertEqual(
+            [list(sheet.values) for sheet in workbook.worksheets],
+            [
+                [("job_title",), ("job 0",), ("job 1",)],
+                [("job_title",), ("job 2",), ("job 3",)],
+                [("job_title",), ("job 4",)],
+            ],
+        )
+
+    @unittest.skipIf(openpyxl is None, "openpyxl is not installed")
+    def test_excel_sink_truncates_long_cells_and_drops_time_zones(self) -> None:
+        path = self._path("rows.xlsx")
+        scraped_at = datetime(2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+        with sinks.ExcelSink(path) as sink:
+            sink.write({"job_description": "x" * (sinks.EXCEL_MAX_CELL_CHARS + 10) + "\x01", "scraped_at": scraped_at})
+
+        self.assertEqual(sink.cells_truncated, 1)
+        description, stamp = list(openpyxl.load_workbook(path, read_only=True).active.values)[1]
+        self.assertEqual(len(description), sinks.EXCEL_MAX_CELL_CHARS)
+        self.assertEqual(stamp, datetime(2026, 3, 4, 5, 6, 7))
+
+    @unittest.skipIf(openpyxl is None or pq is None, "openpyxl or pyarrow is not installed")
+    def test_convert_to_excel_streams_jsonl_and_parquet(self) -> None:
+        rows = [{"job_title": "a", "company_name": "ACME"}, {"job_title": "b", "company_name": None}]
+        for name in ("rows.jsonl", "rows.parquet"):
+            with self.subTest(source=name):
+                source = self._path(name)
+                with sinks.open_sink(source) as sink:
+                    for row in rows:
+                        sink.write(row)
+                target = self._path(name + ".xlsx")
+
+                self.assertEqual(sinks.convert_to_excel(source, target), 2)
+                values = list(openpyxl.load_workbook(target).active.values)
+                self.assertEqual(values[0][:2], ("job_title", "company_name"))
+                self.assertEqual([value[:2] for value in values[1:]], [("a", "ACME"), ("b", None)])
+
+    def test_open_sink_rejects_unknown_extension(self) -> None:
+        with self.assertRaises(ValueError):
+            sinks.open_sink(self._path("rows.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+import requests
+
+from benchmarks.standin_server import StandinConfig, StandinServer
+from glassdoorcrawler import scraper
+
+BASE_URL = "https://www.glassdoor.com.br/Vaga/belo-horizonte-desenvolvedor-vagas-SRCH_IL.0,14_IC2514646_KO15,28.htm"
+
+
+class StandinServerTests(unittest.TestCase):
+    def test_crawl_jobs_collects_every_listing_from_the_standin_server(self) -> None:
+        with StandinServer(StandinConfig(listings=75)) as server, tempfile.TemporaryDirectory() as tmp_dir:
+            df = scraper.crawl_jobs(
+                BASE_URL,
+                num_pages=3,
+                output_path=os.path.join(tmp_dir, "vagas.jsonl"),
+                delay_seconds=0,
+                use_env_proxies=False,
+                concurrency=4,
+                origin=server.origin,
+            )
+            stats = dict(server.stats)
+
+        self.assertEqual(len(df), 75)
+        self.assertEqual((stats["search"], stats["bff"], stats["job"]), (1, 2, 75))
+
+    def test_injected_faults_answer_429_with_retry_after_and_cloudflare_403(self) -> None:
+        for config, status in ((StandinConfig(p429=1.0, retry_after=7), 429), (StandinConfig(p403=1.0), 403)):
+            with self.subTest(status=status), StandinServer(config) as server:
+                session = requests.Session()
+                session.trust_env = False
+                response = session.get(server.origin + "/Vaga/base.htm", timeout=5)
+
+                self.assertEqual(response.status_code, status)
+                if status == 429:
+                    self.assertEqual(response.headers["Retry-After"], "7")
+                else:
+                    self.assertTrue(scraper._HttpClient(use_env_proxies=False)._is_cloudflare_security_page(response))
+
+
+if __name__ == "__main__":
+    unittest.main()
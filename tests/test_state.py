@@ -0,0 +1,221 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from glassdoorcrawler import scraper
+from glassdoorcrawler.state import CrawlState, PaginationStrategyStore, TransportStore
+
+BASE_URL = "https://www.glassdoor.com.br/Vaga/base.htm"
+
+
+def _link(index: int) -> str:
+    return f"https://www.glassdoor.com/job-listing/{index}.htm"
+
+
+class CrawlStateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+        self.state_dir = os.path.join(self.tmp_dir, "state")
+
+    def test_state_round_trips_pages_cursors_and_completed_rows(self) -> None:
+        state = CrawlState(self.state_dir, BASE_URL, 3)
+        state.record_page(1, [_link(1)], bootstrap={"pagination_cursors": {2: "c2", 3: "c3"}})
+        state.record_page(2, [_link(2)])
+        state.record_row(_link(1), {"job_title": "one"})
+        state.close()
+        with open(os.path.join(state.directory, "rows.jsonl"), "a", encoding="utf-8") as handle:
+            handle.write('{"url": "trunc')
+
+        reloaded = CrawlState(self.state_dir, BASE_URL, 3)
+
+        self.assertEqual(reloaded.recorded_pages(), [[_link(1)], [_link(2)]])
+        self.assertEqual(reloaded.bootstrap, {"pagination_cursors": {2: "c2", 3: "c3"}})
+        self.assertFalse(reloaded.links_complete)
+        self.assertEqual(reloaded.completed_urls, {_link(1)})
+        self.assertEqual(list(reloaded.iter_rows()), [{"job_title": "one"}])
+        self.assertNotEqual(CrawlState(self.state_dir, BASE_URL, 4).directory, reloaded.directory)
+
+    @mock.patch("glassdoorcrawler.scraper._get_links_from_bff_page")
+    @mock.patch("glassdoorcrawler.scraper._get_search_page_links_and_bootstrap")
+    @mock.patch("glassdoorcrawler.scraper.scrap_job_page")
+    def test_crawl_resumes_without_refetching_completed_work(
+        self,
+        scrap_job_page_mock: mock.MagicMock,
+        get_first_page_mock: mock.MagicMock,
+        get_bff_links_mock: mock.MagicMock,
+    ) -> None:
+        get_first_page_mock.return_value = ([_link(1), _link(2)], {"pagination_cursors": {2: "cursor-page-2"}})
+        get_bff_links_mock.return_value = [_link(3), _link(4)]
+        output_path = os.path.join(self.tmp_dir, "vagas.jsonl")
+
+        def crash_on_third(url: str, session: object) -> dict:
+            if url == _link(3):
+                raise KeyboardInterrupt
+            return {"job_title": url}
+
+        scrap_job_page_mock.side_effect = crash_on_third
+        with self.assertRaises(KeyboardInterrupt):
+            scraper.crawl_jobs(BASE_URL, num_pages=2, output_path=output_path, delay_seconds=0, state_dir=self.state_dir)
+
+        scrap_job_page_mock.reset_mock()
+        scrap_job_page_mock.side_effect = lambda url, session: {"job_title": url}
+        scraper.crawl_jobs(BASE_URL, num_pages=2, output_path=output_path, delay_seconds=0, state_dir=self.state_dir)
+
+        self.assertEqual(get_first_page_mock.call_count, 1)
+        self.assertEqual(get_bff_links_mock.call_count, 1)
+        self.assertEqual([call.args[0] for call in scrap_job_page_mock.call_args_list], [_link(3), _link(4)])
+        with open(output_path, encoding="utf-8") as handle:
+            rows = [json.loads(line) for line in handle]
+        self.assertEqual(rows, [{"job_title": _link(index)} for index in range(1, 5)])
+        # Only the checkpoint is cleared; the transport state outlives the crawl.
+        self.assertEqual(os.listdir(self.state_dir), ["transport.json"])
+
+
+class PaginationStrategyStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "pagination.json")
+
+    @mock.patch("glassdoorcrawler.scraper.get_position_links")
+    @mock.patch("glassdoorcrawler.scraper._get_search_page_links_and_bootstrap")
+    def test_learned_scheme_is_tried_first_on_later_runs(
+        self,
+        get_first_page_mock: mock.MagicMock,
+        get_position_links_mock: mock.MagicMock,
+    ) -> None:
+        get_first_page_mock.return_value = ([_link(1)], None)
+
+        def links_for_candidate(url: str, session: object) -> list[str]:
+            if url.endswith("_IP2.htm"):
+                return [_link(2)]
+            if url.endswith("_IP3.htm"):
+                return [_link(3)]
+            return [_link(1)]
+
+        get_position_links_mock.side_effect = links_for_candidate
+
+        first_run = scraper.get_all_links(3, BASE_URL, delay_seconds=0, strategy_store=PaginationStrategyStore(self.path))
+        probes_first_run = get_position_links_mock.call_count
+        get_position_links_mock.reset_mock()
+        second_run = scraper.get_all_links(3, BASE_URL, delay_seconds=0, strategy_store=PaginationStrategyStore(self.path))
+
+        self.assertEqual(first_run, [[_link(1)], [_link(2)], [_link(3)]])
+        self.assertEqual(second_run, first_run)
+        self.assertEqual(probes_first_run, 4)  # page 2 probes ?page, ?p, _IP; page 3 hits _IP first
+        self.assertEqual(
+            [call.args[0] for call in get_position_links_mock.call_args_list],
+            [BASE_URL[:-4] + "_IP2.htm", BASE_URL[:-4] + "_IP3.htm"],
+        )
+
+    @mock.patch("glassdoorcrawler.scraper.get_position_links")
+    @mock.patch("glassdoorcrawler.scraper._get_search_page_links_and_bootstrap")
+    def test_learned_scheme_is_kept_when_a_pinned_listing_repeats(
+        self,
+        get_first_page_mock: mock.MagicMock,
+        get_position_links_mock: mock.MagicMock,
+    ) -> None:
+        pinned = _link(0)
+        get_first_page_mock.return_value = ([pinned, _link(1)], None)
+
+        def links_for_candidate(url: str, session: object) -> list[str]:
+            if url.endswith("_IP2.htm"):
+                return [pinned, _link(2)]
+            if url.endswith("_IP3.htm"):
+                return [pinned, _link(3)]
+            return [pinned, _link(1)]
+
+        get_position_links_mock.side_effect = links_for_candidate
+        store = PaginationStrategyStore(self.path)
+        store.remember(BASE_URL, "path_ip")
+
+        links = scraper.get_all_links(3, BASE_URL, delay_seconds=0, strategy_store=store)
+
+        self.assertEqual(links, [[pinned, _link(1)], [pinned, _link(2)], [pinned, _link(3)]])
+        self.assertEqual(
+            [call.args[0] for call in get_position_links_mock.call_args_list],
+            [BASE_URL[:-4] + "_IP2.htm", BASE_URL[:-4] + "_IP3.htm"],
+        )
+
+    def test_scheme_learned_for_one_search_applies_to_the_same_url_pattern(self) -> None:
+        store = PaginationStrategyStore(self.path)
+        store.remember(BASE_URL, "path_p")
+
+        reloaded = PaginationStrategyStore(self.path)
+
+        self.assertEqual(reloaded.lookup("https://www.glassdoor.com.br/Vaga/outra-busca.htm"), "path_p")
+        self.assertIsNone(reloaded.lookup("https://www.glassdoor.com/Job/base.htm"))
+
+
+class TransportStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "state", "transport.json")
+        self.now = 1000.0
+
+    def _store(self) -> TransportStore:
+        return TransportStore(self.path, ttl_seconds=60, clock=lambda: self.now)
+
+    def test_profiles_and_cookies_round_trip_until_they_expire(self) -> None:
+        cookies = [
+            {"name": "cf_clearance", "value": "abc", "domain": ".glassdoor.com.br", "path": "/", "expires": None},
+            {"name": "old", "value": "x", "domain": ".glassdoor.com.br", "path": "/", "expires": 1010.0},
+        ]
+        self._store().save({"www.glassdoor.com.br": "chrome"}, cookies)
+
+        self.now = 1020.0
+        reloaded = self._store()
+        self.assertEqual(reloaded.profiles, {"www.glassdoor.com.br": "chrome"})
+        self.assertEqual([cookie["name"] for cookie in reloaded.cookies], ["cf_clearance"])
+
+        self.now = 1061.0
+        expired = self._store()
+        self.assertEqual(expired.profiles, {})
+        self.assertEqual(expired.cookies, [])
+
+    def test_resaving_unchanged_entries_keeps_their_original_expiry(self) -> None:
+        clearance = {"name": "cf_clearance", "value": "abc", "domain": ".glassdoor.com.br", "path": "/", "expires": None}
+        self._store().save({"www.glassdoor.com.br": "chrome", "www.glassdoor.com": "chrome"}, [clearance])
+
+        self.now = 1030.0
+        self._store().save({"www.glassdoor.com.br": "chrome", "www.glassdoor.com": "safari"}, [clearance])
+
+        self.now = 1061.0
+        reloaded = self._store()
+        self.assertEqual(reloaded.profiles, {"www.glassdoor.com": "safari"})
+        self.assertEqual(reloaded.cookies, [])
+
+        self.now = 1080.0
+        renewed_session = {"name": "session", "value": "s1", "domain": ".glassdoor.com", "path": "/", "expires": None}
+        self._store().save({}, [renewed_session])
+        self.now = 1130.0
+        self.assertEqual(self._store().cookies, [renewed_session])
+
+    def test_client_starts_with_saved_profile_and_saves_cookies_on_close(self) -> None:
+        self._store().save(
+            {"www.glassdoor.com.br": "chrome"},
+            [{"name": "cf_clearance", "value": "abc", "domain": "www.glassdoor.com.br", "path": "/", "expires": None}],
+        )
+        client = scraper._HttpClient(use_env_proxies=False, transport_store=self._store())
+        self.assertEqual(client._requests_session.cookies.get("cf_clearance"), "abc")
+
+        response = mock.Mock(status_code=200, text="<html></html>")
+        with mock.patch.object(client, "_request_with_curl", return_value=response) as curl_mock:
+            client.get("https://www.glassdoor.com.br/Vaga/base.htm", headers={}, timeout=5)
+        curl_mock.assert_called_once()
+
+        client._requests_session.cookies.set("session", "s1", domain="www.glassdoor.com.br", path="/")
+        client.close()
+
+        reloaded = self._store()
+        self.assertEqual(reloaded.profiles, {"www.glassdoor.com.br": "chrome"})
+        self.assertEqual(sorted(cookie["name"] for cookie in reloaded.cookies), ["cf_clearance", "session"])
+
+
+if __name__ == "__main__":
+    unittest.main()